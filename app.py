@@ -1,15 +1,22 @@
 import os
 import tempfile
 import logging
-import zipfile
 import shutil
 import asyncio
 import aiohttp
 import traceback
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
+from flask import Flask, Response, render_template, request, jsonify, send_file, flash, redirect, url_for
 from werkzeug.utils import secure_filename
 from werkzeug.middleware.proxy_fix import ProxyFix
 from dotenv import load_dotenv
+from utils.worker_pool import run_in_pool, generate_presentation, render_thumbnails
+from utils.pdf_converter import read_slide_geometry
+from utils.archive_ingest import extract_images
+from utils.streaming_upload import StreamingUploadRequest, save_file_storage, hash_file
+from utils.deck_stats import DeckStats, read_deck_stats, write_deck_stats
+from utils.pdf_cache import pdf_cache_key, cached_pdf_path, deck_hash
+from utils.thumbnails import get_thumbnail_cache, cached_thumbnail_path, missing_thumbnails
+from utils.pdf_download import PdfDownload
 
 # Configure logging for serverless environment FIRST
 logging.basicConfig(
@@ -21,6 +28,8 @@ logger = logging.getLogger(__name__)
 # Global variables for storage systems
 unified_storage = None
 PresentationGenerator = None
+job_queue = None
+result_cache = None
 
 def validate_environment():
     """Validate and log environment variables for debugging."""
@@ -56,7 +65,7 @@ def validate_environment():
 
 def safe_initialize_storage():
     """Safely initialize storage systems with error handling."""
-    global unified_storage, PresentationGenerator
+    global unified_storage, PresentationGenerator, job_queue, result_cache
     
     try:
         logger.info("=== Storage Initialization ===")
@@ -87,6 +96,26 @@ def safe_initialize_storage():
             logger.error(f"Presentation generator traceback: {traceback.format_exc()}")
             PresentationGenerator = None
         
+        # Initialize background job queue
+        try:
+            from utils.job_queue import initialize_job_queue
+            job_queue = initialize_job_queue()
+            logger.info("Job queue initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize job queue: {str(e)}")
+            logger.error(f"Job queue traceback: {traceback.format_exc()}")
+            job_queue = None
+        
+        # Initialize generation result cache
+        try:
+            from utils.result_cache import initialize_result_cache
+            result_cache = initialize_result_cache()
+            logger.info("Result cache initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize result cache: {str(e)}")
+            logger.error(f"Result cache traceback: {traceback.format_exc()}")
+            result_cache = None
+        
         return True
     except Exception as e:
         logger.error(f"Critical error during storage initialization: {str(e)}")
@@ -105,6 +134,7 @@ except Exception as e:
 
 # Create Flask app
 app = Flask(__name__)
+app.request_class = StreamingUploadRequest
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key-change-in-production")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
@@ -112,6 +142,7 @@ app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 UPLOAD_FOLDER = os.path.join(os.getcwd(), 'uploads')
 OUTPUT_FOLDER = os.path.join(os.getcwd(), 'outputs')
 MAX_CONTENT_LENGTH = 200 * 1024 * 1024  # 200MB max file size
+MAX_UPLOAD_CHUNKS = 10000  # Upper bound on chunks per resumable upload
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'zip'}
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
@@ -127,7 +158,7 @@ os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 def before_request():
     """Set proper headers for API requests."""
     # Define all API routes that should return JSON
-    api_routes = ['/upload', '/health', '/startup-status', '/fallback-info', '/convert-to-pdf', '/download', '/local-file', '/test-upload-flow']
+    api_routes = ['/upload', '/jobs', '/health', '/startup-status', '/fallback-info', '/convert-to-pdf', '/download', '/local-file', '/test-upload-flow']
     
     # Check if current path is an API route
     is_api_route = any(request.path.startswith(route) for route in api_routes)
@@ -145,7 +176,7 @@ def before_request():
 def after_request(response):
     """Set proper headers for all responses."""
     # Define all API routes that should return JSON
-    api_routes = ['/upload', '/health', '/startup-status', '/fallback-info', '/convert-to-pdf', '/download', '/local-file', '/test-upload-flow']
+    api_routes = ['/upload', '/jobs', '/health', '/startup-status', '/fallback-info', '/convert-to-pdf', '/download', '/local-file', '/test-upload-flow']
     
     # Check if current path is an API route
     is_api_route = any(request.path.startswith(route) for route in api_routes)
@@ -153,7 +184,8 @@ def after_request(response):
     if is_api_route:
         # Force JSON content type for all API routes except file downloads
         if not request.path.startswith('/download') and not request.path.startswith('/local-file'):
-            if not response.content_type.startswith('application/json'):
+            # PDF downloads from /convert-to-pdf keep their own content type
+            if response.mimetype != 'application/pdf' and not response.content_type.startswith('application/json'):
                 response.content_type = 'application/json; charset=utf-8'
                 logger.warning(f"FORCED content type to JSON for API route: {request.path} (was: {response.content_type})")
         
@@ -169,7 +201,7 @@ def after_request(response):
 @app.before_request
 def force_json_for_api():
     """Additional middleware to force JSON responses for API routes."""
-    api_routes = ['/upload', '/health', '/startup-status', '/fallback-info', '/convert-to-pdf', '/download', '/local-file', '/test-upload-flow']
+    api_routes = ['/upload', '/jobs', '/health', '/startup-status', '/fallback-info', '/convert-to-pdf', '/download', '/local-file', '/test-upload-flow']
     is_api_route = any(request.path.startswith(route) for route in api_routes)
     
     if is_api_route:
@@ -243,8 +275,7 @@ def extract_folder_structure(zip_path, extract_to):
     try:
         folder_structure = {}
         
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
+        extract_images(zip_path, extract_to)
             
         # Walk through extracted files
         for root, dirs, files in os.walk(extract_to):
@@ -328,7 +359,9 @@ def health_check():
         # Check component status
         components_status = {
             'unified_storage': unified_storage is not None,
-            'presentation_generator': PresentationGenerator is not None
+            'presentation_generator': PresentationGenerator is not None,
+            'job_queue': job_queue is not None,
+            'result_cache': result_cache is not None
         }
         
         # Overall health status
@@ -675,7 +708,7 @@ def debug_info():
 # Blob upload URL route removed - using direct file uploads for VPS deployment
 
 
-async def process_blob_file(file_identifier, filename):
+async def process_blob_file(file_identifier, filename, annotation_option='with_annos'):
     """Download ZIP file from storage and process it to PPTX."""
     temp_dir = None
     try:
@@ -688,45 +721,34 @@ async def process_blob_file(file_identifier, filename):
             logger.error(f"PresentationGenerator not available for processing: {filename}")
             return {'success': False, 'message': 'Presentation generator not available'}
         
-        import aiohttp
         import tempfile
-        import zipfile
         import shutil
         
         logger.info(f"Starting file processing for: {filename}")
         
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp()
-        zip_path = os.path.join(temp_dir, filename)
-        
-        logger.info(f"Downloading file from storage: {file_identifier}")
-        
-        # Download file using unified storage
-        file_data = await unified_storage.download_file(file_identifier)
-        if file_data is None:
-            logger.error(f"Failed to download file from storage: {file_identifier}")
+        # Read the archive in place from storage rather than copying it
+        zip_path = unified_storage.get_upload_file_path(file_identifier)
+        if zip_path is None:
+            logger.error(f"File not found in storage: {file_identifier}")
             return {'success': False, 'message': 'Failed to download file from storage'}
         
-        # Save downloaded data to temporary file
-        with open(zip_path, 'wb') as f:
-            f.write(file_data)
-        logger.info(f"Successfully downloaded and saved file: {filename}")
+        # Create temporary directory
+        temp_dir = tempfile.mkdtemp()
         
-        logger.info(f"Extracting ZIP file to: {temp_dir}")
+        logger.info(f"Streaming ZIP members to: {temp_dir}")
         
-        # Extract ZIP file
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
+        # Extract image members straight from the stored upload
+        extract_images(zip_path, temp_dir)
         
         logger.info("Starting PPTX generation")
         
-        # Generate presentation
-        generator = PresentationGenerator()
+        # Generate presentation in the generation worker pool
         original_filename = os.path.splitext(filename)[0]
         
-        ppt_filename = generator.generate_from_folder(
+        ppt_filename, stats = run_in_pool(
+            generate_presentation,
             temp_dir,
-            annotation_option='with_annos',
+            annotation_option=annotation_option,
             implement_video_frames=False,
             original_filename=original_filename
         )
@@ -744,6 +766,9 @@ async def process_blob_file(file_identifier, filename):
             # Save to local outputs directory
             saved_path = unified_storage.save_output_file(ppt_data, ppt_basename)
             if saved_path:
+                # Rewriting the deck changes its mtime, so the stats sidecar is re-stamped for the saved copy
+                write_deck_stats(saved_path, stats)
+                start_thumbnails(saved_path)
                 ppt_storage_url = f"/local-file/{ppt_basename}"
                 logger.info(f"PPTX saved locally: {saved_path}")
             else:
@@ -751,14 +776,6 @@ async def process_blob_file(file_identifier, filename):
         except Exception as e:
             logger.error(f"Error saving PPTX to storage: {str(e)}")
         
-        # Get presentation info
-        from pptx import Presentation
-        prs = Presentation(ppt_filename)
-        slide_count = len(prs.slides)
-        
-        folder_structure = generator._organize_folder_structure(temp_dir)
-        folder_count = len(folder_structure)
-        
         # Clean up temp directory
         shutil.rmtree(temp_dir)
         
@@ -766,8 +783,9 @@ async def process_blob_file(file_identifier, filename):
             'success': True,
             'ppt_file': os.path.basename(ppt_filename),
             'ppt_storage_url': ppt_storage_url,
-            'folder_count': folder_count,
-            'slide_count': slide_count
+            'folder_count': stats.folder_count,
+            'slide_count': stats.slide_count,
+            'stats': stats.to_dict()
         }
         
     except Exception as e:
@@ -779,7 +797,7 @@ async def process_blob_file(file_identifier, filename):
         return {'success': False, 'message': str(e)}
 
 
-async def process_single_image_blob(file_identifier, filename):
+async def process_single_image_blob(file_identifier, filename, annotation_option='with_annos'):
     """Download single image from storage and convert to PPTX."""
     temp_dir = None
     try:
@@ -792,28 +810,18 @@ async def process_single_image_blob(file_identifier, filename):
             logger.error(f"PresentationGenerator not available for processing: {filename}")
             return {'success': False, 'message': 'Presentation generator not available'}
         
-        import aiohttp
         import tempfile
-        from PIL import Image
         
         logger.info(f"Starting single image processing for: {filename}")
         
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp()
-        image_path = os.path.join(temp_dir, filename)
-        
-        logger.info(f"Downloading image from storage: {file_identifier}")
-        
-        # Download image using unified storage
-        file_data = await unified_storage.download_file(file_identifier)
-        if file_data is None:
-            logger.error(f"Failed to download image from storage: {file_identifier}")
+        # Read the image in place from storage rather than loading it into memory
+        source_path = unified_storage.get_upload_file_path(file_identifier)
+        if source_path is None:
+            logger.error(f"Image not found in storage: {file_identifier}")
             return {'success': False, 'message': 'Failed to download image from storage'}
         
-        # Save downloaded data to temporary file
-        with open(image_path, 'wb') as f:
-            f.write(file_data)
-        logger.info(f"Successfully downloaded and saved image: {filename}")
+        # Create temporary directory
+        temp_dir = tempfile.mkdtemp()
         
         # Create a simple folder structure for single image
         image_folder = os.path.join(temp_dir, 'images')
@@ -821,19 +829,19 @@ async def process_single_image_blob(file_identifier, filename):
         
         logger.info(f"Organizing image into folder structure")
         
-        # Move image to images folder
+        # Copy image into the images folder
         new_image_path = os.path.join(image_folder, filename)
-        shutil.move(image_path, new_image_path)
+        shutil.copyfile(source_path, new_image_path)
         
         logger.info("Starting PPTX generation for single image")
         
-        # Generate presentation
-        generator = PresentationGenerator()
+        # Generate presentation in the generation worker pool
         original_filename = os.path.splitext(filename)[0]
         
-        ppt_filename = generator.generate_from_folder(
+        ppt_filename, stats = run_in_pool(
+            generate_presentation,
             temp_dir,
-            annotation_option='with_annos',
+            annotation_option=annotation_option,
             implement_video_frames=False,
             original_filename=original_filename
         )
@@ -851,6 +859,9 @@ async def process_single_image_blob(file_identifier, filename):
             # Save to local outputs directory
             saved_path = unified_storage.save_output_file(ppt_data, ppt_basename)
             if saved_path:
+                # Rewriting the deck changes its mtime, so the stats sidecar is re-stamped for the saved copy
+                write_deck_stats(saved_path, stats)
+                start_thumbnails(saved_path)
                 ppt_storage_url = f"/local-file/{ppt_basename}"
                 logger.info(f"PPTX saved locally: {saved_path}")
             else:
@@ -865,7 +876,8 @@ async def process_single_image_blob(file_identifier, filename):
             'success': True,
             'ppt_file': os.path.basename(ppt_filename),
             'ppt_storage_url': ppt_storage_url,
-            'slide_count': 1
+            'slide_count': stats.slide_count,
+            'stats': stats.to_dict()
         }
         
     except Exception as e:
@@ -877,88 +889,255 @@ async def process_single_image_blob(file_identifier, filename):
         return {'success': False, 'message': str(e)}
 
 
+def process_completed_upload(file_identifier, filename, annotation_option='with_annos'):
+    """Convert a file that finished uploading to storage and attach result URLs."""
+    if filename.lower().endswith('.zip'):
+        # Download file from storage and process
+        result = run_async(process_blob_file(file_identifier, filename, annotation_option))
+        message = 'File processed successfully'
+    else:
+        # Single image file - convert to PPTX
+        result = run_async(process_single_image_blob(file_identifier, filename, annotation_option))
+        message = 'Image processed successfully'
+    
+    if result and result.get('success'):
+        storage_url = result.get('ppt_storage_url', '')
+        redirect_url = f'/result/{result["ppt_file"]}'
+        if storage_url and not storage_url.startswith('/local-file/'):
+            redirect_url += f'?blob_url={storage_url}'
+        
+        result.update({
+            'message': message,
+            'redirect_url': redirect_url,
+            'result_url': redirect_url
+        })
+    
+    return result or {'success': False, 'message': 'Processing failed'}
+
+
+def job_accepted_payload(job_id, filename):
+    """Build the response body returned when a job has been queued."""
+    return {
+        'success': True,
+        'message': f'File {filename} uploaded and queued for processing',
+        'filename': filename,
+        'job_id': job_id,
+        'status': 'queued',
+        'status_url': url_for('job_status', job_id=job_id)
+    }
+
+
+def cached_result_payload(result, filename):
+    """Build the response body returned when an identical upload was already converted."""
+    output_filename = result.get('output_filename') or result.get('ppt_file')
+    return {
+        'success': True,
+        'message': f'File {filename} matches an earlier upload, reusing its presentation',
+        'filename': filename,
+        'status': 'completed',
+        'cached': True,
+        'result_url': result.get('result_url') or f'/result/{output_filename}',
+        'download_url': url_for('download_file', filename=output_filename),
+        'slide_count': result.get('slide_count'),
+        'stats': result.get('stats')
+    }
+
+
+def queue_generation(job_type, func, args, filename, content_hash, annotation_option, metadata):
+    """Queue a generation job unless the same inputs are already cached or in flight.
+
+    Returns the response body and status code for the upload endpoints.
+    """
+    if result_cache is None or not content_hash:
+        job_id = job_queue.submit(job_type, func, *args, metadata=metadata)
+        return job_accepted_payload(job_id, filename), 202
+    
+    cache_key = result_cache.make_key(content_hash, annotation_option, filename=filename)
+    cached = result_cache.lookup(cache_key)
+    if cached:
+        # Thumbnails may have been evicted since the deck was generated
+        output_filename = cached.get('output_filename') or cached.get('ppt_file')
+        deck_path = find_output_deck(output_filename) if output_filename else None
+        if deck_path:
+            start_thumbnails(deck_path)
+        return cached_result_payload(cached, filename), 200
+    
+    # Attach to a job that is already producing this result instead of duplicating the work
+    job_id = job_queue.new_job_id()
+    existing_job_id = result_cache.claim(cache_key, job_id, job_queue.is_active)
+    if existing_job_id:
+        payload = job_accepted_payload(existing_job_id, filename)
+        payload['coalesced'] = True
+        return payload, 202
+    
+    job_queue.submit(job_type, result_cache.run_and_store, cache_key, job_id, func, *args,
+                     metadata=metadata, job_id=job_id)
+    return job_accepted_payload(job_id, filename), 202
+
+
 @app.route('/upload-complete', methods=['POST'])
 def upload_complete():
-    """Handle upload completion notification and trigger PPTX conversion."""
+    """Handle upload completion notification and queue PPTX conversion."""
     try:
         data = request.get_json()
         
-        # Handle both blob_url (for deployed) and url (for localhost)
-        file_identifier = data.get('blob_url') or data.get('url')
-        if not file_identifier:
-            return jsonify({'error': 'File URL/identifier is required'}), 400
-        
         filename = data.get('filename', 'unknown')
         file_size = data.get('fileSize', 0)
+        annotation_option = data.get('annotation_option', 'with_annos')
+        content_hash = None
         
-        logger.info(f"Upload completed for: {filename}, file_identifier: {file_identifier}")
+        # Check if the job queue is available
+        if job_queue is None:
+            logger.error("Job queue not available for upload completion")
+            return jsonify({
+                'error': 'Job queue not available',
+                'details': 'Background processing failed to initialize'
+            }), 503
         
-        # For ZIP files, process and convert to PPTX
-        if filename.lower().endswith('.zip'):
+        if data.get('upload_id'):
+            # Chunked upload - every chunk must be present before assembling
+            if unified_storage is None:
+                return jsonify({'error': 'Storage service not available'}), 503
+            
+            upload_id, _, total_chunks = parse_chunk_args({
+                'upload_id': data.get('upload_id'), 'total_chunks': data.get('total_chunks', 0)
+            })
+            received = set(unified_storage.list_chunks(upload_id))
+            missing = [index for index in range(total_chunks) if index not in received]
+            if missing:
+                return jsonify({'error': 'Upload is missing chunks', 'upload_id': upload_id, 'missing': missing}), 409
+            
             try:
-                # Download file from storage and process
-                result = run_async(process_blob_file(file_identifier, filename))
-                
-                if result and result.get('success'):
-                    storage_url = result.get('ppt_storage_url', '')
-                    redirect_url = f'/result/{result["ppt_file"]}'
-                    if storage_url and not storage_url.startswith('/local-file/'):
-                        redirect_url += f'?blob_url={storage_url}'
-                    
-                    return jsonify({
-                        'success': True,
-                        'message': 'File processed successfully',
-                        'redirect_url': redirect_url,
-                        'ppt_file': result['ppt_file'],
-                        'ppt_storage_url': storage_url,
-                        'folder_count': result.get('folder_count', 0),
-                        'slide_count': result.get('slide_count', 0)
-                    })
-                else:
-                    return jsonify({
-                        'error': result.get('message', 'Processing failed')
-                    }), 500
-                    
-            except Exception as e:
-                logger.error(f"Error processing ZIP file: {str(e)}")
-                return jsonify({
-                    'error': f'Processing error: {str(e)}'
-                }), 500
+                assembled = unified_storage.assemble_chunks(upload_id, total_chunks, filename,
+                                                            max_size=app.config['MAX_CONTENT_LENGTH'])
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 413
+            
+            file_identifier = assembled['url']
+            filename = assembled['filename']
+            file_size = assembled['size']
+            content_hash = assembled['sha256']
         else:
-            # Single image file - convert to PPTX
-            try:
-                result = run_async(process_single_image_blob(file_identifier, filename))
-                
-                if result and result.get('success'):
-                    storage_url = result.get('ppt_storage_url', '')
-                    redirect_url = f'/result/{result["ppt_file"]}'
-                    if storage_url and not storage_url.startswith('/local-file/'):
-                        redirect_url += f'?blob_url={storage_url}'
-                    
-                    return jsonify({
-                        'success': True,
-                        'message': 'Image processed successfully',
-                        'redirect_url': redirect_url,
-                        'ppt_file': result['ppt_file'],
-                        'ppt_storage_url': storage_url,
-                        'slide_count': 1
-                    })
-                else:
-                    return jsonify({
-                        'error': result.get('message', 'Processing failed')
-                    }), 500
-                    
-            except Exception as e:
-                logger.error(f"Error processing image file: {str(e)}")
-                return jsonify({
-                    'error': f'Processing error: {str(e)}'
-                }), 500
+            # Handle both blob_url (for deployed) and url (for localhost)
+            file_identifier = data.get('blob_url') or data.get('url')
+            if not file_identifier:
+                return jsonify({'error': 'File URL/identifier is required'}), 400
             
+            # Hash the stored upload so identical archives can share results
+            stored_path = unified_storage.get_upload_file_path(file_identifier) if unified_storage else None
+            if stored_path:
+                content_hash = hash_file(stored_path)
+        
+        logger.info(f"Upload completed for: {filename}, file_identifier: {file_identifier}")
+        
+        payload, status = queue_generation(
+            'upload-complete', process_completed_upload, (file_identifier, filename, annotation_option),
+            filename, content_hash, annotation_option,
+            metadata={'filename': filename, 'file_size': file_size, 'content_hash': content_hash,
+                      'annotation_option': annotation_option}
+        )
+        
+        return jsonify(payload), status
+            
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error in upload_complete: {str(e)}")
         return jsonify({'error': f'Upload complete error: {str(e)}'}), 500
 
 
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    """Report the status of a background processing job."""
+    try:
+        # Check if the job queue is available
+        if job_queue is None:
+            logger.error("Job queue not available for status lookup")
+            return jsonify({
+                'error': 'Job queue not available',
+                'details': 'Background processing failed to initialize'
+            }), 503
+        
+        job = job_queue.get_job(job_id)
+        if job is None:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        response = {
+            'job_id': job['job_id'],
+            'type': job.get('type'),
+            'status': job['status'],
+            'filename': job.get('filename'),
+            'created_at': job.get('created_at'),
+            'started_at': job.get('started_at'),
+            'finished_at': job.get('finished_at')
+        }
+        
+        result = job.get('result') or {}
+        if job['status'] == 'completed':
+            output_filename = result.get('output_filename') or result.get('ppt_file')
+            response['result_url'] = result.get('result_url') or (f'/result/{output_filename}' if output_filename else None)
+            response['download_url'] = url_for('download_file', filename=output_filename) if output_filename else None
+            response['slide_count'] = result.get('slide_count')
+            response['stats'] = result.get('stats')
+        elif job['status'] == 'failed':
+            response['error'] = job.get('error')
+        
+        return jsonify(response)
+        
+    except Exception as e:
+        logger.error(f"Error in job_status: {str(e)}")
+        return jsonify({'error': f'Job status error: {str(e)}'}), 500
+
+
+def parse_chunk_args(args):
+    """Read and validate the upload_id/chunk/total_chunks query parameters of a chunked upload."""
+    upload_id = args.get('upload_id')
+    try:
+        total_chunks = int(args.get('total_chunks', 0))
+        chunk = int(args['chunk']) if 'chunk' in args else None
+    except ValueError:
+        raise ValueError('chunk and total_chunks must be integers')
+    
+    if not upload_id:
+        raise ValueError('upload_id is required')
+    if total_chunks < 1 or total_chunks > MAX_UPLOAD_CHUNKS:
+        raise ValueError(f'total_chunks must be between 1 and {MAX_UPLOAD_CHUNKS}')
+    if chunk is not None and not 0 <= chunk < total_chunks:
+        raise ValueError(f'chunk must be between 0 and {total_chunks - 1}')
+    return upload_id, chunk, total_chunks
+
+
+@app.route('/local-upload/<filename>', methods=['GET'])
+def local_upload_status(filename):
+    """Report which chunks of a resumable upload the server already has."""
+    try:
+        if unified_storage is None:
+            logger.error("Unified storage not available for upload status")
+            return jsonify({
+                'error': 'Storage service not available',
+                'details': 'Storage system failed to initialize'
+            }), 503
+        
+        upload_id, _, total_chunks = parse_chunk_args(request.args)
+        received = [index for index in unified_storage.list_chunks(upload_id) if index < total_chunks]
+        received_set = set(received)
+        
+        return jsonify({
+            'success': True,
+            'upload_id': upload_id,
+            'filename': secure_filename(filename),
+            'total_chunks': total_chunks,
+            'received': received,
+            'missing': [index for index in range(total_chunks) if index not in received_set]
+        })
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in local upload status: {str(e)}")
+        return jsonify({'error': f'Upload status error: {str(e)}'}), 500
+
+
 @app.route('/local-upload/<filename>', methods=['PUT'])
 def local_upload(filename):
     """Handle local file uploads for localhost environment."""
@@ -973,17 +1152,32 @@ def local_upload(filename):
                 'details': 'Storage system failed to initialize'
             }), 503
         
-        # This endpoint is for local file uploads
+        # A chunk of a resumable upload - store it and wait for /upload-complete
+        if 'upload_id' in request.args:
+            upload_id, chunk, total_chunks = parse_chunk_args(request.args)
+            if chunk is None:
+                return jsonify({'error': 'chunk is required'}), 400
+            
+            # The chunks of one upload may not add up to more than a whole upload may be
+            max_size = app.config['MAX_CONTENT_LENGTH']
+            if request.content_length and request.content_length * (total_chunks - 1) > max_size:
+                return jsonify({'error': f'Upload exceeds {max_size} bytes'}), 413
+            try:
+                chunk_result = unified_storage.save_chunk(upload_id, chunk, request.stream, max_size=max_size)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 413
+            if not chunk_result:
+                return jsonify({'error': f'Failed to store chunk {chunk}'}), 500
+            
+            chunk_result.update({'success': True, 'total_chunks': total_chunks})
+            return jsonify(chunk_result)
         
-        # Get file data from request
-        file_data = request.get_data()
-        if not file_data:
-            return jsonify({'error': 'No file data received'}), 400
+        # Stream the request body to storage without buffering it in memory
+        upload_result = unified_storage.save_stream(request.stream, filename)
         
-        # Upload file using unified storage
-        upload_result = run_async(unified_storage.upload_file(
-            file_data, filename, request.content_type or 'application/octet-stream'
-        ))
+        if upload_result and upload_result['size'] == 0:
+            run_async(unified_storage.delete_file(upload_result['filename']))
+            return jsonify({'error': 'No file data received'}), 400
         
         if upload_result:
             logger.info(f"Local file uploaded successfully: {filename}")
@@ -992,11 +1186,14 @@ def local_upload(filename):
                 'url': upload_result['url'],
                 'filename': upload_result['filename'],
                 'size': upload_result['size'],
+                'sha256': upload_result['sha256'],
                 'storage_type': upload_result['storage_type']
             })
         else:
             return jsonify({'error': 'Failed to upload file locally'}), 500
             
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error in local upload: {str(e)}")
         return jsonify({'error': f'Local upload error: {str(e)}'}), 500
@@ -1029,25 +1226,20 @@ def process_uploaded_file(filename, file_path, annotation_option='with_annos'):
         if file_ext == '.zip':
             # Handle ZIP file processing
             try:
-                import zipfile
                 extract_dir = os.path.join(UPLOAD_FOLDER, 'extracted', original_filename)
-                os.makedirs(extract_dir, exist_ok=True)
                 
-                logger.info(f"Extracting ZIP to: {extract_dir}")
-                with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_dir)
+                logger.info(f"Streaming ZIP members to: {extract_dir}")
+                extract_images(file_path, extract_dir)
                 
                 # Check if PresentationGenerator is available
                 if PresentationGenerator is None:
                     logger.error("PresentationGenerator not available")
                     return {'success': False, 'error': 'Presentation generator not available'}
                 
-                # Use PresentationGenerator to create presentation
+                # Use PresentationGenerator to create presentation in the generation worker pool
                 logger.info("Using PresentationGenerator for ZIP processing")
-                generator = PresentationGenerator()
-                
-                # Generate presentation using the sophisticated generator
-                ppt_path = generator.generate_from_folder(
+                ppt_path, stats = run_in_pool(
+                    generate_presentation,
                     temp_dir=extract_dir,
                     annotation_option=annotation_option,
                     implement_video_frames=False,
@@ -1064,21 +1256,15 @@ def process_uploaded_file(filename, file_path, annotation_option='with_annos'):
                 logger.info(f"Output file created: {output_exists}")
                 logger.info(f"Output file size: {output_size} bytes")
                 logger.info(f"Generated presentation: {ppt_path}")
-                
-                # Get slide count from the generated presentation
-                try:
-                    from pptx import Presentation
-                    prs = Presentation(ppt_path)
-                    slide_count = len(prs.slides)
-                except Exception as e:
-                    logger.warning(f"Could not get slide count: {str(e)}")
-                    slide_count = 0
+                if output_exists:
+                    start_thumbnails(ppt_path)
                 
                 result = {
                     'success': True,
                     'output_filename': output_filename,
                     'result_url': f'/result/{output_filename}',
-                    'slide_count': slide_count
+                    'slide_count': stats.slide_count,
+                    'stats': stats.to_dict()
                 }
                 logger.info(f"Returning result: {result}")
                 return result
@@ -1109,12 +1295,10 @@ def process_uploaded_file(filename, file_path, annotation_option='with_annos'):
                         logger.error("PresentationGenerator not available")
                         return {'success': False, 'error': 'Presentation generator not available'}
                     
-                    # Use PresentationGenerator to create presentation
+                    # Use PresentationGenerator to create presentation in the generation worker pool
                     logger.info("Using PresentationGenerator for single image processing")
-                    generator = PresentationGenerator()
-                    
-                    # Generate presentation using the sophisticated generator
-                    ppt_path = generator.generate_from_folder(
+                    ppt_path, stats = run_in_pool(
+                        generate_presentation,
                         temp_dir=temp_dir,
                         annotation_option=annotation_option,
                         implement_video_frames=False,
@@ -1130,21 +1314,15 @@ def process_uploaded_file(filename, file_path, annotation_option='with_annos'):
                     output_size = os.path.getsize(ppt_path) if output_exists else 0
                     logger.info(f"Single image output file created: {output_exists}")
                     logger.info(f"Single image output file size: {output_size} bytes")
-                    
-                    # Get slide count from the generated presentation
-                    try:
-                        from pptx import Presentation
-                        prs = Presentation(ppt_path)
-                        slide_count = len(prs.slides)
-                    except Exception as e:
-                        logger.warning(f"Could not get slide count: {str(e)}")
-                        slide_count = 1
+                    if output_exists:
+                        start_thumbnails(ppt_path)
                     
                     result = {
                         'success': True,
                         'output_filename': output_filename,
                         'result_url': f'/result/{output_filename}',
-                        'slide_count': slide_count
+                        'slide_count': stats.slide_count,
+                        'stats': stats.to_dict()
                     }
                     logger.info(f"Single image returning result: {result}")
                     return result
@@ -1205,34 +1383,32 @@ def upload_file():
         logger.info(f"UPLOAD_FOLDER: {UPLOAD_FOLDER}")
         logger.info(f"Upload folder exists: {os.path.exists(UPLOAD_FOLDER)}")
         
-        file.save(file_path)
+        # The multipart body was already spooled into the upload folder, so this is a rename
+        saved = save_file_storage(file, file_path)
+        file_size = saved['size']
+        content_hash = saved['sha256']
+        logger.info(f"File saved successfully: {os.path.exists(file_path)}")
+        logger.info(f"File size: {file_size} bytes, sha256: {content_hash}")
         
-        # Verify file was saved
-        file_saved = os.path.exists(file_path)
-        file_size = os.path.getsize(file_path) if file_saved else 0
-        logger.info(f"File saved successfully: {file_saved}")
-        logger.info(f"File size: {file_size} bytes")
+        # Check if the job queue is available
+        if job_queue is None:
+            logger.error("Job queue not available for upload processing")
+            return jsonify({
+                'error': 'Job queue not available',
+                'message': 'Background processing failed to initialize'
+            }), 503
         
-        # Process the uploaded file
-        logger.info(f"Starting file processing for: {filename}")
-        result = process_uploaded_file(filename, file_path, annotation_option)
-        logger.info(f"Processing result: {result}")
+        # Queue the uploaded file for processing
+        logger.info(f"Queueing file processing for: {filename}")
+        payload, status = queue_generation(
+            'upload', process_uploaded_file, (filename, file_path, annotation_option),
+            filename, content_hash, annotation_option,
+            metadata={'filename': filename, 'file_size': file_size, 'content_hash': content_hash,
+                      'annotation_option': annotation_option}
+        )
+        logger.info(f"Upload of {filename} handled with status {payload['status']}")
         
-        if result.get('success'):
-            result_url = result.get('result_url', f'/result/{result.get("output_filename", filename)}')
-            logger.info(f"Processing successful, result_url: {result_url}")
-            return jsonify({
-                'success': True,
-                'message': f'File {filename} uploaded and processed successfully',
-                'filename': filename,
-                'result_url': result_url
-            }), 200
-        else:
-            logger.error(f"Processing failed: {result.get('error')}")
-            return jsonify({
-                'error': 'Processing failed',
-                'message': result.get('error', 'Unknown error occurred during processing')
-            }), 500
+        return jsonify(payload), status
         
     except Exception as e:
         logger.error(f"Error in upload: {str(e)}")
@@ -1392,6 +1568,39 @@ def test_upload_flow():
 # Blob download and info routes removed - using local file storage for VPS deployment
 
 
+def load_deck_stats(pptx_path):
+    """Stats for a generated deck from its sidecar; decks without one are parsed once and the sidecar backfilled."""
+    stats = read_deck_stats(pptx_path)
+    if stats is None:
+        from pptx import Presentation
+        prs = Presentation(pptx_path)
+        stats = DeckStats(slide_count=len(prs.slides), output_bytes=os.path.getsize(pptx_path))
+        write_deck_stats(pptx_path, stats)
+    return stats
+
+
+def start_thumbnails(pptx_path):
+    """Queue the result page's slide thumbnails for a saved deck without waiting for them."""
+    if get_thumbnail_cache() is None:
+        return
+    try:
+        if missing_thumbnails(pptx_path):
+            render_thumbnails(pptx_path)
+    except Exception as e:
+        # The route renders missing thumbnails on request instead
+        logger.warning(f"Could not queue thumbnails for {pptx_path}: {str(e)}")
+
+
+def find_output_deck(filename):
+    """Local path of a generated deck in unified storage or the outputs folder, or None."""
+    if unified_storage:
+        local_file_path = unified_storage.get_output_file_path(filename)
+        if local_file_path and os.path.exists(local_file_path):
+            return local_file_path
+    temp_file_path = os.path.join(OUTPUT_FOLDER, secure_filename(filename))
+    return temp_file_path if os.path.isfile(temp_file_path) else None
+
+
 @app.route('/result/<filename>')
 def show_result(filename):
     """Display the result page with download links."""
@@ -1412,6 +1621,8 @@ def show_result(filename):
         logger.info(f"Blob URL from query: {blob_url}")
         
         slide_count = 0
+        folder_count = 1  # Default value
+        video_folder_found = False
         file_exists = False
         
         # Check for local file first (using unified storage)
@@ -1423,9 +1634,10 @@ def show_result(filename):
                 file_exists = True
                 logger.info(f"Local file exists: {local_file_path}")
                 try:
-                    from pptx import Presentation
-                    prs = Presentation(local_file_path)
-                    slide_count = len(prs.slides)
+                    stats = load_deck_stats(local_file_path)
+                    slide_count = stats.slide_count
+                    folder_count = stats.folder_count or folder_count
+                    video_folder_found = stats.video_folder_found
                     logger.info(f"Got slide count from local file: {slide_count}")
                 except Exception as e:
                     logger.warning(f"Could not read presentation info from local file: {str(e)}")
@@ -1440,9 +1652,10 @@ def show_result(filename):
             file_exists = True
             logger.info(f"Found file in temp outputs: {temp_file_path}")
             try:
-                from pptx import Presentation
-                prs = Presentation(temp_file_path)
-                slide_count = len(prs.slides)
+                stats = load_deck_stats(temp_file_path)
+                slide_count = stats.slide_count
+                folder_count = stats.folder_count or folder_count
+                video_folder_found = stats.video_folder_found
                 logger.info(f"Got slide count from temp file: {slide_count}")
             except Exception as e:
                 logger.warning(f"Could not read presentation info from temp file: {str(e)}")
@@ -1480,13 +1693,17 @@ def show_result(filename):
             temp_exists = os.path.exists(temp_file_path)
             logger.info(f"Showing result page for {filename} (local: {local_exists}, temp: {temp_exists})")
             logger.info(f"Rendering result.html with filename={filename}, slide_count={slide_count}")
+            # Thumbnail URLs carry the deck's content hash, so they can be cached for good
+            deck_path = find_output_deck(filename)
+            thumbnail_version = deck_hash(deck_path)[:16] if deck_path and get_thumbnail_cache() is not None else None
             return render_template('result.html',
                                  filename=filename,
                                  ppt_file=filename,
-                                 folder_count=1,  # Default value
+                                 folder_count=folder_count,
                                  slide_count=slide_count,
-                                 video_folder_found=False,
-                                 implement_video_frames=False)
+                                 video_folder_found=video_folder_found,
+                                 implement_video_frames=False,
+                                 thumbnail_version=thumbnail_version)
         else:
             logger.error(f"Result file not found locally or in blob storage: {filename}")
             logger.error(f"Checked paths:")
@@ -1500,211 +1717,47 @@ def show_result(filename):
         return render_template('index.html'), 500
 
 
-def convert_slide_to_image(slide, slide_width, slide_height, dpi=300):
-    """Convert a single slide to a high-quality image using PIL and python-pptx.
-    
-    This function renders slide content as an image while preserving formatting.
-    """
-    import io
-    from PIL import Image, ImageDraw, ImageFont
-    from pptx.enum.shapes import MSO_SHAPE_TYPE
-    from pptx.util import Inches, Pt
-    import math
-    
-    try:
-        # Calculate image dimensions based on slide size and DPI
-        img_width = int((slide_width / 914400) * dpi)  # Convert EMU to inches, then to pixels
-        img_height = int((slide_height / 914400) * dpi)
-        
-        # Create a white background image
-        img = Image.new('RGB', (img_width, img_height), 'white')
-        draw = ImageDraw.Draw(img)
-        
-        # Scale factor for positioning
-        scale_x = img_width / slide_width
-        scale_y = img_height / slide_height
-        
-        # Process each shape in the slide
-        for shape in slide.shapes:
-            try:
-                # Get shape position and size in EMU, convert to pixels
-                left = int(shape.left * scale_x)
-                top = int(shape.top * scale_y)
-                width = int(shape.width * scale_x)
-                height = int(shape.height * scale_y)
-                
-                # Handle text shapes
-                if hasattr(shape, "text") and shape.text.strip():
-                    text_content = shape.text.strip()
-                    
-                    # Try to get font size from the shape
-                    font_size = 12  # Default
-                    if hasattr(shape, 'text_frame') and shape.text_frame.paragraphs:
-                        first_para = shape.text_frame.paragraphs[0]
-                        if first_para.runs and first_para.runs[0].font.size:
-                            font_size = int(first_para.runs[0].font.size.pt * (dpi / 72))
-                    
-                    # Use a basic font (you might want to install more fonts)
-                    try:
-                        font = ImageFont.truetype("arial.ttf", font_size)
-                    except:
-                        font = ImageFont.load_default()
-                    
-                    # Draw text with word wrapping
-                    lines = text_content.split('\n')
-                    y_offset = top
-                    
-                    for line in lines:
-                        # Simple word wrapping
-                        words = line.split(' ')
-                        current_line = ""
-                        
-                        for word in words:
-                            test_line = current_line + (" " if current_line else "") + word
-                            bbox = draw.textbbox((0, 0), test_line, font=font)
-                            text_width = bbox[2] - bbox[0]
-                            
-                            if text_width <= width:
-                                current_line = test_line
-                            else:
-                                if current_line:
-                                    draw.text((left, y_offset), current_line, fill='black', font=font)
-                                    y_offset += font_size + 2
-                                current_line = word
-                        
-                        if current_line:
-                            draw.text((left, y_offset), current_line, fill='black', font=font)
-                            y_offset += font_size + 2
-                
-                # Handle image shapes
-                elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                    try:
-                        # Extract image data
-                        image_stream = shape.image.blob
-                        shape_img = Image.open(io.BytesIO(image_stream))
-                        
-                        # Resize image to fit the shape bounds
-                        shape_img = shape_img.resize((width, height), Image.Resampling.LANCZOS)
-                        
-                        # Paste the image onto the slide image
-                        img.paste(shape_img, (left, top))
-                        
-                    except Exception as img_error:
-                        # Draw a placeholder rectangle for failed images
-                        draw.rectangle([left, top, left + width, top + height], outline='gray', fill='lightgray')
-                        draw.text((left + 5, top + 5), "[Image]", fill='black')
-                
-                # Handle other shapes (rectangles, etc.)
-                else:
-                    # Draw a simple rectangle for other shapes
-                    draw.rectangle([left, top, left + width, top + height], outline='lightblue', fill=None)
-                    
-            except Exception as shape_error:
-                logger.warning(f"Error processing shape: {str(shape_error)}")
-                continue
-        
-        return img
-        
-    except Exception as e:
-        logger.error(f"Error converting slide to image: {str(e)}")
-        return None
+# Seconds browsers may keep a thumbnail requested with its deck's version
+THUMBNAIL_MAX_AGE = 365 * 24 * 60 * 60
 
+# Seconds the result page waits before asking again for a thumbnail that is still rendering
+THUMBNAIL_RETRY_SECONDS = 2
 
-def convert_pptx_to_pdf_serverless(input_path, output_dir):
-    """Convert PPTX to PDF by first converting slides to images, then embedding in PDF.
-    
-    This preserves the exact formatting and layout of the original slides.
-    """
-    import tempfile
-    import io
-    from pptx import Presentation
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.utils import ImageReader
-    from PIL import Image
-    
+
+@app.route('/thumbnails/<filename>/<int:slide_number>')
+def slide_thumbnail(filename, slide_number):
+    """Serve a low-resolution JPEG of one slide (numbered from 1); queues the deck's thumbnails on a miss."""
     try:
-        logger.info(f"Starting image-based PDF conversion for: {input_path}")
-        
-        # Load the presentation
-        prs = Presentation(input_path)
-        
-        if not prs.slides:
-            logger.error("No slides found in presentation")
-            return None
-        
-        # Get slide dimensions
-        slide_width = prs.slide_width  # In EMU (English Metric Units)
-        slide_height = prs.slide_height
-        
-        # Convert EMU to points (1 EMU = 1/914400 inch, 1 inch = 72 points)
-        slide_width_pts = (slide_width / 914400) * 72
-        slide_height_pts = (slide_height / 914400) * 72
-        
-        logger.info(f"Slide dimensions: {slide_width_pts:.1f} x {slide_height_pts:.1f} points")
-        
-        # Generate PDF filename
-        base_name = os.path.splitext(os.path.basename(input_path))[0]
-        pdf_path = os.path.join(output_dir, f"{base_name}.pdf")
-        
-        # Create PDF canvas with slide dimensions
-        c = canvas.Canvas(pdf_path, pagesize=(slide_width_pts, slide_height_pts))
-        
-        logger.info(f"Converting {len(prs.slides)} slides to PDF")
-        
-        for slide_num, slide in enumerate(prs.slides, 1):
-            try:
-                logger.info(f"Processing slide {slide_num}/{len(prs.slides)}")
-                
-                # Convert slide to image
-                slide_img = convert_slide_to_image(slide, slide_width, slide_height, dpi=150)
-                
-                if slide_img:
-                    # Create a new page (except for the first slide)
-                    if slide_num > 1:
-                        c.showPage()
-                    
-                    # Convert PIL image to bytes
-                    img_buffer = io.BytesIO()
-                    slide_img.save(img_buffer, format='PNG')
-                    img_buffer.seek(0)
-                    
-                    # Create ImageReader object
-                    img_reader = ImageReader(img_buffer)
-                    
-                    # Draw the image to fill the entire page
-                    c.drawImage(img_reader, 0, 0, width=slide_width_pts, height=slide_height_pts)
-                    
-                    logger.info(f"Added slide {slide_num} as image to PDF")
-                else:
-                    logger.warning(f"Failed to convert slide {slide_num} to image")
-                    # Create a new page with error message
-                    if slide_num > 1:
-                        c.showPage()
-                    c.setFont("Helvetica", 12)
-                    c.drawString(50, slide_height_pts - 50, f"Error: Could not render slide {slide_num}")
-                
-            except Exception as e:
-                logger.warning(f"Error processing slide {slide_num}: {str(e)}")
-                # Create a new page with error message
-                if slide_num > 1:
-                    c.showPage()
-                c.setFont("Helvetica", 12)
-                c.drawString(50, slide_height_pts - 50, f"Error processing slide {slide_num}: {str(e)}")
-                continue
-        
-        # Save the PDF
-        c.save()
-        
-        if os.path.exists(pdf_path):
-            logger.info(f"PDF conversion successful: {pdf_path}")
-            return pdf_path
-        else:
-            logger.error(f"PDF file not created: {pdf_path}")
-            return None
-            
+        if get_thumbnail_cache() is None:
+            return jsonify({'error': 'Thumbnails are disabled'}), 404
+
+        deck_path = find_output_deck(filename)
+        if deck_path is None:
+            return jsonify({'error': 'File not found in storage'}), 404
+
+        thumbnail_path = cached_thumbnail_path(deck_path, slide_number)
+        if thumbnail_path is None:
+            if not 1 <= slide_number <= read_slide_geometry(deck_path)[2]:
+                return jsonify({'error': 'Slide not found'}), 404
+            # Decks from before thumbnails, or whose background render has not finished yet: the render is
+            # queued and the page retries, rather than holding a web worker until the whole deck is drawn
+            render_thumbnails(deck_path)
+            response = jsonify({'error': 'Thumbnail is being rendered'})
+            response.status_code = 404
+            response.headers['Cache-Control'] = 'no-store'
+            response.headers['Retry-After'] = str(THUMBNAIL_RETRY_SECONDS)
+            return response
+
+        # Only a URL naming this deck's version may be cached for good; a deck can be replaced under the same name
+        if request.args.get('v') == deck_hash(deck_path)[:16]:
+            response = send_file(thumbnail_path, mimetype='image/jpeg', max_age=THUMBNAIL_MAX_AGE)
+            response.headers['Cache-Control'] = f'public, max-age={THUMBNAIL_MAX_AGE}, immutable'
+            return response
+        return send_file(thumbnail_path, mimetype='image/jpeg', max_age=0)
+
     except Exception as e:
-        logger.error(f"Error in image-based PDF conversion: {str(e)}")
-        return None
+        logger.error(f"Error serving thumbnail {slide_number} of {filename}: {str(e)}")
+        return jsonify({'error': f'Thumbnail error: {str(e)}'}), 500
 
 
 @app.route('/convert-to-pdf/<filename>', methods=['GET', 'POST'])
@@ -1760,50 +1813,46 @@ def convert_to_pdf(filename):
             except Exception as e:
                 logger.error(f"Error downloading from storage: {str(e)}")
                 return jsonify({'error': f'Storage download error: {str(e)}'}), 500
-        else:
+        elif not input_file_path:
             return jsonify({'error': 'File not found in storage'}), 404
         
-        # Create temporary directory for PDF output
-        with tempfile.TemporaryDirectory() as temp_output_dir:
-            try:
-                # Convert PPTX to PDF using serverless approach
-                pdf_path = convert_pptx_to_pdf_serverless(input_file_path, temp_output_dir)
-                
-                if pdf_path and os.path.exists(pdf_path):
-                    # Generate PDF filename
-                    base_name = os.path.splitext(filename)[0]
-                    pdf_filename = f"{base_name}.pdf"
-                    
-                    # Read the PDF file
-                    with open(pdf_path, 'rb') as pdf_file:
-                        pdf_data = pdf_file.read()
-                    
-                    logger.info(f"PDF conversion successful. Size: {len(pdf_data)} bytes")
-                    
-                    # Return the PDF file for download
-                    from flask import Response
-                    response = Response(
-                        pdf_data,
-                        mimetype='application/pdf',
-                        headers={
-                            'Content-Disposition': f'attachment; filename="{pdf_filename}"',
-                            'Content-Length': str(len(pdf_data))
-                        }
-                    )
-                    
-                    return response
-                else:
-                    return jsonify({'error': 'PDF conversion failed'}), 500
-                    
-            finally:
-                # Clean up temporary input file if created
-                if temp_input_file and os.path.exists(temp_input_file.name):
-                    try:
-                        os.unlink(temp_input_file.name)
-                        logger.info(f"Cleaned up temporary file: {temp_input_file.name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to clean up temporary file: {str(e)}")
+        # Generate PDF filename
+        base_name = os.path.splitext(filename)[0]
+        pdf_filename = f"{base_name}.pdf"
         
+        try:
+            # The same deck always renders to the same PDF, so repeat requests are served from the PDF cache
+            cache_key = pdf_cache_key(input_file_path)
+            cached_pdf = cached_pdf_path(cache_key)
+            if cached_pdf:
+                logger.info(f"Serving cached PDF for {filename}")
+                return send_file(cached_pdf, mimetype='application/pdf', as_attachment=True, download_name=pdf_filename)
+
+            # Fail with a JSON error while that is still possible, before any PDF bytes are sent
+            if not read_slide_geometry(input_file_path)[2]:
+                return jsonify({'error': 'PDF conversion failed', 'details': 'No slides found in presentation'}), 500
+
+            # Rendered off the request thread and streamed from disk; raster pages are sent as they render
+            download = PdfDownload(input_file_path, cache_key, temp_input_file.name if temp_input_file else None).start()
+            response = Response(
+                download.iter_bytes(),
+                mimetype='application/pdf',
+                headers={'Content-Disposition': f'attachment; filename="{pdf_filename}"'}
+            )
+            response.call_on_close(download.close)
+            # The download owns the temporary input file from here on
+            temp_input_file = None
+            return response
+
+        finally:
+            # Clean up temporary input file if created
+            if temp_input_file and os.path.exists(temp_input_file.name):
+                try:
+                    os.unlink(temp_input_file.name)
+                    logger.info(f"Cleaned up temporary file: {temp_input_file.name}")
+                except Exception as e:
+                    logger.warning(f"Failed to clean up temporary file: {str(e)}")
+
     except Exception as e:
         logger.error(f"Error in PDF conversion: {str(e)}")
         return jsonify({'error': f'PDF conversion error: {str(e)}'}), 500
@@ -1882,7 +1931,7 @@ def handle_exception(e):
     logger.error(f"Traceback: {traceback.format_exc()}")
     
     # Define all API routes that should return JSON
-    api_routes = ['/upload', '/health', '/startup-status', '/fallback-info', '/convert-to-pdf', '/download', '/local-file', '/test-upload-flow']
+    api_routes = ['/upload', '/jobs', '/health', '/startup-status', '/fallback-info', '/convert-to-pdf', '/download', '/local-file', '/test-upload-flow']
     is_api_route = any(request.path.startswith(route) for route in api_routes)
     
     if is_api_route:
@@ -20,6 +20,8 @@ FLASK_PORT="5000"
 NGINX_AVAILABLE="/etc/nginx/sites-available"
 NGINX_ENABLED="/etc/nginx/sites-enabled"
 PY_USER="$(whoami)"
+WEB_WORKERS="4"
+GENERATION_WORKERS="${GENERATION_WORKERS:-1}"  # generation processes per web worker
 
 print_status()   { echo -e "${BLUE}[INFO]${NC} $1"; }
 print_success()  { echo -e "${GREEN}[SUCCESS]${NC} $1"; }
@@ -96,7 +98,9 @@ User=$PY_USER
 Group=www-data
 WorkingDirectory=$APP_DIR
 Environment="PATH=$APP_DIR/venv/bin"
-ExecStart=$APP_DIR/venv/bin/gunicorn -w 4 -b 127.0.0.1:$FLASK_PORT app:app
+Environment="WEB_CONCURRENCY=$WEB_WORKERS"
+Environment="GENERATION_WORKERS=$GENERATION_WORKERS"
+ExecStart=$APP_DIR/venv/bin/gunicorn -w $WEB_WORKERS -k gthread --threads 4 -b 127.0.0.1:$FLASK_PORT app:app
 Restart=always
 RestartSec=3
 
@@ -75,17 +75,15 @@ def process_uploaded_file(file, annotation_option='with_annos', is_multi_tab=Tru
         os.makedirs(outputs_dir, exist_ok=True)
         
         # Generate presentation
-        ppt_filename = generator.generate_from_folder(
+        ppt_filename, stats = generator.generate_from_folder(
             temp_dir, 
             annotation_option=annotation_option,
             implement_video_frames=implement_video_frames,
             original_filename=original_filename
         )
         
-        # Get actual slide count from the generated presentation
-        from pptx import Presentation
-        prs = Presentation(ppt_filename)
-        slide_count = len(prs.slides)
+        # The generator reports the slide count, so the deck is not reopened
+        slide_count = stats.slide_count
         
         # Get folder count and other info
         folder_structure = generator._organize_folder_structure(temp_dir)
@@ -117,82 +117,56 @@ function handleFormSubmission() {
                 uploadBtn.innerHTML = '<i data-feather="upload-cloud" class="me-2"></i>Uploading...';
                 feather.replace();
                 
-                // Create FormData for direct file upload
-                const formData = new FormData();
-                formData.append('file', file);
-                
                 // Get annotation option from form
                 const annotationOption = document.querySelector('input[name="annotation_option"]:checked');
-                if (annotationOption) {
-                    formData.append('annotation_option', annotationOption.value);
-                }
                 
-                progressBar.style.width = '20%';
+                // Send the file in resumable chunks, then ask the server to assemble and process it
+                await uploadInChunks(file, (fraction) => {
+                    progressBar.style.width = `${Math.round(5 + fraction * 55)}%`;
+                });
                 
-                // Upload file directly to server with explicit JSON headers
-                const uploadResponse = await fetch('/upload', {
+                const completeResponse = await fetch('/upload-complete', {
                     method: 'POST',
                     headers: {
-                        'Accept': 'application/json'
-                        // Note: Don't set Content-Type for FormData, let browser set it with boundary
+                        'Accept': 'application/json',
+                        'Content-Type': 'application/json'
                     },
-                    body: formData
+                    body: JSON.stringify({
+                        upload_id: chunkedUploadId(file),
+                        total_chunks: Math.max(1, Math.ceil(file.size / UPLOAD_CHUNK_SIZE)),
+                        filename: file.name,
+                        fileSize: file.size,
+                        annotation_option: annotationOption ? annotationOption.value : 'with_annos'
+                    })
                 });
                 
                 progressBar.style.width = '60%';
                 
-                if (!uploadResponse.ok) {
-                    let errorMessage = 'Upload failed';
-                    try {
-                        // Check if response is HTML before trying to parse as JSON
-                        const contentType = uploadResponse.headers.get('content-type');
-                        if (contentType && contentType.includes('text/html')) {
-                            const htmlText = await uploadResponse.text();
-                            // Extract meaningful error from HTML if possible
-                            const titleMatch = htmlText.match(/<title>(.*?)<\/title>/i);
-                            errorMessage = titleMatch ? titleMatch[1] : `Server returned HTML error (${uploadResponse.status})`;
-                        } else {
-                            const error = await uploadResponse.json();
-                            errorMessage = error.error || error.message || 'Upload failed';
-                        }
-                    } catch (parseError) {
-                        // If response parsing fails completely, use status text
-                        errorMessage = uploadResponse.statusText || `HTTP ${uploadResponse.status} error`;
-                    }
-                    throw new Error(errorMessage);
-                }
-
-                // Validate response is JSON before parsing
-                const contentType = uploadResponse.headers.get('content-type');
-                if (!contentType || !contentType.includes('application/json')) {
-                    const responseText = await uploadResponse.text();
-                    if (responseText.trim().startsWith('<!DOCTYPE') || responseText.trim().startsWith('<html')) {
-                        throw new Error('Server returned HTML instead of JSON. Please check server configuration.');
-                    }
-                    throw new Error('Server returned non-JSON response: ' + contentType);
+                const result = await parseJsonResponse(completeResponse, 'Upload failed');
+                
+                if (!result.success) {
+                    // Show error message
+                    throw new Error(result.message || 'Processing failed');
                 }
-
-                const result = await uploadResponse.json();
+                
+                // Upload accepted - wait for the background job to finish
+                uploadBtn.innerHTML = '<i data-feather="loader" class="me-2"></i>Processing...';
+                feather.replace();
+                const job = result.status_url ? await pollJobStatus(result.status_url, progressBar) : result;
                 progressBar.style.width = '100%';
                 
-                // Check if processing was successful
-                if (result.success) {
-                    // Show success message
-                    showSuccess(`File uploaded and processed successfully! ${result.message || ''}`);
-                    
-                    // If we have a result URL, redirect after a delay
-                    if (result.result_url) {
-                        setTimeout(() => {
-                            window.location.href = result.result_url;
-                        }, 1500);
-                    } else {
-                        // Reset form
-                        form.reset();
-                        handleFileInput(); // Update UI
-                    }
+                // Show success message
+                showSuccess(`File uploaded and processed successfully! ${result.message || ''}`);
+                
+                // If we have a result URL, redirect after a delay
+                if (job.result_url) {
+                    setTimeout(() => {
+                        window.location.href = job.result_url;
+                    }, 1500);
                 } else {
-                    // Show error message
-                    throw new Error(result.message || 'Processing failed');
+                    // Reset form
+                    form.reset();
+                    handleFileInput(); // Update UI
                 }
                 
             } catch (error) {
@@ -212,6 +186,153 @@ function handleFormSubmission() {
     }
 }
 
+// Resumable chunked upload settings
+const UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024;
+const UPLOAD_PARALLEL_CHUNKS = 4;
+const UPLOAD_CHUNK_RETRIES = 5;
+
+// Random token for this browser, so two users uploading the same file never share chunks
+let uploadClientTokenValue = null;
+
+function uploadClientToken() {
+    if (uploadClientTokenValue) {
+        return uploadClientTokenValue;
+    }
+    try {
+        uploadClientTokenValue = localStorage.getItem('mlrUploadClient');
+    } catch (error) {
+        // Storage can be unavailable, e.g. in private browsing
+    }
+    if (!uploadClientTokenValue) {
+        const bytes = crypto.getRandomValues(new Uint8Array(8));
+        uploadClientTokenValue = Array.from(bytes, (b) => b.toString(16).padStart(2, '0')).join('');
+        try {
+            localStorage.setItem('mlrUploadClient', uploadClientTokenValue);
+        } catch (error) {
+            // The token then lasts for this page only
+        }
+    }
+    return uploadClientTokenValue;
+}
+
+// Upload ID stable per browser and file, so a retried upload of the same file resumes instead of starting over
+function chunkedUploadId(file) {
+    const safeName = file.name.replace(/[^A-Za-z0-9_-]/g, '_').slice(0, 24);
+    return `${uploadClientToken()}-${file.size}-${file.lastModified}-${safeName}`.slice(0, 64);
+}
+
+// Parse a JSON API response, turning HTML and error responses into readable errors
+async function parseJsonResponse(response, fallbackMessage) {
+    const contentType = response.headers.get('content-type');
+    if (!contentType || !contentType.includes('application/json')) {
+        const responseText = await response.text();
+        if (responseText.trim().startsWith('<!DOCTYPE') || responseText.trim().startsWith('<html')) {
+            const titleMatch = responseText.match(/<title>(.*?)<\/title>/i);
+            throw new Error(titleMatch ? titleMatch[1] : `Server returned HTML error (${response.status})`);
+        }
+        throw new Error(response.statusText || `HTTP ${response.status} error`);
+    }
+    
+    const data = await response.json();
+    if (!response.ok) {
+        throw new Error(data.error || data.message || fallbackMessage);
+    }
+    return data;
+}
+
+// Upload a file as numbered chunks in parallel, skipping chunks the server already has
+async function uploadInChunks(file, onProgress) {
+    const uploadId = chunkedUploadId(file);
+    const totalChunks = Math.max(1, Math.ceil(file.size / UPLOAD_CHUNK_SIZE));
+    const baseUrl = `/local-upload/${encodeURIComponent(file.name)}`;
+    const query = `upload_id=${encodeURIComponent(uploadId)}&total_chunks=${totalChunks}`;
+    
+    // Ask which chunks are missing so an interrupted upload picks up where it left off
+    let pending = [...Array(totalChunks).keys()];
+    try {
+        const statusResponse = await fetch(`${baseUrl}?${query}`, { headers: { 'Accept': 'application/json' } });
+        if (statusResponse.ok) {
+            pending = (await statusResponse.json()).missing;
+        }
+    } catch (error) {
+        console.warn('Could not check upload status, sending all chunks:', error);
+    }
+    
+    let completed = totalChunks - pending.length;
+    onProgress(completed / totalChunks);
+    
+    async function sendChunk(index) {
+        const start = index * UPLOAD_CHUNK_SIZE;
+        const blob = file.slice(start, Math.min(start + UPLOAD_CHUNK_SIZE, file.size));
+        
+        for (let attempt = 1; ; attempt++) {
+            let response = null;
+            try {
+                response = await fetch(`${baseUrl}?${query}&chunk=${index}`, {
+                    method: 'PUT',
+                    headers: { 'Accept': 'application/json', 'Content-Type': 'application/octet-stream' },
+                    body: blob
+                });
+            } catch (error) {
+                console.warn(`Chunk ${index} attempt ${attempt} failed:`, error);
+            }
+            
+            if (response && response.ok) {
+                return;
+            }
+            // Client errors will not succeed on retry
+            if (response && response.status >= 400 && response.status < 500) {
+                await parseJsonResponse(response, `Chunk ${index} was rejected`);
+            }
+            if (attempt >= UPLOAD_CHUNK_RETRIES) {
+                throw new Error(`Chunk ${index} failed after ${attempt} attempts`);
+            }
+            // Back off before retrying on a flaky connection
+            await new Promise(resolve => setTimeout(resolve, 500 * 2 ** attempt));
+        }
+    }
+    
+    // A few workers pull chunk numbers off the shared queue
+    const queue = pending.slice();
+    const workers = Array.from({ length: Math.min(UPLOAD_PARALLEL_CHUNKS, queue.length) }, async () => {
+        while (queue.length) {
+            const index = queue.shift();
+            await sendChunk(index);
+            completed++;
+            onProgress(completed / totalChunks);
+        }
+    });
+    await Promise.all(workers);
+}
+
+// Poll a background job until it completes or fails
+async function pollJobStatus(statusUrl, progressBar, intervalMs = 2000) {
+    let progress = 60;
+    
+    while (true) {
+        await new Promise(resolve => setTimeout(resolve, intervalMs));
+        
+        const response = await fetch(statusUrl, {
+            headers: { 'Accept': 'application/json' }
+        });
+        if (!response.ok) {
+            throw new Error(`Could not check processing status (HTTP ${response.status})`);
+        }
+        
+        const job = await response.json();
+        if (job.status === 'completed') {
+            return job;
+        }
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'Processing failed');
+        }
+        
+        // Creep the progress bar forward while the job is queued or running
+        progress = Math.min(progress + 2, 95);
+        progressBar.style.width = `${progress}%`;
+    }
+}
+
 // Helper functions for showing messages
 function showError(message) {
     showAlert(message, 'danger', 'alert-circle');
@@ -0,0 +1,63 @@
+"""
+Streaming ZIP ingestion for uploaded campaign archives.
+Copies image members straight from the stored upload to disk without buffering the archive.
+"""
+
+import os
+import shutil
+import logging
+import zipfile
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def is_image_member(member: zipfile.ZipInfo) -> bool:
+    """Check whether an archive member is an image the generator can use."""
+    if member.is_dir():
+        return False
+    # macOS resource forks carry image extensions but are not images
+    parts = member.filename.replace('\\', '/').split('/')
+    if '__MACOSX' in parts or parts[-1].startswith('._'):
+        return False
+    return member.filename.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def _safe_member_path(extract_to: str, member_name: str) -> str:
+    """Resolve a member's destination, rejecting names that escape the extraction directory."""
+    root = os.path.realpath(extract_to)
+    target = os.path.realpath(os.path.join(root, member_name.replace('\\', '/')))
+    if target != root and not target.startswith(root + os.sep):
+        raise ValueError(f"Archive member escapes extraction directory: {member_name}")
+    return target
+
+
+def extract_images(archive_path: str, extract_to: str) -> int:
+    """Stream every image member of a ZIP archive into extract_to and return how many were written.
+
+    Members are read through the archive's file handle one chunk at a time, so
+    neither the archive nor any single member is ever held in memory.
+    """
+    extracted = 0
+    total_bytes = 0
+
+    os.makedirs(extract_to, exist_ok=True)
+
+    with zipfile.ZipFile(archive_path, 'r') as archive:
+        for member in archive.infolist():
+            if not is_image_member(member):
+                continue
+
+            target = _safe_member_path(extract_to, member.filename)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            with archive.open(member, 'r') as source, open(target, 'wb') as dest:
+                shutil.copyfileobj(source, dest, COPY_CHUNK_SIZE)
+
+            extracted += 1
+            total_bytes += member.file_size
+
+    logger.info(f"Streamed {extracted} images ({total_bytes} bytes) from {os.path.basename(archive_path)} to {extract_to}")
+    return extracted
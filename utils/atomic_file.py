@@ -0,0 +1,25 @@
+"""
+Atomic file replacement for records shared between workers.
+Content is written to a temporary file beside the destination and renamed over it, so readers see the old file or the new one.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'w'):
+    """Open a temporary file to write path's new content; it replaces path only if the block completes."""
+    # Unique per process and thread, so concurrent writers of the same path never share a temp file
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, mode) as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
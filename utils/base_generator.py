@@ -5,12 +5,13 @@ Contains folder mapping, formatting logic, and common utilities.
 
 import os
 import logging
-from PIL import Image
+from .image_index import ImageIndex
 
 
 class BaseGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.image_index = ImageIndex(self.logger)
         self.folder_mapping = {
             'ott': 'OTT',
             'vdxdesktopexpandable': 'DESKTOP EXPANDABLE',
@@ -78,14 +79,13 @@ class BaseGenerator:
     def _validate_image_dimensions(self, image_path, min_width=1900, min_height=1092):
         """Validate if image meets minimum dimension requirements."""
         try:
-            with Image.open(image_path) as img:
-                width, height = img.size
-                if width >= min_width and height >= min_height:
-                    self.logger.info(f"Image {os.path.basename(image_path)} dimensions: {width}x{height} - INCLUDED")
-                    return True
-                else:
-                    self.logger.info(f"Image {os.path.basename(image_path)} dimensions: {width}x{height} - SKIPPED (too small)")
-                    return False
+            width, height = self.image_index.size(image_path)
+            if width >= min_width and height >= min_height:
+                self.logger.info(f"Image {os.path.basename(image_path)} dimensions: {width}x{height} - INCLUDED")
+                return True
+            else:
+                self.logger.info(f"Image {os.path.basename(image_path)} dimensions: {width}x{height} - SKIPPED (too small)")
+                return False
         except Exception as e:
             self.logger.error(f"Error reading image {image_path}: {str(e)}")
             return False
@@ -0,0 +1,85 @@
+"""
+Statistics recorded while a deck is generated.
+Persisted as a JSON sidecar next to the PPTX so result pages and APIs never have to reopen the deck.
+"""
+
+import os
+import json
+import zipfile
+import logging
+from typing import Optional, Dict, Any
+
+from .atomic_file import atomic_write
+
+logger = logging.getLogger(__name__)
+
+STATS_SUFFIX = '.stats.json'
+
+
+class DeckStats:
+    """Slide/folder/image counts, media size and phase timings of one generated deck."""
+
+    __slots__ = ('slide_count', 'folder_count', 'image_count', 'media_bytes', 'output_bytes',
+                 'video_folder_found', 'timings')
+
+    def __init__(self, slide_count=0, folder_count=0, image_count=0, media_bytes=0, output_bytes=0,
+                 video_folder_found=False, timings=None):
+        self.slide_count = slide_count
+        self.folder_count = folder_count
+        self.image_count = image_count
+        self.media_bytes = media_bytes
+        self.output_bytes = output_bytes
+        self.video_folder_found = video_folder_found
+        self.timings = timings or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DeckStats':
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+def media_bytes_in(pptx_path: str) -> int:
+    """Total uncompressed size of the media parts in a PPTX, from the zip directory alone."""
+    with zipfile.ZipFile(pptx_path) as package:
+        return sum(info.file_size for info in package.infolist() if info.filename.startswith('ppt/media/'))
+
+
+def stats_path(pptx_path: str) -> str:
+    return f"{pptx_path}{STATS_SUFFIX}"
+
+
+def write_deck_stats(pptx_path: str, stats: DeckStats) -> bool:
+    """Write the sidecar for a finished deck, tied to the deck's current size and mtime."""
+    try:
+        stat = os.stat(pptx_path)
+        with atomic_write(stats_path(pptx_path)) as f:
+            json.dump({
+                'stats': stats.to_dict(),
+                'output_size': stat.st_size,
+                'output_mtime_ns': stat.st_mtime_ns
+            }, f)
+        return True
+    except Exception as e:
+        logger.error(f"Error writing deck stats for {pptx_path}: {str(e)}")
+        return False
+
+
+def read_deck_stats(pptx_path: str) -> Optional[DeckStats]:
+    """Return the stats recorded for pptx_path, or None if there is no sidecar or the deck was replaced since."""
+    try:
+        with open(stats_path(pptx_path), 'r') as f:
+            entry = json.load(f)
+        stat = os.stat(pptx_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Error reading deck stats for {pptx_path}: {str(e)}")
+        return None
+
+    # Outputs are named after the upload, so a later deck with the same name may have replaced this one
+    if stat.st_size != entry.get('output_size') or stat.st_mtime_ns != entry.get('output_mtime_ns'):
+        logger.info(f"Deck stats for {os.path.basename(pptx_path)} are stale")
+        return None
+    return DeckStats.from_dict(entry.get('stats', {}))
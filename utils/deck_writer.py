@@ -0,0 +1,205 @@
+"""
+Streaming package writer for large decks.
+Writes each finished slide and its pictures into the .pptx archive during generation and drops the image data it no longer needs.
+"""
+
+import os
+import zipfile
+import logging
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.parts.image import ImagePart
+
+from .media_pipeline import MediaPipeline, DOWNSCALE_THRESHOLD
+
+# Under DECK_WRITER=auto, uploads with at least this many images use the streaming writer
+STREAMING_MIN_IMAGES = 200
+
+DECK_WRITER_MODES = ('auto', 'pptx', 'streaming')
+
+
+def deck_writer_mode():
+    """'auto', 'pptx' or 'streaming' from DECK_WRITER."""
+    mode = os.environ.get('DECK_WRITER', 'auto').strip().lower()
+    return mode if mode in DECK_WRITER_MODES else 'auto'
+
+
+def use_streaming_writer(image_count):
+    """True when a deck built from image_count images should be written with StreamingDeckWriter."""
+    mode = deck_writer_mode()
+    return mode == 'streaming' or (mode == 'auto' and image_count >= STREAMING_MIN_IMAGES)
+
+
+class _WrittenImagePart(ImagePart):
+    """Image part whose bytes are already in the archive.
+
+    Its SHA1 matches nothing, so placing the same file again adds a new part;
+    flush() points that placement back at this part when its resolution covers
+    it, and otherwise keeps the new part for the media pipeline to size. The
+    native size python-pptx asks for while scaling is kept from before the blob
+    was released.
+    """
+
+    @property
+    def sha1(self):
+        return None
+
+    @property
+    def _native_size(self):
+        return self._written_native_size
+
+
+class StreamingDeckWriter:
+    """Writes a python-pptx presentation into its zip package one finished slide at a time.
+
+    flush() is called whenever every slide added so far is complete. It runs the
+    media pipeline over those slides, writes their image parts, slide XML and
+    relationships, and releases the image blobs, so memory no longer grows with
+    the number of screenshots. A PDF sink, when given, draws the same slides
+    before their images are released. close() writes the shared parts (presentation,
+    masters, layouts, theme, properties) and [Content_Types].xml, then moves the
+    archive into place. The parts, partnames and XML are the ones prs.save()
+    would write, except that a picture placed again after its part was written
+    at too low a resolution for the new placement gets a part of its own; the
+    member order in the zip differs too.
+    """
+
+    def __init__(self, prs, output_path, logger=None, media_pipeline=None, pdf_sink=None):
+        self.prs = prs
+        self.output_path = output_path
+        self.logger = logger or logging.getLogger(__name__)
+        self.media_pipeline = media_pipeline or MediaPipeline(self.logger)
+        self.pdf_sink = pdf_sink
+
+        # Write beside the destination and rename on close so a failed run leaves no half deck
+        self._temp_path = f"{output_path}.partial"
+        self._zip = zipfile.ZipFile(self._temp_path, 'w', compression=zipfile.ZIP_DEFLATED, strict_timestamps=False)
+        self._written = set()
+        # Written image parts by the SHA1 of their source bytes, with (pixel size written, source pixel size)
+        self._written_sources = {}
+        self._rewritten = 0
+        self._saved = 0
+
+    def flush(self):
+        """Write every slide added so far that has not been written yet."""
+        finished = self._unwritten_slides()
+        if not finished:
+            return
+
+        new_images = []
+        for slide in finished:
+            for rel in slide.part.rels.values():
+                if not rel.is_external and isinstance(rel.target_part, ImagePart) and rel.target_part not in self._written:
+                    if rel.target_part not in new_images:
+                        new_images.append(rel.target_part)
+
+        # Pictures placed again after their part was written (the logo, repeated ISI bands) reuse that part
+        targets = self.media_pipeline.collect_targets(finished)
+        sources = {}
+        for part in list(new_images):
+            written = self._written_sources.get(part.sha1)
+            if written is not None and self._covers(written[1], written[2], targets.get(part)):
+                self._relink(finished, part, written[0])
+                new_images.remove(part)
+            else:
+                # Size of the source image, which python-pptx still asks for if a picture is rescaled
+                sources[part] = (part.sha1, part._px_size, part._native_size)
+
+        rewritten, saved = self.media_pipeline.process_slides(finished, skip=self._written)
+        self._rewritten += rewritten
+        self._saved += saved
+
+        # The PDF sink needs the image data, so it draws the slides before their images are released
+        if self.pdf_sink is not None:
+            self.pdf_sink.add_slides(finished)
+
+        # Image partnames are final after the pipeline, so the slide relationships can be written
+        for part in new_images:
+            sha1, source_size, native_size = sources[part]
+            self._written_sources[sha1] = (part, part._px_size, source_size)
+            self._write_part(part)
+            self._release(part, native_size)
+        for slide in finished:
+            self._write_part(slide.part)
+
+    def close(self):
+        """Write the remaining slides and package parts, then move the archive to output_path."""
+        self.flush()
+
+        package = self.prs.part.package
+        parts = tuple(package.iter_parts())
+        for part in parts:
+            if part not in self._written:
+                self._write_part(part)
+
+        self._zip.writestr(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        self._zip.close()
+        os.replace(self._temp_path, self.output_path)
+
+        self.logger.info(f"Media pipeline rewrote {self._rewritten} images (target {self.media_pipeline.target_dpi} DPI), saving {self._saved} bytes")
+        self.logger.info(f"Streaming writer wrote {len(parts)} parts to {self.output_path}")
+
+    def abort(self):
+        """Discard the partially written archive."""
+        try:
+            self._zip.close()
+        except Exception:
+            pass
+        try:
+            os.remove(self._temp_path)
+        except OSError:
+            pass
+
+    def _unwritten_slides(self):
+        """Slides added since the last flush; new slides are appended, so the scan stops at the last written one."""
+        slides = []
+        for sld_id in reversed(self.prs.slides._sldIdLst):
+            slide = self.prs.part.related_slide(sld_id.rId)
+            if slide.part in self._written:
+                break
+            slides.append(slide)
+        slides.reverse()
+        return slides
+
+    @staticmethod
+    def _covers(written_size, source_size, target):
+        """True when a written image is detailed enough for placements needing target pixels."""
+        if written_size == source_size:
+            return True
+        if target is None:
+            return False
+        # Same slack the media pipeline allows before it resamples at all
+        return target[0] <= written_size[0] * DOWNSCALE_THRESHOLD and target[1] <= written_size[1] * DOWNSCALE_THRESHOLD
+
+    @staticmethod
+    def _relink(slides, part, written_part):
+        """Point every picture on slides that shows part at written_part instead."""
+        for slide in slides:
+            slide_part = slide.part
+            rIds = [rId for rId, rel in slide_part.rels.items() if not rel.is_external and rel.target_part is part]
+            if not rIds:
+                continue
+            blips = [blip for rId in rIds for blip in slide_part._element.xpath(f'.//a:blip[@r:embed="{rId}"]')]
+            # Dropped first so the new relationship takes the same rId prs.save() would have written
+            for rId in rIds:
+                slide_part.drop_rel(rId)
+            new_rId = slide_part.relate_to(written_part, RT.IMAGE)
+            for blip in blips:
+                blip.rEmbed = new_rId
+
+    def _write_part(self, part):
+        self._zip.writestr(part.partname.membername, part.blob)
+        if part._rels:
+            self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        self._written.add(part)
+
+    @staticmethod
+    def _release(part, native_size):
+        if type(part) is not ImagePart:
+            return
+        part._blob = b''
+        part.__class__ = _WrittenImagePart
+        part._written_native_size = native_size
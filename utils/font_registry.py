@@ -0,0 +1,153 @@
+"""
+Process-wide font registry for the slide rasterizer.
+Resolves font families to system font files once and caches loaded fonts and glyph advances per (family, size).
+"""
+
+import os
+import logging
+import threading
+from PIL import ImageFont
+
+logger = logging.getLogger(__name__)
+
+# Searched once, recursively, for .ttf/.ttc/.otf files
+FONT_DIRS = [
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    os.path.expanduser('~/.fonts'),
+    os.path.expanduser('~/.local/share/fonts'),
+    '/Library/Fonts',
+    '/System/Library/Fonts',
+    os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),
+]
+
+# Sans fonts tried, in order, for any family that is not installed itself
+FALLBACK_FILES = ('arial.ttf', 'liberationsans-regular.ttf', 'helvetica.ttc', 'dejavusans.ttf', 'freesans.ttf')
+
+# Font files for the families the generated decks use
+FAMILY_FILES = {
+    'arial': ('arial.ttf', 'liberationsans-regular.ttf'),
+    'aptos': ('aptos.ttf', 'arial.ttf', 'liberationsans-regular.ttf'),
+    'calibri': ('calibri.ttf', 'carlito-regular.ttf'),
+    'helvetica': ('helvetica.ttc', 'arial.ttf', 'liberationsans-regular.ttf'),
+}
+
+
+class FontMetrics:
+    """A loaded font at one size, with advance widths cached per character."""
+
+    __slots__ = ('font', 'size', '_advances')
+
+    def __init__(self, font, size):
+        self.font = font
+        self.size = size
+        self._advances = {}
+
+    def advance(self, char):
+        width = self._advances.get(char)
+        if width is None:
+            width = self.font.getlength(char)
+            self._advances[char] = width
+        return width
+
+    def width(self, text):
+        """Width of text in pixels from the cached advances (kerning is ignored)."""
+        advance = self.advance
+        return sum(advance(char) for char in text)
+
+
+class FontRegistry:
+    """Resolves (family, size) to FontMetrics, loading each font file at most once per size.
+
+    The font directories are indexed on first use, so a missing family costs one
+    dictionary lookup instead of Pillow's directory search on every call.
+    """
+
+    def __init__(self, font_dirs=None):
+        self.font_dirs = font_dirs or FONT_DIRS
+        self._files = None
+        self._fonts = {}
+        self._lock = threading.Lock()
+
+    def get(self, family, size):
+        """FontMetrics for family at size pixels; Pillow's default font when no file can be found."""
+        key = ((family or '').lower(), int(size))
+        metrics = self._fonts.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._fonts.get(key)
+                if metrics is None:
+                    metrics = FontMetrics(self._load(key[0], key[1]), key[1])
+                    self._fonts[key] = metrics
+        return metrics
+
+    def _load(self, family, size):
+        path = self.resolve(family)
+        if path:
+            try:
+                return ImageFont.truetype(path, size)
+            except Exception as e:
+                logger.warning(f"Error loading font {path}: {str(e)}")
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            return ImageFont.load_default()
+
+    def resolve(self, family):
+        """Path of the font file used for family, or None."""
+        if self._files is None:
+            self._files = self._discover()
+        candidates = (f"{family}.ttf",) + FAMILY_FILES.get(family, ()) + FALLBACK_FILES
+        for name in candidates:
+            path = self._files.get(name)
+            if path:
+                return path
+        return None
+
+    def _discover(self):
+        files = {}
+        for font_dir in self.font_dirs:
+            for root, _, names in os.walk(font_dir):
+                for name in names:
+                    if name.lower().endswith(('.ttf', '.ttc', '.otf')):
+                        files.setdefault(name.lower(), os.path.join(root, name))
+        logger.info(f"Font registry found {len(files)} font files")
+        return files
+
+
+def wrap_text(text, metrics, max_width):
+    """Greedy word wrap of one line of text into lines no wider than max_width.
+
+    Each word is measured once and line widths are accumulated, so wrapping is
+    linear in the length of the text. A word wider than max_width gets a line of its own.
+    """
+    space = metrics.advance(' ')
+    lines = []
+    current = ''
+    current_width = 0.0
+    for word in text.split(' '):
+        word_width = metrics.width(word)
+        if not current:
+            current, current_width = word, word_width
+        elif current_width + space + word_width <= max_width:
+            current = f"{current} {word}"
+            current_width += space + word_width
+        else:
+            lines.append(current)
+            current, current_width = word, word_width
+    if current:
+        lines.append(current)
+    return lines
+
+
+_font_registry = None
+_font_registry_lock = threading.Lock()
+
+
+def get_font_registry():
+    """Return the process-wide FontRegistry."""
+    global _font_registry
+    with _font_registry_lock:
+        if _font_registry is None:
+            _font_registry = FontRegistry()
+        return _font_registry
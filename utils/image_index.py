@@ -0,0 +1,103 @@
+"""
+Image metadata index shared by the layout routines.
+Reads each screenshot's header once so sizing code never has to reopen the file.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from PIL import Image
+
+
+class ImageInfo:
+    """Header-level facts about one image file."""
+
+    __slots__ = ('path', 'width', 'height', 'aspect_ratio', 'mode', 'format', 'byte_size', 'content_hash')
+
+    def __init__(self, path, width, height, mode, format, byte_size, content_hash):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.aspect_ratio = width / height
+        self.mode = mode
+        self.format = format
+        self.byte_size = byte_size
+        self.content_hash = content_hash
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def __repr__(self):
+        return f"ImageInfo({os.path.basename(self.path)!r}, {self.width}x{self.height}, {self.mode})"
+
+
+class ImageIndex:
+    """Path -> ImageInfo map built in one pass over the folder structure.
+
+    Paths that were not indexed up front (temporary crops, for example) are
+    read on first lookup and cached like any other entry.
+    """
+
+    def __init__(self, logger=None):
+        self.logger = logger or logging.getLogger(__name__)
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def build(self, folder_structure):
+        """Index every image in a folder structure, skipping files that cannot be read."""
+        indexed = 0
+        for image_paths in folder_structure.values():
+            for image_path in image_paths:
+                try:
+                    self.get(image_path)
+                    indexed += 1
+                except Exception as e:
+                    self.logger.warning(f"Could not index image {image_path}: {str(e)}")
+        self.logger.info(f"Indexed {indexed} images")
+        return self
+
+    def get(self, image_path):
+        """Return the ImageInfo for a path, reading its header if it has not been seen yet.
+
+        Raises the same errors as PIL.Image.open for unreadable files.
+        """
+        key = os.path.normpath(image_path)
+        info = self._records.get(key)
+        if info is None:
+            info = self.read(image_path)
+            with self._lock:
+                self._records[key] = info
+        return info
+
+    def size(self, image_path):
+        """Return (width, height) for a path."""
+        return self.get(image_path).size
+
+    def aspect_ratio(self, image_path):
+        """Return width / height for a path."""
+        return self.get(image_path).aspect_ratio
+
+    def __contains__(self, image_path):
+        return os.path.normpath(image_path) in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    @staticmethod
+    def read(image_path):
+        """Read one image's header and hash its bytes."""
+        # Image.open only parses the header; pixel data is never decoded here
+        with Image.open(image_path) as img:
+            width, height = img.size
+            mode = img.mode
+            format = img.format
+
+        # SHA-1 matches the digest python-pptx uses to deduplicate image parts
+        digest = hashlib.sha1()
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+
+        return ImageInfo(image_path, width, height, mode, format, os.path.getsize(image_path), digest.hexdigest())
@@ -9,11 +9,70 @@ from PIL import Image
 from pptx.util import Inches
 from pptx.dml.color import RGBColor
 from pptx.util import Pt
+from .image_index import ImageIndex
+from .image_workers import get_image_executor
+from .media_encoding import PNG_COMPRESS_LEVEL, encode_png
+from .media_cache import cached_variant
 
 
 class ImageProcessor:
-    def __init__(self, logger):
+    def __init__(self, logger, image_index=None):
         self.logger = logger
+        self.image_index = image_index or ImageIndex(logger)
+        self._crop_futures = {}
+        self._pending = []
+        self._temp_files = []
+
+    def submit_temp_task(self, fn, *args):
+        """Run fn on the image thread pool; cleanup_temp_files waits for it before removing temporary files."""
+        future = get_image_executor().submit(fn, *args)
+        self._pending.append(future)
+        return future
+
+    def prefetch_crops(self, image_paths, target_height_px=774):
+        """Start cropping images in the background so layout code finds them ready."""
+        queued = 0
+        for image_path in image_paths:
+            key = (os.path.normpath(image_path), target_height_px)
+            try:
+                if key in self._crop_futures or self.image_index.get(image_path).height <= target_height_px:
+                    continue
+            except Exception:
+                continue
+            self._crop_futures[key] = self.submit_temp_task(self._crop_to_temp_file, image_path, target_height_px)
+            queued += 1
+        if queued:
+            self.logger.info(f"Queued {queued} background crops to {target_height_px}px")
+
+    def write_temp_png(self, data):
+        """Write PNG bytes to a tracked temporary file and return its path."""
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
+        temp_file.write(data)
+        temp_file.close()
+        self._temp_files.append(temp_file.name)
+        return temp_file.name
+
+    def save_temp_png(self, img):
+        """Encode an image to a tracked temporary PNG and return its path."""
+        return self.write_temp_png(encode_png(img))
+
+    def cleanup_temp_files(self):
+        """Remove temporary crops once generation has finished, successfully or not."""
+        pending, self._pending = self._pending, []
+        self._crop_futures.clear()
+        for future in pending:
+            # A task that already started writes its temp file anyway; wait so that file is removed too
+            if not future.cancel():
+                try:
+                    future.result()
+                except Exception:
+                    pass
+        temp_files, self._temp_files = self._temp_files, []
+        for temp_path in temp_files:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
 
     def _add_image_to_slide(self, slide, img_path, x, y, width, height, folder_name):
         """Add an image to a slide with proper formatting."""
@@ -60,55 +119,62 @@ class ImageProcessor:
     def _crop_image_from_bottom(self, image_path, target_height_px=774):
         """Crop image from bottom to specified height and save to temporary file."""
         try:
-            with Image.open(image_path) as img:
-                original_width, original_height = img.size
+            original_width, original_height = self.image_index.size(image_path)
 
-                if original_height <= target_height_px:
-                    # No cropping needed, return original path
-                    return image_path
+            if original_height <= target_height_px:
+                # No cropping needed, return original path
+                return image_path
 
-                # Crop from bottom: keep top portion
-                cropped_img = img.crop((0, 0, original_width, target_height_px))
-
-                # Save to temporary file
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                cropped_img.save(temp_file.name, format='PNG')
-                temp_file.close()
+            # Each prefetched crop is handed out once, since callers may delete it after use
+            future = self._crop_futures.pop((os.path.normpath(image_path), target_height_px), None)
+            temp_path = future.result() if future else self._crop_to_temp_file(image_path, target_height_px)
 
-                self.logger.info(f"Cropped image {image_path} from {original_height}px to {target_height_px}px height")
-                return temp_file.name
+            self.logger.info(f"Cropped image {image_path} from {original_height}px to {target_height_px}px height")
+            return temp_path
 
         except Exception as e:
             self.logger.error(f"Error cropping image {image_path}: {str(e)}")
             return image_path  # Return original if cropping fails
 
+    def _crop_to_temp_file(self, image_path, target_height_px):
+        """Keep the top target_height_px rows of an image and write them to a temporary PNG."""
+        def crop():
+            with Image.open(image_path) as img:
+                return encode_png(img.crop((0, 0, img.width, target_height_px)))
+
+        info = self.image_index.get(image_path)
+        data = cached_variant(info.content_hash, 'crop_top',
+                              {'height': target_height_px, 'png_level': PNG_COMPRESS_LEVEL}, crop)
+        # Callers may delete the returned file, so cached bytes are always copied out
+        return self.write_temp_png(data)
+
     def _calculate_image_dimensions(self, image_path, target_width=None, target_height=None, max_width=None, max_height=None):
         """Calculate appropriate dimensions for an image while maintaining aspect ratio."""
         try:
-            with Image.open(image_path) as img:
-                original_width, original_height = img.size
-                aspect_ratio = original_width / original_height
-
-                if target_height and not target_width:
-                    # Fixed height, calculate width
-                    height = target_height
-                    width = height * aspect_ratio
-                    if max_width and width > max_width:
-                        width = max_width
-                        height = width / aspect_ratio
-                elif target_width and not target_height:
-                    # Fixed width, calculate height
-                    width = target_width
+            info = self.image_index.get(image_path)
+            original_width, original_height = info.size
+            aspect_ratio = info.aspect_ratio
+
+            if target_height and not target_width:
+                # Fixed height, calculate width
+                height = target_height
+                width = height * aspect_ratio
+                if max_width and width > max_width:
+                    width = max_width
                     height = width / aspect_ratio
-                    if max_height and height > max_height:
-                        height = max_height
-                        width = height * aspect_ratio
-                else:
-                    # Use provided dimensions or defaults
-                    width = target_width or original_width
-                    height = target_height or original_height
-
-                return width, height, aspect_ratio
+            elif target_width and not target_height:
+                # Fixed width, calculate height
+                width = target_width
+                height = width / aspect_ratio
+                if max_height and height > max_height:
+                    height = max_height
+                    width = height * aspect_ratio
+            else:
+                # Use provided dimensions or defaults
+                width = target_width or original_width
+                height = target_height or original_height
+
+            return width, height, aspect_ratio
         except Exception as e:
             self.logger.error(f"Error calculating dimensions for {image_path}: {str(e)}")
             return target_width or Inches(2), target_height or Inches(2), 1.0
@@ -116,13 +182,13 @@ class ImageProcessor:
     def _resize_image_if_needed(self, image_path, max_width_px=1920, max_height_px=1080):
         """Resize image if it's too large, return path to processed image."""
         try:
-            with Image.open(image_path) as img:
-                width, height = img.size
+            width, height = self.image_index.size(image_path)
 
-                # Check if resize is needed
-                if width <= max_width_px and height <= max_height_px:
-                    return image_path
+            # Check if resize is needed
+            if width <= max_width_px and height <= max_height_px:
+                return image_path
 
+            with Image.open(image_path) as img:
                 # Calculate new size maintaining aspect ratio
                 ratio = min(max_width_px / width, max_height_px / height)
                 new_width = int(width * ratio)
@@ -132,9 +198,7 @@ class ImageProcessor:
                 resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
                 # Save to temporary file
-                temp_fd, temp_path = tempfile.mkstemp(suffix='.png')
-                os.close(temp_fd)
-                resized_img.save(temp_path, 'PNG')
+                temp_path = self.save_temp_png(resized_img)
 
                 self.logger.info(f"Resized image from {width}x{height} to {new_width}x{new_height}")
                 return temp_path
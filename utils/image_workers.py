@@ -0,0 +1,34 @@
+"""
+Shared thread pool for Pillow decode, resize, crop and encode work.
+Pillow releases the GIL while it codes and filters pixels, so threads scale across cores.
+"""
+
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def image_thread_count():
+    """Threads used for image work in each generation process, from IMAGE_THREADS or the CPU count."""
+    try:
+        count = int(os.environ.get('IMAGE_THREADS', 0))
+    except ValueError:
+        count = 0
+    return count if count > 0 else (os.cpu_count() or 1)
+
+
+def get_image_executor():
+    """Return the process-wide image thread pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            count = image_thread_count()
+            _executor = ThreadPoolExecutor(max_workers=count, thread_name_prefix='mlr-image')
+            logger.info(f"Image thread pool started with {count} threads")
+        return _executor
@@ -0,0 +1,251 @@
+"""
+Background job queue for presentation generation.
+Runs uploads through the generator off the request thread and tracks job status on disk.
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import logging
+import threading
+import traceback
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable
+
+from .atomic_file import atomic_write
+
+logger = logging.getLogger(__name__)
+
+JOB_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+# Each process with jobs touches a heartbeat file this often; an owner silent for HEARTBEAT_STALE_SECONDS is gone
+HEARTBEAT_SECONDS = 10
+HEARTBEAT_STALE_SECONDS = 60
+
+# How often each process deletes job records older than JOB_RECORD_TTL_HOURS
+PRUNE_INTERVAL_SECONDS = 60 * 60
+
+
+class JobQueue:
+    """Executor-backed job queue whose status records live on disk so every web worker can read them.
+
+    Jobs run on threads of the web worker that accepted them (generation itself
+    runs in that worker's process pool), so a job dies with its worker. That is
+    why gunicorn runs without --max-requests and with gthread workers, whose
+    timeout does not fire during a long request. Each record names its owner by a
+    per-process token with a heartbeat file, so jobs of a worker that exited, even
+    one whose PID was reused after a container restart, are marked failed.
+    """
+
+    def __init__(self, jobs_dir: str, max_workers: int = 2, record_ttl_hours: float = 24):
+        self.jobs_dir = jobs_dir
+        self.max_workers = max_workers
+        self.record_ttl = record_ttl_hours * 60 * 60
+        self._heartbeat_dir = os.path.join(jobs_dir, '.workers')
+        os.makedirs(self._heartbeat_dir, exist_ok=True)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='mlr-job')
+        self._lock = threading.Lock()
+        # Set per process on first submit, so workers forked from a preloaded app get their own
+        self._worker_token = None
+        self._worker_pid = None
+
+        logger.info(f"JobQueue initialized - {max_workers} executor threads, records in {jobs_dir}")
+
+    def submit(self, job_type: str, func: Callable[..., Dict[str, Any]], *args, metadata: Optional[Dict[str, Any]] = None,
+               job_id: Optional[str] = None, **kwargs) -> str:
+        """Queue a job and return its ID immediately.
+
+        ``func`` must return a result dictionary with a ``success`` key, the same
+        shape the upload processing helpers already return. ``job_id`` may be
+        reserved in advance with ``new_job_id``.
+        """
+        job_id = job_id or self.new_job_id()
+        record = {
+            'job_id': job_id,
+            'type': job_type,
+            'status': 'queued',
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'worker_pid': os.getpid(),
+            'worker_token': self._start_heartbeat(),
+            'result': None,
+            'error': None
+        }
+        if metadata:
+            record.update(metadata)
+
+        self._write_record(record)
+        self._executor.submit(self._run, job_id, func, args, kwargs)
+
+        logger.info(f"Queued {job_type} job {job_id}")
+        return job_id
+
+    @staticmethod
+    def new_job_id() -> str:
+        return uuid.uuid4().hex
+
+    def is_active(self, job_id: str) -> bool:
+        """Check whether a job is still queued or running."""
+        record = self.get_job(job_id)
+        return record is not None and record['status'] in ACTIVE_STATUSES
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the status record for a job, or None if it does not exist."""
+        if not JOB_ID_PATTERN.match(job_id or ''):
+            return None
+
+        record = self._read_record(job_id)
+        if record is None:
+            return None
+
+        # A job whose owning worker has exited (e.g. gunicorn killed it, or the container restarted) will never finish
+        if record['status'] in ACTIVE_STATUSES and not self._owner_alive(record):
+            logger.warning(f"Job {job_id} owner process {record.get('worker_pid')} is gone, marking as failed")
+            record = self._update(job_id, status='failed', finished_at=datetime.now().isoformat(),
+                                  error='Worker exited before the job finished') or record
+
+        return record
+
+    def _run(self, job_id: str, func: Callable[..., Dict[str, Any]], args, kwargs):
+        """Execute a job in an executor thread and record its outcome."""
+        self._update(job_id, status='running', started_at=datetime.now().isoformat())
+        logger.info(f"Job {job_id} started")
+
+        try:
+            result = func(*args, **kwargs) or {}
+        except Exception as e:
+            logger.error(f"Job {job_id} raised: {str(e)}")
+            logger.error(f"Job traceback: {traceback.format_exc()}")
+            result = {'success': False, 'error': str(e)}
+
+        if result.get('success'):
+            self._update(job_id, status='completed', finished_at=datetime.now().isoformat(), result=result)
+            logger.info(f"Job {job_id} completed")
+        else:
+            error = result.get('error') or result.get('message') or 'Processing failed'
+            self._update(job_id, status='failed', finished_at=datetime.now().isoformat(), result=result, error=error)
+            logger.error(f"Job {job_id} failed: {error}")
+
+    def _update(self, job_id: str, **fields) -> Optional[Dict[str, Any]]:
+        """Merge fields into a job record."""
+        with self._lock:
+            record = self._read_record(job_id)
+            if record is None:
+                return None
+            record.update(fields)
+            self._write_record(record)
+            return record
+
+    def _record_path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def _read_record(self, job_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._record_path(job_id), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading job record {job_id}: {str(e)}")
+            return None
+
+    def _write_record(self, record: Dict[str, Any]):
+        with atomic_write(self._record_path(record['job_id'])) as f:
+            json.dump(record, f, default=str)
+
+    def prune_records(self) -> int:
+        """Delete records of finished or orphaned jobs not updated for the record TTL; returns the number deleted."""
+        cutoff = time.time() - self.record_ttl
+        pruned = 0
+        for name in os.listdir(self.jobs_dir):
+            path = os.path.join(self.jobs_dir, name)
+            try:
+                if not name.endswith(('.json', '.tmp')) or os.path.getmtime(path) >= cutoff:
+                    continue
+                if name.endswith('.json'):
+                    record = self._read_record(name[:-len('.json')])
+                    if record is not None and record['status'] in ACTIVE_STATUSES and self._owner_alive(record):
+                        continue
+                os.remove(path)
+                pruned += 1
+            except FileNotFoundError:
+                # Another worker pruned it first
+                continue
+
+        # Heartbeats of workers that exited long ago
+        for name in os.listdir(self._heartbeat_dir):
+            path = os.path.join(self._heartbeat_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except FileNotFoundError:
+                continue
+
+        if pruned:
+            logger.info(f"Pruned {pruned} job records older than {self.record_ttl / 3600:g} hours")
+        return pruned
+
+    def _start_heartbeat(self) -> str:
+        """Return this process's worker token, starting its heartbeat thread on first use."""
+        with self._lock:
+            if self._worker_pid != os.getpid():
+                self._worker_token = uuid.uuid4().hex
+                self._worker_pid = os.getpid()
+                self._touch_heartbeat(self._worker_token)
+                threading.Thread(target=self._heartbeat_loop, args=(self._worker_token,),
+                                 name='mlr-job-heartbeat', daemon=True).start()
+            return self._worker_token
+
+    def _heartbeat_loop(self, token: str):
+        next_prune = time.monotonic()
+        while True:
+            try:
+                self._touch_heartbeat(token)
+                if time.monotonic() >= next_prune:
+                    next_prune = time.monotonic() + PRUNE_INTERVAL_SECONDS
+                    self.prune_records()
+            except Exception as e:
+                logger.error(f"Job heartbeat error: {str(e)}")
+            time.sleep(HEARTBEAT_SECONDS)
+
+    def _touch_heartbeat(self, token: str):
+        path = os.path.join(self._heartbeat_dir, token)
+        with open(path, 'a'):
+            os.utime(path)
+
+    def _owner_alive(self, record: Dict[str, Any]) -> bool:
+        """True while the process that queued a job still beats; PIDs alone repeat across container restarts."""
+        token = record.get('worker_token')
+        if not token:
+            # Records from before worker tokens have no owner that can still be running
+            return False
+        if token == self._worker_token and self._worker_pid == os.getpid():
+            return True
+        try:
+            age = time.time() - os.path.getmtime(os.path.join(self._heartbeat_dir, token))
+        except OSError:
+            return False
+        return age < HEARTBEAT_STALE_SECONDS
+
+
+# Global instance
+job_queue = None
+
+def initialize_job_queue(jobs_dir: Optional[str] = None, max_workers: Optional[int] = None):
+    """Initialize the background job queue."""
+    global job_queue
+    jobs_dir = jobs_dir or os.path.join(os.getcwd(), 'outputs', '.jobs')
+    max_workers = max_workers or int(os.environ.get('JOB_QUEUE_WORKERS', 2))
+    try:
+        record_ttl_hours = float(os.environ.get('JOB_RECORD_TTL_HOURS', 24))
+    except ValueError:
+        record_ttl_hours = 24
+    job_queue = JobQueue(jobs_dir, max_workers=max_workers, record_ttl_hours=record_ttl_hours)
+    return job_queue
@@ -0,0 +1,312 @@
+"""
+Declarative layout tables for the fixed-position ad formats.
+Specs are written in centimetres, compiled once at import into EMU frames and placed by one engine.
+"""
+
+import os
+import logging
+from functools import lru_cache
+from pptx.util import Inches, Pt
+from pptx.dml.color import RGBColor
+
+CM_PER_INCH = 2.54
+
+# Standard 16:9 slide width and the gray title bar every content slide starts with
+SLIDE_WIDTH_CM = 33.87
+TITLE_BAR_CM = 1.79
+
+# How images are matched to frames
+SEQUENTIAL = 'sequential'  # image i -> frame i, extra images are dropped
+ROLE = 'role'              # teaser.png -> frame 0, mainunit.png -> frame 1, others by position
+SIZE = 'size'              # frame chosen by the ad size found in the image path
+
+
+class Frame:
+    """One picture slot; inch values for arithmetic, EMU values for python-pptx."""
+
+    __slots__ = ('x', 'y', 'width', 'height', 'left', 'top', 'emu_width', 'emu_height')
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.left = Inches(x)
+        self.top = Inches(y)
+        self.emu_width = Inches(width)
+        self.emu_height = Inches(height)
+
+    @classmethod
+    def from_cm(cls, x_cm, y_cm, width_cm, height_cm):
+        return cls(x_cm / CM_PER_INCH, y_cm / CM_PER_INCH, width_cm / CM_PER_INCH, height_cm / CM_PER_INCH)
+
+    def __repr__(self):
+        return f"Frame({self.x:.2f}, {self.y:.2f}, {self.width:.2f}x{self.height:.2f}in)"
+
+
+class Layout:
+    """A compiled layout: frames plus how images are assigned to them and how pictures are styled."""
+
+    __slots__ = ('name', 'label', 'frames', 'assign', 'border', 'crop_height')
+
+    def __init__(self, name, label, frames, assign=SEQUENTIAL, border=True, crop_height=None):
+        self.name = name
+        self.label = label
+        self.frames = frames
+        self.assign = assign
+        self.border = border
+        self.crop_height = crop_height
+
+    @property
+    def capacity(self):
+        return len(self.frames)
+
+    def assign_images(self, image_paths, size_key=None):
+        """Yield (index, image_path, frame) in placement order."""
+        if self.assign == SIZE:
+            for index, image_path in enumerate(image_paths):
+                frame = self.frames.get(size_key(image_path))
+                if frame is None:
+                    logging.getLogger(__name__).warning(f"No {self.label} frame for image {image_path}")
+                    continue
+                yield index, image_path, frame
+        elif self.assign == ROLE:
+            for index, image_path in enumerate(image_paths):
+                filename = os.path.basename(image_path).lower()
+                if filename == 'teaser.png':
+                    slot = 0
+                elif filename == 'mainunit.png':
+                    slot = 1
+                else:
+                    slot = 0 if index == 0 else 1
+                yield index, image_path, self.frames[slot]
+        else:
+            for index, image_path in enumerate(image_paths[:len(self.frames)]):
+                yield index, image_path, self.frames[index]
+
+
+def place_images(slide, layout, image_paths, logger=None, image_processor=None, size_key=None, decorate=None):
+    """Add image_paths to slide in the frames of layout.
+
+    decorate(index, image_path, frame) runs right after each picture is added,
+    for labels that belong to it. Returns (index, image_path, frame) for every
+    picture that was added.
+    """
+    logger = logger or logging.getLogger(__name__)
+    placed = []
+    for index, image_path, frame in layout.assign_images(image_paths, size_key):
+        source_path = image_path
+        try:
+            if layout.crop_height:
+                source_path = image_processor._crop_image_from_bottom(image_path, layout.crop_height)
+
+            picture = slide.shapes.add_picture(source_path, frame.left, frame.top, frame.emu_width, frame.emu_height)
+            if layout.border:
+                picture.line.color.rgb = RGBColor(0, 0, 0)
+                picture.line.width = Pt(0.5)
+            if decorate:
+                decorate(index, image_path, frame)
+
+            placed.append((index, image_path, frame))
+            logger.info(f"Added {layout.label} image {index + 1} {os.path.basename(image_path)} at position ({frame.x:.2f}, {frame.y:.2f})")
+
+        except Exception as e:
+            logger.error(f"Error adding {layout.label} image {image_path}: {str(e)}")
+        finally:
+            # add_picture copies the bytes, so a temporary crop can go straight away
+            if source_path != image_path:
+                try:
+                    os.unlink(source_path)
+                except OSError:
+                    pass
+    return placed
+
+
+# --- Layout declarations (centimetres) ---------------------------------------
+
+def _boxes(*boxes_cm):
+    """Frames from (x_cm, y_cm, width_cm, height_cm) tuples."""
+    return tuple(Frame.from_cm(*box) for box in boxes_cm)
+
+
+def _teaser_mainunit(first_cm, second_cm, width_cm, height_cm):
+    """Two same-size frames given their (x_cm, y_cm) corners."""
+    return _boxes((*first_cm, width_cm, height_cm), (*second_cm, width_cm, height_cm))
+
+
+def _desktop_inframe_300x250_grid():
+    # 3x2 grid of fixed 9.48x7.9cm cells centred below the title bar
+    columns, spacing_cm = 3, 0.5
+    width_cm, height_cm = 9.48, 7.9
+    start_y_cm = TITLE_BAR_CM + 0.5
+    start_x_cm = (SLIDE_WIDTH_CM - (columns * width_cm + (columns - 1) * spacing_cm)) / 2
+    return _boxes(*[(start_x_cm + (i % columns) * (width_cm + spacing_cm),
+                     start_y_cm + (i // columns) * (height_cm + spacing_cm),
+                     width_cm, height_cm) for i in range(6)])
+
+
+def _desktop_inframe_300x600_row():
+    # Four columns across the slide with 0.5cm margins and gaps
+    columns, spacing_cm = 4, 0.5
+    start_y_cm = TITLE_BAR_CM + 0.5
+    available_width_cm = SLIDE_WIDTH_CM - 1.0
+    available_height_cm = 19.05 - start_y_cm - 0.5
+    width_cm = (available_width_cm - (columns - 1) * spacing_cm) / columns
+    height_cm = max(15.33, available_height_cm)
+    return _boxes(*[(0.5 + i * (width_cm + spacing_cm), start_y_cm, width_cm, height_cm) for i in range(columns)])
+
+
+def _desktop_inframe_728x90_stack():
+    # Five leaderboards stacked below the title bar, 2.68-3cm tall
+    rows, spacing_cm = 5, 0.3
+    start_y_cm = TITLE_BAR_CM + 0.5
+    available_width_cm = SLIDE_WIDTH_CM - 1.0
+    available_height_cm = 19.05 - start_y_cm - 0.5
+    height_cm = max(2.68, min(3.0, (available_height_cm - (rows - 1) * spacing_cm) / rows))
+    width_cm = min(24.21, available_width_cm)
+    return _boxes(*[(0.5, start_y_cm + i * (height_cm + spacing_cm), width_cm, height_cm) for i in range(rows)])
+
+
+def _mobile_row(count):
+    # Up to four phone screenshots centred as a group below the title bar
+    width_cm, height_cm, spacing_cm = 8.06, 15.67, 0.5
+    if count == 1:
+        start_x_cm = (SLIDE_WIDTH_CM - width_cm) / 2
+        return _boxes((start_x_cm, TITLE_BAR_CM + 0.5, width_cm, height_cm))
+    start_x_cm = (SLIDE_WIDTH_CM - (count * width_cm + (count - 1) * spacing_cm)) / 2
+    return _boxes(*[(start_x_cm + i * (width_cm + spacing_cm), TITLE_BAR_CM + 0.5, width_cm, height_cm)
+                    for i in range(count)])
+
+
+def _mobile_instream_pair(start_x_cm, spacing_cm):
+    width_cm, height_cm = 12.76, 11.28
+    return _boxes((start_x_cm, 4.0, width_cm, height_cm),
+                  (start_x_cm + width_cm + spacing_cm, 4.0, width_cm, height_cm))
+
+
+def _mobile_instream_centered():
+    # Two cropped phone screenshots centred with a 2cm gap
+    return _mobile_instream_pair((33.867 - (2 * 12.76 + 2.0)) / 2, 2.0)
+
+
+def _video_grid():
+    # 3x2 frames spread evenly across the slide width, rows at 3.5cm and 11.3cm
+    columns = 3
+    width = 10.33 / CM_PER_INCH
+    height = 5.81 / CM_PER_INCH
+    row_y = (3.5 / CM_PER_INCH, 11.30 / CM_PER_INCH)
+    spacing_x = (13.33 - columns * width) / (columns + 1)
+    return tuple(Frame(spacing_x + (i % columns) * (width + spacing_x), row_y[i // columns], width, height)
+                 for i in range(6))
+
+
+def _sized(**boxes_cm):
+    """Frames keyed by ad size from size=(x_cm, y_cm, width_cm, height_cm)."""
+    return {size[1:]: Frame.from_cm(*box) for size, box in boxes_cm.items()}
+
+
+_MOBILE_INFRAME_PAIR = _teaser_mainunit((5.02, 2), (18.7, 2), 8.23, 16.02)
+_MOBILE_THREE_UP = _boxes((2.6, 2.17, 8.22, 16), (12.11, 2.17, 8.22, 16), (21.56, 2.17, 8.22, 16))
+
+LAYOUTS = {layout.name: layout for layout in (
+    # Auto placement: teaser/mainunit pairs
+    Layout('desktop_inframe_160x600', 'Desktop In-frame 160x600',
+           _teaser_mainunit((9.93, 2.3), (16.23, 2.3), 4.26, 15.98), assign=ROLE),
+    Layout('desktop_inframe_300x250', 'Desktop In-frame 300x250',
+           _teaser_mainunit((5.35, 4.59), (17.86, 4.59), 10.23, 8.53), assign=ROLE),
+    Layout('desktop_inframe_300x600', 'Desktop In-frame 300x600',
+           _teaser_mainunit((7.63, 2.3), (19.69, 2.3), 7.66, 15.33), assign=ROLE),
+    Layout('desktop_inframe_970x250', 'Desktop In-frame 970x250',
+           _teaser_mainunit((1, 2.41), (1, 10.94), 22.1, 5.7), assign=ROLE),
+    Layout('desktop_inframe_728x90', 'Desktop In-frame 728x90',
+           _teaser_mainunit((1, 3.28), (1, 8.66), 21.67, 2.68), assign=ROLE),
+    Layout('mobile_inframe_300x250', 'Mobile In-frame 300x250', _MOBILE_INFRAME_PAIR, assign=ROLE, border=False),
+    Layout('mobile_inframe_300x600', 'Mobile In-frame 300x600', _MOBILE_INFRAME_PAIR, assign=ROLE, border=False),
+    Layout('mobile_instream', 'Mobile Instream', _mobile_instream_centered(), border=False, crop_height=774),
+
+    # Manual (sequential) placement
+    Layout('desktop_inframe_970x250_manual', 'Manual Desktop In-frame 970x250',
+           _teaser_mainunit((1, 2.41), (1, 10.94), 27.59, 7.12)),
+    Layout('desktop_inframe_970x250_manual_annotated', 'Manual Desktop In-frame 970x250',
+           _teaser_mainunit((1, 2.41), (1, 10.94), 23.7, 6.12)),
+    Layout('desktop_inframe_300x250_manual', 'Manual Desktop In-frame 300x250', _desktop_inframe_300x250_grid()),
+    Layout('desktop_inframe_300x600_manual', 'Manual Desktop In-frame 300x600', _desktop_inframe_300x600_row()),
+    Layout('desktop_inframe_160x600_manual', 'Manual Desktop In-frame 160x600',
+           _boxes(*[(x_cm, 2.3, 4.26, 15.98) for x_cm in (0.83, 5.58, 10.33, 15.01, 19.68, 24.36, 29.04)])),
+    Layout('desktop_inframe_728x90_manual', 'Manual Desktop In-frame 728x90', _desktop_inframe_728x90_stack()),
+    Layout('mobile_inframe_300x250_manual', 'Manual Mobile In-frame 300x250', _MOBILE_INFRAME_PAIR, border=False),
+    Layout('mobile_inframe_300x600_manual', 'Manual Mobile In-frame 300x600', _MOBILE_INFRAME_PAIR, border=False),
+    Layout('mobile_instream_manual', 'Manual Mobile Instream', _mobile_instream_centered(), border=False, crop_height=774),
+    Layout('mobile_instream_manual_first', 'Manual Mobile Instream',
+           _mobile_instream_pair(6.13, 0.5), border=False, crop_height=774),
+    Layout('desktop_expandable_manual', 'Manual Desktop Expandable',
+           _teaser_mainunit((1, 4.69), (17.45, 4.69), 16.02, 8.64)),
+    *[Layout(f'mobile_manual_{count}', 'Manual mobile', _mobile_row(count), border=False) for count in range(1, 5)],
+
+    # Consolidated and special slides
+    Layout('video_grid', 'video', _video_grid()),
+    Layout('desktop_teasers', 'Desktop Expandable teaser', _sized(
+        _970x250=(0.7, 2.13, 17.84, 4.6),
+        _728x90=(0.7, 7.95, 16.55, 2.05),
+        _300x250=(0.7, 11.27, 7.35, 6.13),
+        _300x600=(20.64, 2.17, 7.57, 15.13),
+        _160x600=(28.99, 2.14, 4.04, 15.13)), assign=SIZE),
+    Layout('mobile_teasers', 'Mobile Expandable teaser', _sized(
+        _300x250=(2.6, 2.17, 8.22, 16),
+        _300x600=(12.11, 2.17, 8.22, 16),
+        _320x50=(21.56, 2.17, 8.22, 16)), assign=SIZE, border=False),
+    Layout('mobile_engaged', 'Mobile Expandable engaged', _MOBILE_THREE_UP, border=False),
+)}
+
+# (folder type, size token, layout) in match order; the first hit wins
+AUTO_LAYOUTS = (
+    ('vdxdesktopinframe', '160x600', 'desktop_inframe_160x600'),
+    ('vdxdesktopinframe', '300x250', 'desktop_inframe_300x250'),
+    ('vdxdesktopinframe', '300x600', 'desktop_inframe_300x600'),
+    ('vdxdesktopinframe', '970x250', 'desktop_inframe_970x250'),
+    ('vdxdesktopinframe', '728x90', 'desktop_inframe_728x90'),
+    ('vdxmobileinframe', '300x250', 'mobile_inframe_300x250'),
+    ('vdxmobileinframe', '300x600', 'mobile_inframe_300x600'),
+    ('vdxmobileinstream', '', 'mobile_instream'),
+)
+
+MANUAL_LAYOUTS = (
+    ('vdxdesktopinframe', '300x250', 'desktop_inframe_300x250_manual'),
+    ('vdxdesktopinframe', '300x600', 'desktop_inframe_300x600_manual'),
+    ('vdxdesktopinframe', '160x600', 'desktop_inframe_160x600_manual'),
+    ('vdxdesktopinframe', '728x90', 'desktop_inframe_728x90_manual'),
+)
+
+
+def match_layout(table, folder_name):
+    """Return the layout a folder maps to in table, or None."""
+    lowered = folder_name.lower()
+    for folder_type, size, name in table:
+        # Folder types match case-insensitively, size tokens as written
+        if folder_type in lowered and size in folder_name:
+            return LAYOUTS[name]
+    return None
+
+
+@lru_cache(maxsize=64)
+def grid_frames(num_images, annotation_option='with_annos'):
+    """Cells of the generic auto-fit grid used for formats without a fixed layout.
+
+    Images are fitted inside these cells by aspect ratio, so they are bounds
+    rather than picture frames.
+    """
+    available_width = Inches(12.33).inches
+    available_height = Inches(5.5).inches
+    start_x = Inches(0.5).inches
+    start_y = Inches(TITLE_BAR_CM / CM_PER_INCH + 0.2).inches
+
+    cols = 3 if num_images > 6 else 2
+    rows = (num_images + cols - 1) // cols
+    spacing = 0.25
+    cell_width = (available_width - spacing * (cols - 1)) / cols
+    cell_height = (available_height - spacing * (rows - 1)) / rows
+    # Without annotations each row gets extra room below it
+    row_step = cell_height + spacing + (0.4 if annotation_option == 'no_annos' else 0)
+
+    return tuple(Frame(start_x + (i % cols) * (cell_width + spacing), start_y + (i // cols) * row_step,
+                       cell_width, cell_height) for i in range(num_images))
@@ -0,0 +1,186 @@
+"""
+Persistent cache of processed media variants shared by every worker process.
+Variants are keyed by source hash, operation and parameters, and evicted least-recently-used past a size bound.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from typing import Optional, Dict, Any, Callable
+
+from .atomic_file import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+class MediaCache:
+    """Content-addressed variant store on the local filesystem.
+
+    An empty entry records that the operation produced nothing worth keeping
+    (e.g. a resample that would not shrink the image), so the work is still
+    skipped next time. Reads refresh the entry's mtime, which is what eviction
+    orders by.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Re-scan the directory after roughly a tenth of the budget has been written
+        self._written_since_check = max_bytes
+
+        logger.info(f"MediaCache initialized - {max_bytes} bytes max in {cache_dir}")
+
+    @staticmethod
+    def make_key(source_hash: str, operation: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the key for one variant of a source."""
+        key_data = json.dumps({'source': source_hash, 'op': operation, 'params': params or {}}, sort_keys=True)
+        return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a cached variant (b'' for a recorded no-op), or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Error reading media cache entry {key[:12]}: {str(e)}")
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def get_path(self, key: str) -> Optional[str]:
+        """Return the file holding a cached entry, for serving it without reading it into memory."""
+        path = self._entry_path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            pass
+        return path
+
+    def put(self, key: str, data: bytes):
+        """Store a variant; pass b'' to record that the operation was a no-op."""
+        path = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with atomic_write(path, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            logger.warning(f"Error writing media cache entry {key[:12]}: {str(e)}")
+            return
+
+        self._account(len(data))
+
+    def put_file(self, key: str, source_path: str) -> Optional[str]:
+        """Store a copy of a file as the entry for key and return the entry's path."""
+        path = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with atomic_write(path, 'wb') as f, open(source_path, 'rb') as source:
+                shutil.copyfileobj(source, f, 1024 * 1024)
+            size = os.path.getsize(path)
+        except Exception as e:
+            logger.warning(f"Error writing media cache entry {key[:12]}: {str(e)}")
+            return None
+
+        self._account(size)
+        return path
+
+    def _account(self, size: int):
+        with self._lock:
+            self._written_since_check += size
+            check_needed = self._written_since_check >= self.max_bytes // 10
+            if check_needed:
+                self._written_since_check = 0
+        if check_needed:
+            self.evict()
+
+    def evict(self):
+        """Delete least-recently-used entries until the cache is back under 90% of its bound."""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+
+        logger.info(f"Media cache evicted {removed} entries, {total} bytes remain")
+
+    def _entry_path(self, key: str) -> str:
+        # Fan out over subdirectories so no single directory grows huge
+        return os.path.join(self.cache_dir, key[:2], key)
+
+
+_media_cache = None
+_media_cache_lock = threading.Lock()
+
+def get_media_cache() -> Optional[MediaCache]:
+    """Return the process-wide media cache, or None when MEDIA_CACHE_MAX_MB is 0."""
+    global _media_cache
+    with _media_cache_lock:
+        if _media_cache is None:
+            try:
+                max_mb = int(os.environ.get('MEDIA_CACHE_MAX_MB', 1024))
+            except ValueError:
+                max_mb = 1024
+            if max_mb <= 0:
+                return None
+            cache_dir = os.environ.get('MEDIA_CACHE_DIR') or os.path.join(os.getcwd(), 'outputs', '.cache', 'media')
+            _media_cache = MediaCache(cache_dir, max_mb * 1024 * 1024)
+        return _media_cache
+
+
+def cached_variant(source_hash: Optional[str], operation: str, params: Dict[str, Any],
+                   produce: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+    """Return a variant from the media cache, producing and storing it on a miss.
+
+    ``produce`` returns the encoded variant, or None when the source should be
+    used unchanged; that outcome is cached too.
+    """
+    cache = get_media_cache()
+    if cache is None or not source_hash:
+        return produce()
+
+    key = cache.make_key(source_hash, operation, params)
+    data = cache.get(key)
+    if data is not None:
+        return data or None
+
+    data = produce()
+    cache.put(key, data or b'')
+    return data
@@ -0,0 +1,117 @@
+"""
+Codec selection for embedded pictures.
+Chooses between truecolor PNG, palette PNG and JPEG per image, keeping lossy results within a PSNR budget.
+"""
+
+import io
+import os
+import math
+from PIL import Image, ImageChops, ImageStat
+
+# zlib level 3 encodes screenshots about 2.5x faster than the default 6 for ~2% more bytes
+PNG_COMPRESS_LEVEL = 3
+JPEG_QUALITY = 90
+
+# A lossy encoding has to beat the best lossless one by this much to be worth the artifacts
+LOSSY_MIN_GAIN = 0.85
+
+
+def media_min_psnr():
+    """Lowest PSNR in dB a lossy encoding may have, from MEDIA_MIN_PSNR (0 allows lossless encodings only)."""
+    try:
+        return max(0.0, float(os.environ.get('MEDIA_MIN_PSNR', 40)))
+    except ValueError:
+        return 40.0
+
+
+def psnr(original, encoded):
+    """Peak signal-to-noise ratio in dB between two images of the same size; inf when identical."""
+    if encoded.mode != original.mode:
+        encoded = encoded.convert(original.mode)
+    rms = ImageStat.Stat(ImageChops.difference(original, encoded)).rms
+    mse = sum(value * value for value in rms) / len(rms)
+    return math.inf if mse == 0 else 10 * math.log10(255 * 255 / mse)
+
+
+def flatten_alpha(img):
+    """Drop an alpha channel that is fully opaque everywhere."""
+    if img.mode == 'RGBA' and img.getextrema()[3][0] == 255:
+        return img.convert('RGB')
+    return img
+
+
+def encode_png(img):
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
+
+def encode_jpeg(img):
+    buffer = io.BytesIO()
+    img.save(buffer, format='JPEG', quality=JPEG_QUALITY)
+    return buffer.getvalue()
+
+
+def encoded_format(data):
+    """'JPEG' or 'PNG' from the leading bytes of an encoded image."""
+    return 'JPEG' if data[:3] == b'\xff\xd8\xff' else 'PNG'
+
+
+class ImageEncoder:
+    """Picks the smallest encoding of a decoded image that stays within the fidelity budget.
+
+    Screenshots with few colors become palette PNGs, which is lossless when an
+    RGB image has 256 colors or fewer. Otherwise a quantized palette or a JPEG
+    is used only if it meets min_psnr and is clearly smaller than the truecolor
+    PNG.
+    """
+
+    def __init__(self, min_psnr=None):
+        self.min_psnr = media_min_psnr() if min_psnr is None else min_psnr
+
+    def settings(self):
+        """Parameters that change the encoder's output; part of cache keys."""
+        return {'min_psnr': self.min_psnr, 'png_level': PNG_COMPRESS_LEVEL, 'jpeg_quality': JPEG_QUALITY}
+
+    def encode(self, img, source_format='PNG'):
+        """Return the chosen encoding of img as bytes."""
+        if source_format == 'JPEG':
+            # Photographic source: stay with JPEG rather than inflating it to PNG
+            return encode_jpeg(img.convert('RGB'))
+
+        img = flatten_alpha(img)
+        if img.mode not in ('RGB', 'RGBA'):
+            return encode_png(img)
+
+        lossless = best = encode_png(img)
+        candidates = [self._palette(img)]
+        if self.min_psnr and img.mode == 'RGB':
+            candidates.append(None)  # JPEG
+
+        for candidate in candidates:
+            if candidate is None:
+                data = encode_jpeg(img)
+                with Image.open(io.BytesIO(data)) as decoded:
+                    quality = psnr(img, decoded)
+            else:
+                data = encode_png(candidate)
+                quality = psnr(img, candidate)
+
+            if quality == math.inf:
+                if len(data) < len(best):
+                    best = data
+            elif self.min_psnr and quality >= self.min_psnr and len(data) < min(len(best), len(lossless) * LOSSY_MIN_GAIN):
+                best = data
+        return best
+
+    @staticmethod
+    def _palette(img):
+        """Palette version of img; exact for RGB images with 256 colors or fewer."""
+        colors = img.getcolors(256)
+        if colors is not None and img.mode == 'RGB':
+            palette = Image.new('P', (1, 1))
+            palette.putpalette([channel for _, color in colors for channel in color])
+            return img.quantize(palette=palette, dither=Image.Dither.NONE)
+
+        # Fast octree is the quantizer Pillow supports for RGBA; no dithering keeps flat UI colors flat
+        return img.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
@@ -0,0 +1,166 @@
+"""
+Media preprocessing for generated presentations.
+Resamples each embedded picture to the pixel size its largest placement needs and re-encodes it before the deck is saved.
+"""
+
+import io
+import os
+import math
+import logging
+from PIL import Image
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.packuri import PackURI
+
+from .media_encoding import ImageEncoder, encoded_format
+
+EMU_PER_INCH = 914400
+
+# Only resample when the source is meaningfully larger than the target
+DOWNSCALE_THRESHOLD = 1.1
+
+RESAMPLE_FORMATS = ('PNG', 'JPEG')
+
+MEDIA_TYPES = {'PNG': ('png', CT.PNG), 'JPEG': ('jpg', CT.JPEG)}
+
+
+def media_target_dpi():
+    """Pixel density embedded pictures are resampled to, from MEDIA_TARGET_DPI (0 keeps source sizes)."""
+    try:
+        return max(0, int(os.environ.get('MEDIA_TARGET_DPI', 150)))
+    except ValueError:
+        return 150
+
+
+def media_settings():
+    """Settings that change the media written into a deck; part of the result cache key."""
+    return {'target_dpi': media_target_dpi(), 'encoder': ImageEncoder().settings()}
+
+
+def _iter_pictures(shapes):
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from _iter_pictures(shape.shapes)
+        elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            yield shape
+
+
+class MediaPipeline:
+    """Collects every picture placement in a deck, then downsamples and re-encodes the image parts behind them."""
+
+    def __init__(self, logger=None, target_dpi=None, encoder=None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.target_dpi = media_target_dpi() if target_dpi is None else target_dpi
+        self.encoder = encoder or ImageEncoder()
+
+    def collect_targets(self, slides):
+        """Map each image part to the largest (width, height) in pixels any of its placements on slides needs."""
+        targets = {}
+        for slide in slides:
+            for picture in _iter_pictures(slide.shapes):
+                try:
+                    part = slide.part.related_part(picture._element.blip_rId)
+                except (KeyError, AttributeError):
+                    continue
+
+                # A cropped picture shows only part of the image at the placed size
+                visible_w = max(1.0 - picture.crop_left - picture.crop_right, 0.01)
+                visible_h = max(1.0 - picture.crop_top - picture.crop_bottom, 0.01)
+                need_w = picture.width / EMU_PER_INCH * self.target_dpi / visible_w
+                need_h = picture.height / EMU_PER_INCH * self.target_dpi / visible_h
+
+                current = targets.get(part, (0.0, 0.0))
+                targets[part] = (max(current[0], need_w), max(current[1], need_h))
+        return targets
+
+    def process(self, prs):
+        """Resample and re-encode pictures in place; returns (images rewritten, bytes saved)."""
+        rewritten, saved = self.process_slides(prs.slides)
+        self.logger.info(f"Media pipeline rewrote {rewritten} images (target {self.target_dpi} DPI), saving {saved} bytes")
+        return rewritten, saved
+
+    def process_slides(self, slides, skip=()):
+        """Resample and re-encode the pictures placed on slides, leaving parts in skip untouched."""
+        from .image_workers import get_image_executor
+
+        targets = self.collect_targets(slides)
+        parts = [part for part in targets if part not in skip]
+
+        # Decode/resample/encode runs on the image thread pool; Pillow drops the GIL for all three
+        blobs = get_image_executor().map(lambda part: self.optimize_part(part, targets[part]), parts)
+
+        rewritten = 0
+        saved = 0
+        for part, blob in zip(parts, blobs):
+            if blob is not None:
+                saved += len(part.blob) - len(blob)
+                part._blob = blob
+                self._match_media_type(part, encoded_format(blob))
+                rewritten += 1
+        return rewritten, saved
+
+    def optimize_part(self, part, target):
+        """Optimize an image part's blob, reusing a variant from the media cache when one exists."""
+        from .media_cache import cached_variant
+
+        # Whole pixels keep the cache key stable across tiny EMU differences
+        target = (math.ceil(target[0]), math.ceil(target[1]))
+        params = {'size': list(target), 'encoder': self.encoder.settings()}
+        return cached_variant(part.sha1, 'optimize', params, lambda: self.optimize(part.blob, target))
+
+    def optimize(self, blob, target):
+        """Return a smaller encoding of blob, resampled to target if it is oversized, or None to keep the original."""
+        try:
+            with Image.open(io.BytesIO(blob)) as img:
+                if img.format not in RESAMPLE_FORMATS:
+                    return None
+
+                src_w, src_h = img.size
+                image_format = img.format
+                # One scale for both axes keeps the aspect ratio and satisfies the denser direction
+                scale = max(target[0] / src_w, target[1] / src_h) if self.target_dpi else 1.0
+                downscale = scale * DOWNSCALE_THRESHOLD < 1.0
+
+                # Re-encoding a JPEG at its own size would only add artifacts
+                if image_format == 'JPEG' and not downscale:
+                    return None
+
+                if downscale:
+                    size = (max(1, round(src_w * scale)), max(1, round(src_h * scale)))
+                    # JPEG can decode straight at a reduced scale
+                    if image_format == 'JPEG':
+                        img.draft('RGB', size)
+                    img = self._resample_mode(img)
+                    img = img.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+                else:
+                    img = self._resample_mode(img)
+                    img.load()
+
+            data = self.encoder.encode(img, image_format)
+            return data if len(data) < len(blob) else None
+
+        except Exception as e:
+            self.logger.warning(f"Could not optimize image: {str(e)}")
+            return None
+
+    @staticmethod
+    def _match_media_type(part, image_format):
+        """Give a part whose codec changed the content type and partname extension of the new one."""
+        ext, content_type = MEDIA_TYPES[image_format]
+        if part._content_type == content_type:
+            return
+        part._content_type = content_type
+        # python-pptx caches content_type as a lazyproperty on first read
+        part.__dict__.pop('content_type', None)
+        # python-pptx numbers images independently of extension, so keeping the number stays unique and
+        # gives the same partname whenever the part is processed
+        part.partname = PackURI(f"{part.partname.rsplit('.', 1)[0]}.{ext}")
+
+    @staticmethod
+    def _resample_mode(img):
+        """Convert modes that cannot be filtered (palette, 1-bit, 16-bit) to RGB/RGBA."""
+        if img.mode in ('RGB', 'RGBA', 'L'):
+            return img
+        if img.mode in ('LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info):
+            return img.convert('RGBA')
+        return img.convert('RGB')
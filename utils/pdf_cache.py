@@ -0,0 +1,114 @@
+"""
+Disk cache of PDFs converted from generated decks.
+Keyed by the PPTX content hash and render settings, so repeat conversions of the same deck are served from disk.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional
+
+from .media_cache import MediaCache
+from .streaming_upload import hash_file
+
+logger = logging.getLogger(__name__)
+
+_pdf_cache = None
+_pdf_cache_lock = threading.Lock()
+
+# Content hashes by (path, size, mtime), so a deck is hashed once per process rather than per request;
+# least recently used entries are dropped past DECK_HASH_MEMO_ENTRIES
+_deck_hashes = OrderedDict()
+DECK_HASH_MEMO_ENTRIES = 1024
+
+# One lock per cache key while any request holds or waits on it, as [lock, users]:
+# concurrent requests for the same deck wait for a single conversion
+_conversion_locks = {}
+
+
+def get_pdf_cache() -> Optional[MediaCache]:
+    """Return the process-wide PDF cache, or None when PDF_CACHE_MAX_MB is 0."""
+    global _pdf_cache
+    with _pdf_cache_lock:
+        if _pdf_cache is None:
+            try:
+                max_mb = int(os.environ.get('PDF_CACHE_MAX_MB', 2048))
+            except ValueError:
+                max_mb = 2048
+            if max_mb <= 0:
+                return None
+            cache_dir = os.environ.get('PDF_CACHE_DIR') or os.path.join(os.getcwd(), 'outputs', '.cache', 'pdf')
+            _pdf_cache = MediaCache(cache_dir, max_mb * 1024 * 1024)
+        return _pdf_cache
+
+
+def deck_hash(pptx_path: str) -> str:
+    """SHA-256 of a deck, memoized while its size and mtime are unchanged."""
+    stat = os.stat(pptx_path)
+    memo_key = (os.path.abspath(pptx_path), stat.st_size, stat.st_mtime_ns)
+    with _pdf_cache_lock:
+        content_hash = _deck_hashes.get(memo_key)
+        if content_hash is not None:
+            _deck_hashes.move_to_end(memo_key)
+            return content_hash
+
+    content_hash = hash_file(pptx_path)
+    with _pdf_cache_lock:
+        _deck_hashes[memo_key] = content_hash
+        while len(_deck_hashes) > DECK_HASH_MEMO_ENTRIES:
+            _deck_hashes.popitem(last=False)
+    return content_hash
+
+
+def pdf_cache_key(pptx_path: str) -> Optional[str]:
+    """Cache key for the PDF of a deck, or None when the PDF cache is disabled or the deck cannot be read."""
+    from .pdf_converter import pdf_render_settings
+
+    cache = get_pdf_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.make_key(deck_hash(pptx_path), 'pdf', pdf_render_settings())
+    except OSError as e:
+        logger.warning(f"Could not hash {pptx_path} for the PDF cache: {str(e)}")
+        return None
+
+
+def cached_pdf_path(key: Optional[str]) -> Optional[str]:
+    """Path of the cached PDF for key, or None on a miss."""
+    if key is None:
+        return None
+    path = get_pdf_cache().get_path(key)
+    if path:
+        logger.info(f"PDF cache hit {key[:12]}")
+    return path
+
+
+def store_pdf(key: Optional[str], pdf_path: str) -> Optional[str]:
+    """Copy a freshly converted PDF into the cache and return the cached path."""
+    if key is None:
+        return None
+    path = get_pdf_cache().put_file(key, pdf_path)
+    # A PDF larger than the whole budget is evicted again straight away
+    return path if path and os.path.exists(path) else None
+
+
+@contextmanager
+def pdf_conversion_lock(key: Optional[str]):
+    """Hold the lock serializing conversions of the same deck within this process; it is dropped once unused."""
+    if key is None:
+        yield
+        return
+    with _pdf_cache_lock:
+        entry = _conversion_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _pdf_cache_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _conversion_locks[key]
@@ -0,0 +1,565 @@
+"""
+PowerPoint to PDF conversion without external office software.
+Renders each slide to an image with Pillow and embeds the pages in a PDF with reportlab.
+"""
+
+import os
+import logging
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+# Resolution slides are rasterized at for the PDF pages
+PDF_RENDER_DPI = 150
+
+# Bump whenever a change alters the PDFs rendered from the same deck; cached PDFs are keyed on it
+PDF_RENDERER_VERSION = '6'
+
+PDF_BACKENDS = ('raster', 'vector')
+
+# Size bound for the decoded pictures one rasterizing task keeps for reuse across its slides
+DECODED_IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Pixels of slack around drawn text for glyph bearings and overhangs
+TEXT_BLEED = 4
+
+# Slides per pool task when streaming a PDF; the first task renders one slide so the response starts early
+PDF_STREAM_CHUNK_SLIDES = 8
+
+
+def pdf_backend():
+    """'raster' (slides drawn as page images) or 'vector' (shapes, text and original pictures) from PDF_BACKEND."""
+    backend = os.environ.get('PDF_BACKEND', 'raster').strip().lower()
+    if backend == 'vector':
+        from .pdf_vector import reportlab_internals_available
+        # The vector backend uses reportlab internals; after an incompatible upgrade, fall back rather than fail
+        return 'vector' if reportlab_internals_available() else 'raster'
+    return backend if backend in PDF_BACKENDS else 'raster'
+
+
+def pdf_with_deck():
+    """True when generation should draw the deck's PDF as well (PDF_WITH_DECK, vector backend only)."""
+    enabled = os.environ.get('PDF_WITH_DECK', '0').strip().lower() in ('1', 'true', 'yes')
+    return enabled and pdf_backend() == 'vector'
+
+
+def pdf_render_settings():
+    """Settings that change the rendered PDF; part of the PDF cache key."""
+    return {'backend': pdf_backend(), 'dpi': PDF_RENDER_DPI, 'renderer_version': PDF_RENDERER_VERSION}
+
+
+def decode_resized(blob, width, height):
+    """Decode a picture at its placed pixel size, doing as little full-resolution work as possible."""
+    import io
+    from PIL import Image
+
+    source = Image.open(io.BytesIO(blob))
+    # JPEGs decode straight at the smallest 1/2, 1/4 or 1/8 scale that still covers the target
+    source.draft(source.mode, (width, height))
+    # Other large sources are box-reduced by an integer factor before the LANCZOS pass
+    return source.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+class DecodedImageCache:
+    """Pictures already decoded and resized for the slides of one conversion task.
+
+    Keyed by image part hash and target size, so the logo and any screenshot
+    placed again at the same size is decoded once. Least recently used entries
+    are dropped once the decoded pixels pass max_bytes.
+    """
+
+    def __init__(self, max_bytes=DECODED_IMAGE_CACHE_BYTES):
+        from collections import OrderedDict
+
+        self.max_bytes = max_bytes
+        self._images = OrderedDict()
+        self._bytes = 0
+
+    def get(self, image_part, width, height):
+        """The picture in image_part resized to width x height pixels."""
+        key = (image_part.sha1, width, height)
+        img = self._images.get(key)
+        if img is not None:
+            self._images.move_to_end(key)
+            return img
+
+        img = decode_resized(image_part.blob, width, height)
+        size = img.width * img.height * len(img.getbands())
+        if size <= self.max_bytes:
+            self._images[key] = img
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= evicted.width * evicted.height * len(evicted.getbands())
+        return img
+
+
+def shape_signature(slide, shape):
+    """What the rasterizer paints for a shape, as a hashable key; equal keys paint identical pixels."""
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+    box = (shape.left, shape.top, shape.width, shape.height)
+    if hasattr(shape, "text") and shape.text.strip():
+        font = None
+        paragraphs = shape.text_frame.paragraphs
+        if paragraphs and paragraphs[0].runs:
+            font = paragraphs[0].runs[0].font
+        return ('text', box, shape.text.strip(), font.size if font else None, font.name if font else None)
+    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+        return ('picture', box, slide.part.related_part(shape._element.blip_rId).sha1)
+    return ('shape', box)
+
+
+class BackgroundLayerCache:
+    """Base canvases holding the shapes a deck repeats across slides, painted once per combination and size.
+
+    A shape is repeated when its signature occurs on at least two of the slides
+    given. On each slide, a repeated shape goes into the base layer unless it
+    overlaps a shape painted before it that is not in the layer, so painting the
+    base first and the remaining shapes on top gives the same pixels as painting
+    every shape in order. Text can run below its frame, so text shapes count as
+    reaching the bottom of the slide.
+    """
+
+    def __init__(self, slides, max_canvases=8):
+        from collections import Counter, OrderedDict
+
+        self.max_canvases = max_canvases
+        self._signatures = {}
+        counts = Counter()
+        for slide in slides:
+            signatures = self._slide_signatures(slide)
+            counts.update(set(signature for signature, _ in signatures))
+        self._repeated = {signature for signature, count in counts.items() if count > 1}
+        self._canvases = OrderedDict()
+        self._tiles = {}
+
+    def _slide_signatures(self, slide):
+        signatures = self._signatures.get(slide.part)
+        if signatures is None:
+            signatures = []
+            for shape in slide.shapes:
+                try:
+                    signatures.append((shape_signature(slide, shape), shape))
+                except Exception:
+                    # Shapes that cannot be keyed are always painted per page
+                    signatures.append((None, shape))
+            self._signatures[slide.part] = signatures
+        return signatures
+
+    def split(self, slide, scale_x, scale_y, img_height):
+        """(base layer key, base layer shapes, remaining shapes) of a slide, in paint order."""
+        background = []
+        foreground = []
+        painted = []
+        for signature, shape in self._slide_signatures(slide):
+            box = self._pixel_box(signature, shape, scale_x, scale_y, img_height)
+            if signature in self._repeated and box is not None and not any(self._overlaps(box, other) for other in painted):
+                background.append((signature, shape))
+            else:
+                foreground.append(shape)
+                painted.append(box)
+        return tuple(signature for signature, _ in background), [shape for _, shape in background], foreground
+
+    def canvas(self, key, size, paint):
+        """A copy of the base canvas for key, painting it with paint(img, draw) the first time."""
+        from PIL import Image, ImageDraw
+
+        cache_key = (size, key)
+        base = self._canvases.get(cache_key)
+        if base is None:
+            base = Image.new('RGB', size, 'white')
+            paint(base, ImageDraw.Draw(base))
+            self._canvases[cache_key] = base
+            if len(self._canvases) > self.max_canvases:
+                self._canvases.popitem(last=False)
+        else:
+            self._canvases.move_to_end(cache_key)
+        return base.copy()
+
+    def base_tile(self, key, size):
+        """The base canvas for key as a full-page PageTile, compressed once per task."""
+        cache_key = (size, key)
+        tile = self._tiles.get(cache_key)
+        if tile is None:
+            tile = PageTile.from_image(self._canvases[cache_key])
+            self._tiles[cache_key] = tile
+        return tile
+
+    @staticmethod
+    def _pixel_box(signature, shape, scale_x, scale_y, img_height):
+        """Pixels a shape can touch as (left, top, right, bottom), right and bottom exclusive; None when unknown."""
+        try:
+            left = int(shape.left * scale_x)
+            top = int(shape.top * scale_y)
+            right = left + int(shape.width * scale_x) + 1
+            bottom = top + int(shape.height * scale_y) + 1
+        except Exception:
+            return None
+        if signature is not None and signature[0] == 'text':
+            # Glyphs can overhang the text origin slightly and lines continue below the frame
+            return (left - 2, top - 2, right + 2, img_height)
+        return (left, top, right, bottom)
+
+    @staticmethod
+    def _overlaps(box, other):
+        if other is None:
+            return True
+        return box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]
+
+
+def _draw_slide_shape(img, draw, slide, shape, scale_x, scale_y, dpi, image_cache):
+    """Paint one shape of a slide onto img; returns the (left, top, right, bottom) pixels it painted, or None."""
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+    from .font_registry import get_font_registry, wrap_text
+
+    try:
+        # Get shape position and size in EMU, convert to pixels
+        left = int(shape.left * scale_x)
+        top = int(shape.top * scale_y)
+        width = int(shape.width * scale_x)
+        height = int(shape.height * scale_y)
+        
+        # Handle text shapes
+        if hasattr(shape, "text") and shape.text.strip():
+            text_content = shape.text.strip()
+            
+            # Try to get font size and family from the shape
+            font_size = 12  # Default
+            font_family = 'Arial'
+            if hasattr(shape, 'text_frame') and shape.text_frame.paragraphs:
+                first_para = shape.text_frame.paragraphs[0]
+                if first_para.runs and first_para.runs[0].font.size:
+                    font_size = int(first_para.runs[0].font.size.pt * (dpi / 72))
+                if first_para.runs and first_para.runs[0].font.name:
+                    font_family = first_para.runs[0].font.name
+            
+            # Fonts and glyph widths are loaded once per process from the registry
+            metrics = get_font_registry().get(font_family, font_size)
+            
+            # Draw text with word wrapping
+            lines = text_content.split('\n')
+            y_offset = top
+            try:
+                ascent, descent = metrics.font.getmetrics()
+            except AttributeError:
+                ascent, descent = font_size, font_size
+            text_right = left + width
+            text_bottom = top
+            
+            for line in lines:
+                for wrapped_line in wrap_text(line, metrics, width):
+                    draw.text((left, y_offset), wrapped_line, fill='black', font=metrics.font)
+                    text_right = max(text_right, left + int(metrics.width(wrapped_line)) + 1)
+                    text_bottom = y_offset + ascent + descent
+                    y_offset += font_size + 2
+            
+            return (left - TEXT_BLEED, top - TEXT_BLEED, text_right + TEXT_BLEED, text_bottom + TEXT_BLEED)
+        
+        # Handle image shapes
+        elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            try:
+                # Decode the image at the size of the shape bounds
+                image_part = slide.part.related_part(shape._element.blip_rId)
+                if image_cache is not None:
+                    shape_img = image_cache.get(image_part, width, height)
+                else:
+                    shape_img = decode_resized(image_part.blob, width, height)
+                
+                # Paste the image onto the slide image
+                img.paste(shape_img, (left, top))
+                return (left, top, left + shape_img.width, top + shape_img.height)
+                
+            except Exception as img_error:
+                # Draw a placeholder rectangle for failed images
+                draw.rectangle([left, top, left + width, top + height], outline='gray', fill='lightgray')
+                draw.text((left + 5, top + 5), "[Image]", fill='black')
+                return (left, top, left + width + 1, top + height + 1)
+        
+        # Handle other shapes (rectangles, etc.)
+        else:
+            # Draw a simple rectangle for other shapes
+            draw.rectangle([left, top, left + width, top + height], outline='lightblue', fill=None)
+            return (left, top, left + width + 1, top + height + 1)
+            
+    except Exception as shape_error:
+        logger.warning(f"Error processing shape: {str(shape_error)}")
+    return None
+
+
+def rasterize_slide(slide, slide_width, slide_height, dpi=300, image_cache=None, background_cache=None):
+    """Paint a slide; returns (image, base layer key, pixel boxes painted on top of the base layer).
+
+    Outside the returned boxes the image equals the base layer canvas (plain
+    white when the key is empty).
+    """
+    from PIL import Image, ImageDraw
+    
+    # Calculate image dimensions based on slide size and DPI
+    img_width = int((slide_width / 914400) * dpi)  # Convert EMU to inches, then to pixels
+    img_height = int((slide_height / 914400) * dpi)
+    
+    # Scale factor for positioning
+    scale_x = img_width / slide_width
+    scale_y = img_height / slide_height
+    
+    shapes = list(slide.shapes)
+    if background_cache is not None:
+        key, background, shapes = background_cache.split(slide, scale_x, scale_y, img_height)
+    else:
+        key, background = (), []
+    
+    if background:
+        def paint_background(base, base_draw):
+            for shape in background:
+                _draw_slide_shape(base, base_draw, slide, shape, scale_x, scale_y, dpi, image_cache)
+        img = background_cache.canvas(key, (img_width, img_height), paint_background)
+    else:
+        # Create a white background image
+        img = Image.new('RGB', (img_width, img_height), 'white')
+    draw = ImageDraw.Draw(img)
+    
+    # Process each remaining shape in the slide
+    painted = []
+    for shape in shapes:
+        box = _draw_slide_shape(img, draw, slide, shape, scale_x, scale_y, dpi, image_cache)
+        if box is not None:
+            painted.append(box)
+    
+    return img, key, painted
+
+
+def convert_slide_to_image(slide, slide_width, slide_height, dpi=300, image_cache=None, background_cache=None):
+    """Convert a single slide to a high-quality image using PIL and python-pptx.
+    
+    This function renders slide content as an image while preserving formatting.
+    Pictures come from image_cache when one is given, so repeats are decoded once,
+    and with a background_cache each page starts from a copy of the base canvas
+    holding the shapes it shares with other slides.
+    """
+    try:
+        img, _, _ = rasterize_slide(slide, slide_width, slide_height, dpi, image_cache, background_cache)
+        return img
+        
+    except Exception as e:
+        logger.error(f"Error converting slide to image: {str(e)}")
+        return None
+
+
+class PageTile:
+    """A rectangle of a rasterized slide, already compressed into the stream of a PDF image XObject.
+
+    The digest covers the size and pixels, so identical tiles on different pages
+    become one XObject in the PDF.
+    """
+
+    __slots__ = ('x', 'y', 'width', 'height', 'stream', 'digest')
+
+    def __init__(self, x, y, width, height, stream, digest):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.stream = stream
+        self.digest = digest
+
+    @classmethod
+    def from_image(cls, img, x=0, y=0):
+        """Deflate an RGB image's pixels the way reportlab stores an image XObject."""
+        import zlib
+        import hashlib
+
+        raw = img.convert('RGB').tobytes()
+        return cls(x, y, img.width, img.height, zlib.compress(raw), f"{img.width}x{img.height}-{hashlib.md5(raw).hexdigest()}")
+
+
+class PageImage:
+    """A rasterized slide as tiles drawn in order over a white page of width x height pixels."""
+
+    __slots__ = ('width', 'height', 'tiles')
+
+    def __init__(self, width, height, tiles):
+        self.width = width
+        self.height = height
+        self.tiles = tiles
+
+
+def merge_boxes(boxes, width, height):
+    """Clamp boxes to the image and merge overlapping ones, so no pixel is stored in two tiles of a page."""
+    merged = []
+    for box in boxes:
+        box = (max(0, box[0]), max(0, box[1]), min(width, box[2]), min(height, box[3]))
+        if box[0] >= box[2] or box[1] >= box[3]:
+            continue
+        overlapping = True
+        while overlapping:
+            overlapping = False
+            for other in merged:
+                if box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]:
+                    merged.remove(other)
+                    box = (min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3]))
+                    overlapping = True
+                    break
+        merged.append(box)
+    return merged
+
+
+def render_page_image(slide, slide_width, slide_height, dpi=PDF_RENDER_DPI, image_cache=None, background_cache=None):
+    """Rasterize a slide into tiles: the shared base layer, then each region painted over it.
+
+    Tiles are cut from the finished page, so drawing them in any order gives the
+    page's exact pixels, while the logo, title band and pictures placed the same
+    way on several slides are stored once in the PDF.
+    """
+    slide_img, key, painted = rasterize_slide(slide, slide_width, slide_height, dpi, image_cache, background_cache)
+
+    tiles = []
+    if key:
+        tiles.append(background_cache.base_tile(key, slide_img.size))
+    for left, top, right, bottom in merge_boxes(painted, slide_img.width, slide_img.height):
+        tiles.append(PageTile.from_image(slide_img.crop((left, top, right, bottom)), left, top))
+    return PageImage(slide_img.width, slide_img.height, tiles)
+
+
+def iter_rendered_pages(input_path, start, stop, dpi=PDF_RENDER_DPI):
+    """Rasterize slides [start, stop) of a deck, yielding each PageImage as soon as it is rendered.
+
+    A slide that cannot be rendered yields the error text to print on its page instead.
+    """
+    from pptx import Presentation
+
+    prs = Presentation(input_path)
+    slides = list(prs.slides)[start:stop]
+    image_cache = DecodedImageCache()
+    background_cache = BackgroundLayerCache(slides)
+
+    for slide_num, slide in enumerate(slides, start + 1):
+        try:
+            logger.info(f"Processing slide {slide_num}")
+            page = render_page_image(slide, prs.slide_width, prs.slide_height, dpi, image_cache, background_cache)
+            yield page if page is not None else f"Error: Could not render slide {slide_num}"
+        except Exception as e:
+            logger.warning(f"Error processing slide {slide_num}: {str(e)}")
+            yield f"Error processing slide {slide_num}: {str(e)}"
+
+
+def render_pdf_pages(input_path, start, stop, dpi=PDF_RENDER_DPI):
+    """Pool task: rasterize slides [start, stop) of a deck into PageImages, in slide order."""
+    return list(iter_rendered_pages(input_path, start, stop, dpi))
+
+
+def iter_pdf_pages(input_path, slide_count, executor=None, workers=1):
+    """Rendered pages of a deck in slide order, with a bounded number of them in flight at once.
+
+    With an executor, slides are rendered in chunks of PDF_STREAM_CHUNK_SLIDES on
+    its worker processes, at most two chunks per worker ahead of the page being
+    consumed.
+    """
+    from collections import deque
+
+    if executor is None:
+        yield from iter_rendered_pages(input_path, 0, slide_count)
+        return
+
+    chunks = []
+    start = 0
+    while start < slide_count:
+        stop = min(start + (1 if not chunks else PDF_STREAM_CHUNK_SLIDES), slide_count)
+        chunks.append((start, stop))
+        start = stop
+
+    pending = iter(chunks)
+    futures = deque()
+    try:
+        for start, stop in pending:
+            futures.append(executor.submit(render_pdf_pages, input_path, start, stop))
+            if len(futures) >= max(1, workers) * 2:
+                break
+        while futures:
+            pages = futures.popleft().result()
+            for start, stop in pending:
+                futures.append(executor.submit(render_pdf_pages, input_path, start, stop))
+                break
+            yield from pages
+    finally:
+        # A client that stops reading leaves no orphaned work behind
+        for future in futures:
+            future.cancel()
+
+
+def stream_pptx_to_pdf(input_path, executor=None, workers=1):
+    """Yield a rasterized PDF of a deck in pieces, each page as soon as it has been rendered."""
+    from .pdf_stream import PdfStreamWriter
+
+    # Get slide dimensions and count without loading every part of the deck
+    slide_width, slide_height, slide_count = read_slide_geometry(input_path)
+    if not slide_count:
+        raise ValueError("No slides found in presentation")
+
+    # Convert EMU to points (1 EMU = 1/914400 inch, 1 inch = 72 points)
+    slide_width_pts = (slide_width / 914400) * 72
+    slide_height_pts = (slide_height / 914400) * 72
+    logger.info(f"Streaming {slide_count} slides to PDF at {slide_width_pts:.1f} x {slide_height_pts:.1f} points")
+
+    writer = PdfStreamWriter(slide_width_pts, slide_height_pts)
+    yield writer.begin()
+    for slide_num, page in enumerate(iter_pdf_pages(input_path, slide_count, executor, workers), 1):
+        if isinstance(page, PageImage):
+            yield writer.add_page(page)
+            logger.info(f"Added slide {slide_num} as image to PDF")
+        else:
+            logger.warning(f"Failed to convert slide {slide_num} to image")
+            yield writer.add_error_page(page)
+    yield writer.finish()
+
+
+def read_slide_geometry(input_path):
+    """(slide width, slide height, slide count) from ppt/presentation.xml, without loading the deck."""
+    import zipfile
+    from lxml import etree
+
+    ns = {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
+    with zipfile.ZipFile(input_path) as package:
+        root = etree.fromstring(package.read('ppt/presentation.xml'))
+    size = root.find('p:sldSz', ns)
+    return int(size.get('cx')), int(size.get('cy')), len(root.findall('p:sldIdLst/p:sldId', ns))
+
+
+def convert_pptx_to_pdf_serverless(input_path, output_dir, executor=None, workers=1):
+    """Convert PPTX to PDF by first converting slides to images, then embedding in PDF.
+    
+    This preserves the exact formatting and layout of the original slides. With an
+    executor, slides are rasterized and compressed in chunks on its worker processes
+    and only the page assembly happens here. Under PDF_BACKEND=vector the deck is
+    drawn by convert_pptx_to_pdf_vector instead, on the executor when there is one.
+    """
+    if pdf_backend() == 'vector':
+        from .pdf_vector import convert_pptx_to_pdf_vector
+        if executor is None:
+            return convert_pptx_to_pdf_vector(input_path, output_dir)
+        return executor.submit(convert_pptx_to_pdf_vector, input_path, output_dir).result()
+    
+    pdf_path = None
+    try:
+        logger.info(f"Starting image-based PDF conversion for: {input_path}")
+        
+        # Generate PDF filename
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+        pdf_path = os.path.join(output_dir, f"{base_name}.pdf")
+        
+        # Pages are written to the file as they arrive rather than assembled in memory
+        with open(pdf_path, 'wb') as pdf_file:
+            for chunk in stream_pptx_to_pdf(input_path, executor, workers):
+                pdf_file.write(chunk)
+        
+        logger.info(f"PDF conversion successful: {pdf_path}")
+        return pdf_path
+    
+    except BrokenProcessPool:
+        # Let the pool owner replace the pool
+        raise
+    except Exception as e:
+        logger.error(f"Error in image-based PDF conversion: {str(e)}")
+        if pdf_path and os.path.exists(pdf_path):
+            os.remove(pdf_path)
+        return None
@@ -0,0 +1,147 @@
+"""
+Streamed PDF downloads that do not depend on how fast the client reads.
+A background thread renders the deck's PDF into a file and the cache; responses stream that file as it grows.
+"""
+
+import os
+import shutil
+import logging
+import tempfile
+import threading
+from typing import Iterator, Optional
+
+from .pdf_cache import cached_pdf_path, store_pdf, pdf_conversion_lock
+
+logger = logging.getLogger(__name__)
+
+PDF_READ_CHUNK_BYTES = 1024 * 1024
+
+
+class PdfDownload:
+    """One deck's PDF, rendered on a background thread and read back while it is written.
+
+    Raster pages are readable as they render; the vector backend's PDF (reportlab
+    writes the file on save) becomes readable once complete. Either way the file
+    is streamed from disk rather than memory. The deck's conversion lock is held
+    only until the PDF is in the cache, so a
+    slow reader never holds up other requests for the same deck. The temporary
+    input file and the partial PDF are removed once both the render and the
+    response are finished; call close() when the response is closed.
+    """
+
+    def __init__(self, input_path: str, cache_key: Optional[str], temp_input_path: Optional[str] = None):
+        self.input_path = input_path
+        self.cache_key = cache_key
+        self.temp_input_path = temp_input_path
+
+        self._temp_dir = tempfile.mkdtemp(prefix='pdf-download-')
+        self._partial_path = os.path.join(self._temp_dir, 'stream.pdf')
+        self._source = None
+        self._written = 0
+        self._done = False
+        self._error = None
+        self._pending_users = 2  # the render thread and the response
+        self._condition = threading.Condition()
+
+    def start(self) -> 'PdfDownload':
+        threading.Thread(target=self._render, name='pdf-download', daemon=True).start()
+        return self
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Yield the PDF from the start, waiting for pages that have not been rendered yet."""
+        with self._condition:
+            while self._source is None and not self._done:
+                self._condition.wait()
+            if self._source is None:
+                raise RuntimeError(f"PDF rendering failed: {self._error}")
+            source = self._source
+
+        position = 0
+        with open(source, 'rb') as pdf_file:
+            while True:
+                with self._condition:
+                    while position >= self._written and not self._done:
+                        self._condition.wait()
+                    available = self._written
+                    done = self._done
+                    error = self._error
+                while position < available:
+                    chunk = pdf_file.read(min(PDF_READ_CHUNK_BYTES, available - position))
+                    if not chunk:
+                        break
+                    position += len(chunk)
+                    yield chunk
+                if done and position >= available:
+                    break
+        if error is not None:
+            # Headers are already sent, so the client sees a truncated download
+            raise RuntimeError(f"PDF rendering failed: {error}")
+
+    def close(self):
+        """Called when the response is closed, whether or not the client read everything."""
+        self._release()
+
+    def _render(self):
+        from .pdf_converter import pdf_backend
+        from .worker_pool import stream_pptx_to_pdf, convert_pptx_to_pdf
+
+        try:
+            with pdf_conversion_lock(self.cache_key):
+                cached_pdf = cached_pdf_path(self.cache_key)
+                if cached_pdf:
+                    # Another request finished this deck while this one waited for the lock
+                    size = os.path.getsize(cached_pdf)
+                    self._advance(size, source=cached_pdf)
+                    return
+
+                if pdf_backend() == 'vector':
+                    # Named after the deck, so kept apart from the partial raster file
+                    output_dir = os.path.join(self._temp_dir, 'vector')
+                    os.makedirs(output_dir)
+                    pdf_path = convert_pptx_to_pdf(self.input_path, output_dir)
+                    if not pdf_path or not os.path.exists(pdf_path):
+                        raise RuntimeError('PDF conversion failed')
+                    size = os.path.getsize(pdf_path)
+                    self._advance(size, source=pdf_path)
+                else:
+                    pdf_path = self._partial_path
+                    with open(pdf_path, 'wb') as pdf_file:
+                        self._advance(0, source=pdf_path)
+                        size = 0
+                        for chunk in stream_pptx_to_pdf(self.input_path):
+                            pdf_file.write(chunk)
+                            # Readers open the file separately, so each piece is flushed before it is announced
+                            pdf_file.flush()
+                            size += len(chunk)
+                            self._advance(size)
+                store_pdf(self.cache_key, pdf_path)
+                logger.info(f"PDF streaming successful. Size: {size} bytes")
+        except Exception as e:
+            logger.error(f"Error streaming PDF for {self.input_path}: {str(e)}")
+            with self._condition:
+                self._error = e
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+            self._release()
+
+    def _advance(self, written: int, source: Optional[str] = None):
+        with self._condition:
+            if source is not None:
+                self._source = source
+            self._written = written
+            self._condition.notify_all()
+
+    def _release(self):
+        with self._condition:
+            self._pending_users -= 1
+            if self._pending_users > 0:
+                return
+        shutil.rmtree(self._temp_dir, ignore_errors=True)
+        if self.temp_input_path and os.path.exists(self.temp_input_path):
+            try:
+                os.unlink(self.temp_input_path)
+                logger.info(f"Cleaned up temporary file: {self.temp_input_path}")
+            except Exception as e:
+                logger.warning(f"Failed to clean up temporary file: {str(e)}")
@@ -0,0 +1,128 @@
+"""
+Front-to-back PDF writer for rasterized decks.
+Emits each page's bytes as soon as the page is added, so a PDF can be streamed to the client while later slides render.
+"""
+
+import zlib
+
+# Object 1 is the catalog and object 2 the page tree, which is only written once every page is known
+CATALOG_OBJECT = 1
+PAGES_OBJECT = 2
+
+
+def _num(value):
+    """A PDF number with no more precision than the drawing needs."""
+    return f"{value:.4f}".rstrip('0').rstrip('.')
+
+
+def _pdf_string(text):
+    """A PDF literal string for text in the standard Latin-1 encoding."""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return f"({escaped})".encode('latin-1', 'replace')
+
+
+class PdfStreamWriter:
+    """Writes a PDF of tiled page images one page at a time.
+
+    begin(), add_page() and add_error_page() return the bytes to append, and
+    finish() returns the page tree, cross-reference table and trailer. Only the
+    object offsets, page object numbers and which tiles were already written are
+    kept, so memory does not grow with the rendered pages. Tiles with the same
+    digest are written once and referenced from every page that shows them.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self._position = 0
+        self._offsets = {}
+        self._next_object = PAGES_OBJECT + 1
+        self._pages = []
+        self._tiles = {}
+        self._font = None
+
+    def begin(self):
+        header = b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n'
+        self._position = len(header)
+        return header + self._object(CATALOG_OBJECT, f"<< /Type /Catalog /Pages {PAGES_OBJECT} 0 R >>".encode())
+
+    def add_page(self, page):
+        """Bytes for a PageImage: any tiles not written yet, the page's content stream and the page object."""
+        chunks = []
+        resources = {}
+        content = []
+        scale_x = self.width / page.width
+        scale_y = self.height / page.height
+        for tile in page.tiles:
+            number = self._tiles.get(tile.digest)
+            if number is None:
+                number = self._allocate()
+                chunks.append(self._stream_object(
+                    number,
+                    f"/Type /XObject /Subtype /Image /Width {tile.width} /Height {tile.height} "
+                    f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /FlateDecode",
+                    tile.stream
+                ))
+                self._tiles[tile.digest] = number
+            resources[f"Im{number}"] = number
+            # Tile rows count down from the top of the page; PDF y counts up from the bottom
+            content.append(
+                f"q {_num(tile.width * scale_x)} 0 0 {_num(tile.height * scale_y)} "
+                f"{_num(tile.x * scale_x)} {_num(self.height - (tile.y + tile.height) * scale_y)} cm /Im{number} Do Q"
+            )
+
+        xobjects = ' '.join(f"/{name} {number} 0 R" for name, number in resources.items())
+        chunks.append(self._page('\n'.join(content).encode(), f"/XObject << {xobjects} >> /ProcSet [/PDF /ImageC]"))
+        return b''.join(chunks)
+
+    def add_error_page(self, message):
+        """Bytes for a page showing an error message in place of a slide that could not be rendered."""
+        chunks = []
+        if self._font is None:
+            self._font = self._allocate()
+            chunks.append(self._object(
+                self._font, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+            ))
+        content = b"BT /F1 12 Tf 50 " + _num(self.height - 50).encode() + b" Td " + _pdf_string(message) + b" Tj ET"
+        chunks.append(self._page(content, f"/Font << /F1 {self._font} 0 R >> /ProcSet [/PDF /Text]"))
+        return b''.join(chunks)
+
+    def finish(self):
+        """Bytes for the page tree, cross-reference table and trailer that close the file."""
+        kids = ' '.join(f"{number} 0 R" for number in self._pages)
+        chunks = [self._object(PAGES_OBJECT, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._pages)} >>".encode())]
+
+        xref_offset = self._position
+        size = self._next_object
+        xref = [f"xref\n0 {size}\n0000000000 65535 f \n"]
+        for number in range(1, size):
+            xref.append(f"{self._offsets[number]:010d} 00000 n \n")
+        xref.append(f"trailer\n<< /Size {size} /Root {CATALOG_OBJECT} 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n")
+        chunks.append(''.join(xref).encode())
+        return b''.join(chunks)
+
+    def _page(self, content, resources):
+        contents = self._allocate()
+        chunks = [self._stream_object(contents, "/Filter /FlateDecode", zlib.compress(content))]
+        number = self._allocate()
+        chunks.append(self._object(number, (
+            f"<< /Type /Page /Parent {PAGES_OBJECT} 0 R /MediaBox [0 0 {_num(self.width)} {_num(self.height)}] "
+            f"/Resources << {resources} >> /Contents {contents} 0 R >>"
+        ).encode()))
+        self._pages.append(number)
+        return b''.join(chunks)
+
+    def _allocate(self):
+        number = self._next_object
+        self._next_object += 1
+        return number
+
+    def _object(self, number, body):
+        data = f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+        self._offsets[number] = self._position
+        self._position += len(data)
+        return data
+
+    def _stream_object(self, number, entries, stream):
+        body = f"<< {entries} /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        return self._object(number, body)
@@ -0,0 +1,561 @@
+"""
+Vector PDF backend for generated decks.
+Draws each slide's pictures as image XObjects at their placed positions and its text as real PDF text with reportlab.
+"""
+
+import io
+import os
+import re
+import zlib
+import struct
+import logging
+from PIL import Image
+from pptx.enum.dml import MSO_COLOR_TYPE, MSO_FILL
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Pt
+from reportlab.pdfbase import pdfdoc, pdfmetrics
+from reportlab.lib.colors import Color
+
+logger = logging.getLogger(__name__)
+
+EMU_PER_POINT = 12700
+
+# PowerPoint's single line spacing is about 1.2 times the font size
+LINE_SPACING = 1.2
+
+DEFAULT_FONT_SIZE = Pt(18)
+DEFAULT_LINE_WIDTH = Pt(0.75)
+
+# Aptos and Arial decks map onto the metric-compatible standard PDF faces, which need no embedding
+FONT_FACES = {
+    (False, False): 'Helvetica',
+    (True, False): 'Helvetica-Bold',
+    (False, True): 'Helvetica-Oblique',
+    (True, True): 'Helvetica-BoldOblique',
+}
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Words with their trailing whitespace, so wrapped lines keep the source spacing
+WORD_PATTERN = re.compile(r'\S+\s*|\s+')
+
+
+def pts(emu):
+    return emu / EMU_PER_POINT
+
+
+class ImageStreamXObject(pdfdoc.PDFObject):
+    """Image XObject written from a ready-made stream, so nothing is decoded or re-compressed by reportlab."""
+
+    def __init__(self, name, width, height, stream, filters, color_space='DeviceRGB', bits_per_component=8,
+                 decode_parms=None, smask=None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.stream = stream
+        self.filters = filters
+        self.color_space = color_space
+        self.bits_per_component = bits_per_component
+        self.decode_parms = decode_parms
+        self.smask = smask
+
+    def format(self, document):
+        stream = pdfdoc.PDFStream(content=self.stream)
+        entries = stream.dictionary
+        entries['Type'] = pdfdoc.PDFName('XObject')
+        entries['Subtype'] = pdfdoc.PDFName('Image')
+        entries['Width'] = self.width
+        entries['Height'] = self.height
+        entries['BitsPerComponent'] = self.bits_per_component
+        entries['ColorSpace'] = pdfdoc.PDFName(self.color_space) if isinstance(self.color_space, str) else self.color_space
+        # Declaring the filters stops PDFStream from applying the document's own
+        entries['Filter'] = pdfdoc.PDFArray([pdfdoc.PDFName(f) for f in self.filters])
+        if self.decode_parms:
+            entries['DecodeParms'] = pdfdoc.PDFDictionary(self.decode_parms)
+        if self.smask is not None:
+            entries['SMask'] = self.smask
+        entries['Length'] = len(self.stream)
+        return stream.format(document)
+
+
+# reportlab has no public call for drawing a prebuilt image XObject, so place_xobject and the
+# XObject helpers below use canvas and document internals, as does set_page_order. They match
+# reportlab==4.2.2 as pinned in requirements.txt. reportlab_internals_available() renders a small PDF
+# through them before the vector backend is used, and all of them need revisiting whenever that pin moves.
+_reportlab_internals_ok = None
+
+
+def reportlab_internals_available():
+    """True when the installed reportlab still renders correctly through the internals this backend uses; checked once."""
+    global _reportlab_internals_ok
+    if _reportlab_internals_ok is None:
+        import reportlab
+
+        try:
+            problem = _self_test_problem()
+        except Exception as e:
+            problem = f"{type(e).__name__}: {str(e)}"
+        if problem:
+            logger.error(f"Vector PDF self-test failed on reportlab {reportlab.Version} ({problem}); "
+                         f"the vector PDF backend is disabled until utils/pdf_vector.py is updated")
+        _reportlab_internals_ok = problem is None
+    return _reportlab_internals_ok
+
+
+def place_xobject(c, xobject, x, y, width, height):
+    """Draw an image XObject into a box in points, registering it with the document on first use."""
+    reg_name = c._doc.getXObjectName(xobject.name)
+    if c._doc.idToObject.get(reg_name) is None:
+        c._setXObjects(xobject)
+        c._doc.Reference(xobject, reg_name)
+        c._doc.addForm(xobject.name, xobject)
+
+    c._currentPageHasImages = 1
+    c.saveState()
+    c.translate(x, y)
+    c.scale(width, height)
+    c._code.append(f"/{reg_name} Do")
+    c.restoreState()
+    c._formsinuse.append(xobject.name)
+
+
+def _png_passthrough(blob, name, c):
+    """XObject holding a PNG's own deflate stream, or None when the PNG needs decoding (alpha, interlace, 16-bit)."""
+    if not blob.startswith(PNG_SIGNATURE):
+        return None
+
+    header = None
+    palette = None
+    idat = []
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(blob):
+        length, chunk_type = struct.unpack('>I4s', blob[pos:pos + 8])
+        data = blob[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if chunk_type == b'IHDR':
+            header = struct.unpack('>IIBBBBB', data)
+        elif chunk_type == b'PLTE':
+            palette = data
+        elif chunk_type == b'tRNS':
+            return None
+        elif chunk_type == b'IDAT':
+            idat.append(data)
+        elif chunk_type == b'IEND':
+            break
+
+    if header is None or not idat:
+        return None
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if interlace or bit_depth == 16:
+        return None
+
+    if color_type == 0:
+        color_space, colors = 'DeviceGray', 1
+    elif color_type == 2:
+        color_space, colors = 'DeviceRGB', 3
+    elif color_type == 3 and palette:
+        # The palette becomes the lookup table of an Indexed color space
+        lookup = c._doc.Reference(pdfdoc.PDFStream(content=palette, filters=[]))
+        color_space = pdfdoc.PDFArray([pdfdoc.PDFName('Indexed'), pdfdoc.PDFName('DeviceRGB'),
+                                       len(palette) // 3 - 1, lookup])
+        colors = 1
+    else:
+        return None
+
+    # PDF's Flate predictor 15 undoes PNG's per-row filters, so the IDAT data is used as is
+    decode_parms = {'Predictor': 15, 'Colors': colors, 'BitsPerComponent': bit_depth, 'Columns': width}
+    return ImageStreamXObject(name, width, height, b''.join(idat), ['FlateDecode'], color_space,
+                              bit_depth, decode_parms)
+
+
+def _decoded_xobject(img, name, c):
+    """XObject from decoded pixels; transparency becomes a soft mask."""
+    if img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info):
+        img = img.convert('RGBA')
+        alpha = img.getchannel('A')
+        smask_xobject = ImageStreamXObject(f"{name}-mask", img.width, img.height, zlib.compress(alpha.tobytes()),
+                                           ['FlateDecode'], 'DeviceGray')
+        smask = c._doc.Reference(smask_xobject)
+        img = img.convert('RGB')
+    else:
+        smask = None
+        img = img if img.mode in ('RGB', 'L') else img.convert('RGB')
+
+    color_space = 'DeviceGray' if img.mode == 'L' else 'DeviceRGB'
+    return ImageStreamXObject(name, img.width, img.height, zlib.compress(img.tobytes()), ['FlateDecode'],
+                              color_space, smask=smask)
+
+
+def image_xobject(blob, name, c):
+    """Build the XObject for an encoded picture, passing JPEG and plain PNG data through untouched."""
+    xobject = _png_passthrough(blob, name, c)
+    if xobject is not None:
+        return xobject
+
+    with Image.open(io.BytesIO(blob)) as img:
+        if img.format == 'JPEG' and img.mode in ('RGB', 'L'):
+            color_space = 'DeviceGray' if img.mode == 'L' else 'DeviceRGB'
+            return ImageStreamXObject(name, img.width, img.height, blob, ['DCTDecode'], color_space)
+        img.load()
+        return _decoded_xobject(img, name, c)
+
+
+def set_page_order(document, pages):
+    """Make pages, all drawn on document, its only pages and in that order."""
+    kept = set(map(id, pages))
+    for page in document.Pages.pages:
+        if id(page) not in kept:
+            # Page objects are numbered when drawn, so a dropped page is written as null rather than unregistered
+            document.idToObject[getattr(page, pdfdoc.__InternalName__)] = pdfdoc.PDFnull
+    document.Pages.pages = pages
+
+
+def _self_test_problem():
+    """Draw one image on two pages, drop the second and check the file; returns what is wrong, or None."""
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=(100, 100), pageCompression=0)
+    png = io.BytesIO()
+    Image.new('RGB', (2, 2), (255, 0, 0)).save(png, format='PNG')
+    xobject = image_xobject(png.getvalue(), 'selftest', c)
+    place_xobject(c, xobject, 10, 10, 50, 50)
+    c.showPage()
+    kept = c._doc.Pages.pages[-1]
+    place_xobject(c, xobject, 20, 20, 50, 50)
+    c.showPage()
+    set_page_order(c._doc, [kept])
+    c.save()
+    data = buffer.getvalue()
+
+    if not re.search(rb'/Count 1\b', data):
+        return 'dropped page still counted'
+    if data.count(b'/Subtype /Image') != 1:
+        return 'image XObject not written exactly once'
+    if not re.search(rb'/FormXob\.selftest \d+ 0 R', data) or b'/FormXob.selftest Do' not in data:
+        return 'image XObject not placed on the page'
+    # Every object the xref lists must start where the xref says
+    xref = int(data.rsplit(b'startxref', 1)[1].split()[0])
+    rows = data[xref:].split(b'trailer', 1)[0].split(b'\n')
+    first, count = map(int, rows[1].split())
+    for number, row in enumerate(rows[2:2 + count], start=first):
+        if row.endswith(b'n ') and not data[int(row[:10]):].startswith(f'{number} 0 obj'.encode()):
+            return f'xref offset of object {number} is wrong'
+    return None
+
+
+def _rgb(color_format):
+    """reportlab Color for an explicit RGB color, or None for theme/unset colors."""
+    try:
+        if color_format.type != MSO_COLOR_TYPE.RGB:
+            return None
+        rgb = color_format.rgb
+    except AttributeError:
+        return None
+    return Color(rgb[0] / 255, rgb[1] / 255, rgb[2] / 255)
+
+
+def _fill_color(fill):
+    return _rgb(fill.fore_color) if fill.type == MSO_FILL.SOLID else None
+
+
+def _first_set(*values, default=None):
+    for value in values:
+        if value is not None:
+            return value
+    return default
+
+
+class VectorSlideRenderer:
+    """Draws python-pptx slides onto a reportlab canvas as rectangles, text and image XObjects.
+
+    Covers what the generator emits: solid-filled and outlined rectangles, text
+    boxes with per-paragraph or per-run font size, weight and color, and
+    pictures (optionally cropped and bordered). Each distinct picture (by
+    content hash) becomes one XObject that every placement on every page references.
+    """
+
+    def __init__(self, c, slide_height):
+        self.c = c
+        self.page_height = pts(slide_height)
+        self._xobjects = {}
+
+    def draw_slide(self, slide):
+        for shape in slide.shapes:
+            try:
+                self.draw_shape(slide, shape)
+            except Exception as e:
+                logger.warning(f"Error drawing shape {shape.name}: {str(e)}")
+
+    def draw_shape(self, slide, shape):
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            for child in shape.shapes:
+                self.draw_shape(slide, child)
+            return
+
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            self._draw_picture(slide, shape)
+            self._draw_outline(shape)
+            return
+
+        self._draw_fill(shape)
+        self._draw_outline(shape)
+        if shape.has_text_frame and shape.text_frame.text.strip():
+            self._draw_text(shape)
+
+    def _box(self, shape):
+        """(x, y, width, height) of a shape in PDF points, y measured from the page bottom."""
+        width = pts(shape.width)
+        height = pts(shape.height)
+        return pts(shape.left), self.page_height - pts(shape.top) - height, width, height
+
+    def _draw_fill(self, shape):
+        color = _fill_color(shape.fill)
+        if color is None:
+            return
+        x, y, width, height = self._box(shape)
+        self.c.setFillColor(color)
+        self.c.rect(x, y, width, height, stroke=0, fill=1)
+
+    def _draw_outline(self, shape):
+        # shape.line would add an empty <a:ln>; the sink draws slides that have not been saved yet
+        sp_pr = getattr(shape._element, 'spPr', None)
+        if sp_pr is None or sp_pr.ln is None:
+            return
+        line = shape.line
+        if line.fill.type != MSO_FILL.SOLID:
+            return
+        color = _rgb(line.color)
+        if color is None:
+            return
+        x, y, width, height = self._box(shape)
+        self.c.setStrokeColor(color)
+        self.c.setLineWidth(pts(line.width or DEFAULT_LINE_WIDTH))
+        self.c.rect(x, y, width, height, stroke=1, fill=0)
+
+    def _draw_picture(self, slide, picture):
+        part = slide.part.related_part(picture._element.blip_rId)
+        # Keyed by part: the streaming writer releases a part's data once written, after its first page is drawn
+        xobject = self._xobjects.get(part)
+        if xobject is None:
+            xobject = image_xobject(part.blob, f"img{len(self._xobjects) + 1}", self.c)
+            self._xobjects[part] = xobject
+
+        x, y, width, height = self._box(picture)
+        crop_left, crop_right = picture.crop_left, picture.crop_right
+        crop_top, crop_bottom = picture.crop_top, picture.crop_bottom
+        if not (crop_left or crop_right or crop_top or crop_bottom):
+            place_xobject(self.c, xobject, x, y, width, height)
+            return
+
+        # Scale the whole image so the visible part fills the frame, and clip to the frame
+        full_width = width / max(1.0 - crop_left - crop_right, 0.01)
+        full_height = height / max(1.0 - crop_top - crop_bottom, 0.01)
+        self.c.saveState()
+        clip = self.c.beginPath()
+        clip.rect(x, y, width, height)
+        self.c.clipPath(clip, stroke=0, fill=0)
+        place_xobject(self.c, xobject, x - crop_left * full_width, y - crop_bottom * full_height,
+                      full_width, full_height)
+        self.c.restoreState()
+
+    def _draw_text(self, shape):
+        frame = shape.text_frame
+        x, y, width, height = self._box(shape)
+        left = x + pts(frame.margin_left)
+        right = x + width - pts(frame.margin_right)
+        top = y + height - pts(frame.margin_top)
+        bottom = y + pts(frame.margin_bottom)
+        wrap = frame._bodyPr.get('wrap') != 'none'
+
+        lines = []
+        for paragraph in frame.paragraphs:
+            lines.extend(self._layout_paragraph(paragraph, right - left, wrap))
+
+        # Vertical anchoring within the inset box
+        text_height = sum(line['height'] + line['space'] for line in lines)
+        anchor = frame._bodyPr.get('anchor', 't')
+        if anchor == 'ctr':
+            cursor = top - (top - bottom - text_height) / 2
+        elif anchor == 'b':
+            cursor = bottom + text_height
+        else:
+            cursor = top
+
+        for line in lines:
+            cursor -= line['space']
+            baseline = cursor - line['ascent']
+            line_width = sum(width for _, width, _ in line['pieces'])
+            if line['align'] == PP_ALIGN.CENTER:
+                start = left + (right - left - line_width) / 2
+            elif line['align'] == PP_ALIGN.RIGHT:
+                start = right - line_width
+            else:
+                start = left
+
+            if line['pieces']:
+                text = self.c.beginText(start, baseline)
+                current_style = None
+                for piece, _, style in line['pieces']:
+                    if style != current_style:
+                        face, size, color = style
+                        text.setFont(face, size)
+                        text.setFillColor(color)
+                        current_style = style
+                    text.textOut(piece)
+                self.c.drawText(text)
+            cursor = baseline - line['height']
+
+    def _layout_paragraph(self, paragraph, max_width, wrap):
+        """Break a paragraph into lines of (text, width, style) pieces."""
+        default_style = self._style(paragraph, None)
+        segments = []
+        for child in paragraph._p.content_children:
+            tag = child.tag.rsplit('}', 1)[-1]
+            if tag == 'br':
+                segments.append(None)
+            elif child.text:
+                style = self._style(paragraph, child)
+                segments.extend((word, style) for word in WORD_PATTERN.findall(child.text))
+
+        spacing = paragraph.line_spacing
+        space_before = pts(paragraph.space_before) if paragraph.space_before is not None else 0.0
+
+        lines = []
+        pieces = []
+        line_width = 0.0
+
+        def finish_line():
+            styles = [style for _, _, style in pieces] or [default_style]
+            size = max(style[1] for style in styles)
+            if isinstance(spacing, float):
+                height = size * LINE_SPACING * spacing
+            elif spacing is not None:
+                height = pts(spacing)
+            else:
+                height = size * LINE_SPACING
+            ascent = max(pdfmetrics.getAscent(style[0], style[1]) for style in styles)
+            # Trailing spaces do not count towards alignment
+            if pieces:
+                last_text, _, last_style = pieces[-1]
+                trimmed = last_text.rstrip()
+                pieces[-1] = (trimmed, pdfmetrics.stringWidth(trimmed, last_style[0], last_style[1]), last_style)
+            lines.append({
+                'pieces': list(pieces),
+                'height': height - ascent,
+                'ascent': ascent,
+                'space': space_before if not lines else 0.0,
+                'align': paragraph.alignment
+            })
+
+        for segment in segments:
+            if segment is None:
+                finish_line()
+                pieces, line_width = [], 0.0
+                continue
+            word, style = segment
+            word_width = pdfmetrics.stringWidth(word, style[0], style[1])
+            if wrap and pieces and line_width + pdfmetrics.stringWidth(word.rstrip(), style[0], style[1]) > max_width:
+                finish_line()
+                pieces, line_width = [], 0.0
+                if not word.strip():
+                    continue
+            pieces.append((word, word_width, style))
+            line_width += word_width
+
+        finish_line()
+        return lines
+
+    @staticmethod
+    def _style(paragraph, run_element):
+        """(face, size in points, color) for a run, falling back to the paragraph defaults."""
+        from pptx.text.text import Font
+
+        # Run.font, Paragraph.font and Font.color add the elements they read; read existing ones only
+        r_pr = run_element.rPr if run_element is not None and run_element.tag.endswith('}r') else None
+        p_pr = paragraph._p.pPr
+        def_r_pr = p_pr.defRPr if p_pr is not None else None
+        fonts = [Font(element) for element in (r_pr, def_r_pr) if element is not None]
+
+        size = _first_set(*(font.size for font in fonts), default=DEFAULT_FONT_SIZE)
+        bold = bool(_first_set(*(font.bold for font in fonts), default=False))
+        italic = bool(_first_set(*(font.italic for font in fonts), default=False))
+        color = _first_set(*(_fill_color(font.fill) for font in fonts), default=Color(0, 0, 0))
+        return FONT_FACES[(bold, italic)], pts(size), color
+
+
+class PdfDeckSink:
+    """Draws a deck into a vector PDF from the presentation in memory, one finished slide at a time.
+
+    The generator hands it slides as they are completed (through the streaming
+    writer, or all at once before saving), so the PDF comes out of the same
+    placements as the PPTX without the saved deck being reopened. Slides removed
+    from the deck after they were drawn are left out when the PDF is closed.
+
+    Reordering and dropping pages goes through set_page_order, which edits
+    reportlab internals checked by reportlab_internals_available().
+    """
+
+    def __init__(self, prs, output_path, logger=None):
+        from reportlab.pdfgen import canvas
+
+        self.prs = prs
+        self.output_path = output_path
+        self.logger = logger or logging.getLogger(__name__)
+
+        # reportlab writes the whole file on save; write beside the destination and rename
+        self._temp_path = f"{output_path}.partial"
+        self._canvas = canvas.Canvas(self._temp_path, pagesize=(pts(prs.slide_width), pts(prs.slide_height)))
+        self._renderer = VectorSlideRenderer(self._canvas, prs.slide_height)
+        self._pages = {}
+
+    def add_slides(self, slides):
+        """Draw each slide not drawn yet as the next page; image parts must still hold their data."""
+        for slide in slides:
+            if slide.part in self._pages:
+                continue
+            self._renderer.draw_slide(slide)
+            self._canvas.showPage()
+            self._pages[slide.part] = self._canvas._doc.Pages.pages[-1]
+
+    def close(self):
+        """Draw any remaining slides, put the pages in deck order and write the PDF to output_path."""
+        self.add_slides(self.prs.slides)
+
+        pages = [self._pages[slide.part] for slide in self.prs.slides]
+        set_page_order(self._canvas._doc, pages)
+
+        self._canvas.save()
+        os.replace(self._temp_path, self.output_path)
+        self.logger.info(f"PDF sink wrote {len(pages)} pages to {self.output_path}")
+
+    def abort(self):
+        """Discard the PDF; nothing is on disk until close()."""
+        try:
+            os.remove(self._temp_path)
+        except OSError:
+            pass
+
+
+def convert_pptx_to_pdf_vector(input_path, output_dir):
+    """Convert a PPTX to a PDF of vector text, shapes and embedded pictures; returns the PDF path."""
+    from pptx import Presentation
+
+    try:
+        logger.info(f"Starting vector PDF conversion for: {input_path}")
+        prs = Presentation(input_path)
+        if not prs.slides:
+            logger.error("No slides found in presentation")
+            return None
+
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+        pdf_path = os.path.join(output_dir, f"{base_name}.pdf")
+        PdfDeckSink(prs, pdf_path, logger).close()
+
+        logger.info(f"Vector PDF conversion successful: {pdf_path} ({len(prs.slides)} pages)")
+        return pdf_path
+
+    except Exception as e:
+        logger.error(f"Error in vector PDF conversion: {str(e)}")
+        return None
@@ -17,7 +17,7 @@ from .slide_creator import SlideCreator
 class PresentationAssembler(BaseGenerator):
     def __init__(self):
         super().__init__()
-        self.image_processor = ImageProcessor(self.logger)
+        self.image_processor = ImageProcessor(self.logger, self.image_index)
         self.slide_creator = SlideCreator(self, self.image_processor)
     
     def create_presentation(self, folder_structure, output_dir, annotation_option='with_annos', is_multi_tab=False, implement_video_frames=False, video_position_params=None, original_filename=None):
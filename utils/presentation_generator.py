@@ -7,20 +7,37 @@ import os
 import tempfile
 import logging
 import math
+import time
 from datetime import datetime
-from PIL import Image
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 from .image_processor import ImageProcessor
+from .image_index import ImageIndex
+from .media_pipeline import MediaPipeline
+from .deck_writer import StreamingDeckWriter, use_streaming_writer
+from .deck_stats import DeckStats, media_bytes_in, write_deck_stats
+from .pdf_converter import pdf_with_deck
+from .pdf_vector import PdfDeckSink
+from .pdf_cache import get_pdf_cache, pdf_cache_key, store_pdf
+from .slide_skeleton import SlideSkeleton
+from .layout_specs import LAYOUTS, AUTO_LAYOUTS, MANUAL_LAYOUTS, match_layout, place_images, grid_frames
+
+# Bump whenever a change alters the decks produced for the same input; cached results are keyed on it
+GENERATOR_VERSION = '2'
 
 
 class PresentationGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.image_processor = ImageProcessor(self.logger)
+        self.image_index = ImageIndex(self.logger)
+        self.image_processor = ImageProcessor(self.logger, self.image_index)
+        self.slide_skeleton = None
+        self.deck_writer = None
+        self.pdf_sink = None
+        self.deck_stats = None
         self.folder_mapping = {
             'ott': 'OTT',
             'vdxdesktopexpandable': 'DESKTOP EXPANDABLE',
@@ -145,11 +162,14 @@ class PresentationGenerator:
             original_filename (str): Original uploaded file name (without extension)
             
         Returns:
-            str: Path to the generated presentation file
+            tuple: (str, DeckStats) Path to the generated presentation file and its statistics
         """
         # Organize folder structure
         folder_structure = self._organize_folder_structure(temp_dir)
         
+        # Read every image header once up front for the layout routines
+        self.image_index.build(folder_structure)
+        
         # Create outputs directory if it doesn't exist
         output_dir = 'outputs'
         os.makedirs(output_dir, exist_ok=True)
@@ -165,7 +185,7 @@ class PresentationGenerator:
             original_filename=original_filename
         )
         
-        return ppt_path
+        return ppt_path, self.deck_stats
     
     def _organize_folder_structure(self, temp_dir):
         """
@@ -224,6 +244,10 @@ class PresentationGenerator:
         
         # Store video position parameters for use in video frames functions
         self.video_position_params = video_position_params or {}
+        self.deck_writer = None
+        self.pdf_sink = None
+        self.deck_stats = None
+        started = time.perf_counter()
         try:
             # Create a new presentation
             prs = Presentation()
@@ -232,6 +256,31 @@ class PresentationGenerator:
             prs.slide_width = Inches(13.33)
             prs.slide_height = Inches(7.5)
             
+            # Repeated slide headers and the logo are cloned from the first slide that draws them
+            self.slide_skeleton = SlideSkeleton(prs, self.logger)
+            
+            # Use original filename if provided, otherwise use date-based naming
+            if original_filename:
+                filename = f"{original_filename}.pptx"
+            else:
+                # Fallback to date-based naming
+                now = datetime.now()
+                date_part = now.strftime("%d-%B-%Y")
+                sequence = now.strftime("%S").zfill(3)
+                filename = f"{date_part}-{sequence}.pptx"
+            
+            output_path = os.path.join(output_dir, filename)
+            
+            # The deck's PDF is drawn from the same slides in memory and seeded into the PDF cache
+            if pdf_with_deck() and get_pdf_cache() is not None:
+                self.pdf_sink = PdfDeckSink(prs, f"{output_path}.pdf", self.logger)
+            
+            # Large uploads write each finished slide straight into the package instead of holding every picture until save
+            image_count = sum(len(image_paths) for image_paths in folder_structure.values())
+            if use_streaming_writer(image_count):
+                self.logger.info(f"Using streaming deck writer for {image_count} images")
+                self.deck_writer = StreamingDeckWriter(prs, output_path, self.logger, pdf_sink=self.pdf_sink)
+            
             # Title slide removed as per user request
             
             # Collect all mainunit-disclaimer.png files
@@ -295,6 +344,11 @@ class PresentationGenerator:
                             filtered_images.sort(key=lambda x: os.path.basename(x).lower())
                             all_mobile_teaser_images.extend(filtered_images)
             
+            # Start the Mobile Instream bottom crops in the background before slides are laid out
+            for folder_name, image_paths in folder_structure.items():
+                if 'vdxmobileinstream' in folder_name.lower():
+                    self.image_processor.prefetch_crops(image_paths, 774)
+            
             # Check for video folder and add as first slide if exists
             video_folder_processed = self._add_video_frames_slide_if_exists(prs, folder_structure, annotation_option)
             
@@ -316,23 +370,39 @@ class PresentationGenerator:
             self._remove_duplicate_slides(prs)
             
             # Save the presentation
-            # Use original filename if provided, otherwise use date-based naming
-            if original_filename:
-                filename = f"{original_filename}.pptx"
+            slides_done = time.perf_counter()
+            if self.deck_writer is not None:
+                self.deck_writer.close()
             else:
-                # Fallback to date-based naming
-                now = datetime.now()
-                date_part = now.strftime("%d-%B-%Y")
-                sequence = now.strftime("%S").zfill(3)
-                filename = f"{date_part}-{sequence}.pptx"
-            
-            output_path = os.path.join(output_dir, filename)
-            
-            prs.save(output_path)
+                # Downsample pictures to the resolution their placements need before writing media
+                MediaPipeline(self.logger).process(prs)
+                prs.save(output_path)
+            saved = time.perf_counter()
+            if self.pdf_sink is not None:
+                self._save_deck_pdf(output_path)
             
             # Get actual slide count (no title slide now)
             actual_slide_count = len(prs.slides)
             
+            # Record what the result page and API report, so they never reopen the deck
+            finished = time.perf_counter()
+            self.deck_stats = DeckStats(
+                slide_count=actual_slide_count,
+                folder_count=len(folder_structure),
+                image_count=image_count,
+                media_bytes=media_bytes_in(output_path),
+                output_bytes=os.path.getsize(output_path),
+                video_folder_found=bool(video_folder_processed),
+                timings={
+                    'slides': round(slides_done - started, 3),
+                    'save': round(saved - slides_done, 3),
+                    'total': round(finished - started, 3)
+                }
+            )
+            if self.pdf_sink is not None:
+                self.deck_stats.timings['pdf'] = round(finished - saved, 3)
+            write_deck_stats(output_path, self.deck_stats)
+            
             self.logger.info(f"Presentation saved to {output_path}")
             self.logger.info(f"Total slides created: {len(prs.slides)}")
             
@@ -340,7 +410,33 @@ class PresentationGenerator:
             
         except Exception as e:
             self.logger.error(f"Error creating presentation: {str(e)}")
+            if self.deck_writer is not None:
+                self.deck_writer.abort()
+            if self.pdf_sink is not None:
+                self.pdf_sink.abort()
             raise
+        finally:
+            # Temp crops and resamples are removed whether or not the deck was written
+            self.image_processor.cleanup_temp_files()
+            self.deck_writer = None
+            self.pdf_sink = None
+    
+    def _save_deck_pdf(self, output_path):
+        """Finish the PDF drawn alongside the deck and store it in the PDF cache under the saved deck's key."""
+        try:
+            self.pdf_sink.close()
+            cached = store_pdf(pdf_cache_key(output_path), self.pdf_sink.output_path)
+            if cached:
+                self.logger.info(f"PDF for {os.path.basename(output_path)} stored in the PDF cache")
+        except Exception as e:
+            # The deck is still delivered; the PDF is converted on request instead
+            self.logger.error(f"Error saving PDF alongside deck: {str(e)}")
+            self.pdf_sink.abort()
+        finally:
+            try:
+                os.remove(self.pdf_sink.output_path)
+            except OSError:
+                pass
     
     def _remove_duplicate_slides(self, prs):
         """Remove duplicate slides from presentation - identify legitimate vs duplicate slide sequences."""
@@ -1493,8 +1589,8 @@ class PresentationGenerator:
         # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
         instream_images.sort(key=self._sort_images_exact_priority)
         
-        # Use mobile instream positioning (same as Mobile In-frame 300x600)
-        self._arrange_mobile_instream_images(slide, instream_images, annotation_option)
+        # Use mobile instream positioning with the 774px bottom crop
+        self._place_layout(slide, 'mobile_instream', instream_images)
         
         # Add VDX TV logo to slide
         self._add_vdx_logo(slide)
@@ -1984,48 +2080,9 @@ class PresentationGenerator:
             end_idx = min(start_idx + images_per_slide, len(video_images))
             slide_images = video_images[start_idx:end_idx]
             
-            # Create slide with "Video Frames" title
-            slide_layout = prs.slide_layouts[5]  # Use blank slide layout
-            slide = prs.slides.add_slide(slide_layout)
-            
-            # Remove any placeholder shapes
-            self._remove_placeholders(slide)
-            
-            # Add gray rectangle background for title
-            rectangle = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                Inches(0),
-                Inches(0),
-                prs.slide_width,
-                Inches(1.79 / 2.54)  # 1.79cm converted to inches
-            )
-            rectangle.fill.solid()
-            rectangle.fill.fore_color.rgb = RGBColor(242, 242, 242)  # #F2F2F2
-            rectangle.line.color.rgb = RGBColor(242, 242, 242)
-            rectangle.shadow.inherit = False  # Remove shadow
-            
-            # Add title text box
-            title_left = Inches(0.51 / 2.54)  # 0.51cm converted to inches
-            title_top = Inches(0.38 / 2.54)   # 0.38cm converted to inches
-            title_width = Inches(12 / 2.54)   # 12cm converted to inches
-            title_height = Inches(1 / 2.54)   # 1cm converted to inches
-            
-            title_box = slide.shapes.add_textbox(title_left, title_top, title_width, title_height)
-            title_frame = title_box.text_frame
-            
-            # Set title with continuation marker for additional slides
-            if slide_num == 0:
-                title_frame.text = "Video Frames"
-            else:
-                title_frame.text = "Video Frames (Contd.)"
-            
-            # Style the title
-            title_paragraph = title_frame.paragraphs[0]
-            title_paragraph.font.name = "Aptos Display"
-            title_paragraph.font.size = Pt(18)
-            title_paragraph.font.bold = True
-            title_paragraph.alignment = PP_ALIGN.LEFT
-            title_paragraph.font.color.rgb = RGBColor(0, 0, 0)
+            # Create slide with "Video Frames" title, with a continuation marker for additional slides
+            title_text = "Video Frames" if slide_num == 0 else "Video Frames (Contd.)"
+            slide = self._new_titled_slide(prs, 'video_frames', title_text, self._add_video_frames_slide_header)
             
             # Arrange images in 3x2 grid below gray rectangle
             start_frame_number = slide_num * 6 + 1  # Continuous numbering across slides
@@ -2046,91 +2103,38 @@ class PresentationGenerator:
         
         if not images_to_use:
             return
-            
-        # Grid specifications: 3 columns, 2 rows
-        cols = 3
-        rows = 2
         
-        # Image dimensions (convert cm to inches)
-        image_width_cm = 10.33
-        image_height_cm = 5.81
-        img_width = image_width_cm / 2.54   # inches
-        img_height = image_height_cm / 2.54  # inches
+        layout = LAYOUTS['video_grid']
+        self.logger.info(f"Video grid: {len(images_to_use)} images, {layout.frames[0].width:.2f}x{layout.frames[0].height:.2f} inches each")
         
-        # Position at specific Y coordinates as requested
-        first_row_y = 3.5 / 2.54  # 3.5cm converted to inches
-        second_row_y = 11.30 / 2.54  # 11.30cm converted to inches
-        
-        # Calculate horizontal spacing to center the grid
-        total_image_width = cols * img_width
-        available_width = 13.33  # Total slide width
-        total_spacing = available_width - total_image_width
-        spacing_x = total_spacing / (cols + 1)  # Equal spacing on sides and between images
-        start_x = spacing_x
-        
-        self.logger.info(f"Video grid: {len(images_to_use)} images, {img_width:.2f}x{img_height:.2f} inches each")
-        
-        # Place images in grid
-        for i, img_path in enumerate(images_to_use):
-            row = i // cols
-            col = i % cols
+        def add_frame_label(i, img_path, frame):
+            # Add frame label below image (Frame-01, Frame-02, etc.) with continuous numbering
+            frame_label = f"Frame-{start_frame_number + i:02d}"
             
-            # Calculate position with specific Y coordinates
-            x = start_x + col * (img_width + spacing_x)
-            if row == 0:
-                y = first_row_y  # First row at 3.5cm
-            else:
-                y = second_row_y  # Second row at 11.30cm
+            # Position label centered below image, 0.1 inch below it
+            label_textbox = slide.shapes.add_textbox(
+                Inches(frame.x),
+                Inches(frame.y + frame.height + 0.1),
+                Inches(frame.width),
+                Inches(0.3)
+            )
             
-            try:
-                # Add image to slide
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x),
-                    Inches(y),
-                    Inches(img_width),
-                    Inches(img_height)
-                )
-                
-                # Add black border (0.5pt)
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                # Add frame label below image (Frame-01, Frame-02, etc.) with continuous numbering
-                frame_number = start_frame_number + i
-                frame_label = f"Frame-{frame_number:02d}"
-                
-                # Position label centered below image
-                label_y = y + img_height + 0.1  # 0.1 inch spacing below image
-                label_width = img_width
-                label_height = 0.3  # Small height for label
-                
-                label_textbox = slide.shapes.add_textbox(
-                    Inches(x),
-                    Inches(label_y),
-                    Inches(label_width),
-                    Inches(label_height)
-                )
-                
-                label_frame = label_textbox.text_frame
-                label_frame.text = frame_label
-                label_frame.margin_left = Inches(0)
-                label_frame.margin_right = Inches(0)
-                label_frame.margin_top = Inches(0)
-                label_frame.margin_bottom = Inches(0)
-                
-                # Format label text - Aptos Display, 9px, bold
-                label_paragraph = label_frame.paragraphs[0]
-                label_paragraph.font.name = "Aptos Display"
-                label_paragraph.font.size = Pt(9)
-                label_paragraph.font.bold = True
-                label_paragraph.alignment = PP_ALIGN.CENTER
-                label_paragraph.font.color.rgb = RGBColor(0, 0, 0)
-                
-                self.logger.info(f"Added video image {os.path.basename(img_path)} at position ({x:.2f}, {y:.2f}) with label '{frame_label}'")
-                
-            except Exception as e:
-                self.logger.error(f"Error adding video image {img_path}: {str(e)}")
+            label_frame = label_textbox.text_frame
+            label_frame.text = frame_label
+            label_frame.margin_left = Inches(0)
+            label_frame.margin_right = Inches(0)
+            label_frame.margin_top = Inches(0)
+            label_frame.margin_bottom = Inches(0)
+            
+            # Format label text - Aptos Display, 9px, bold
+            label_paragraph = label_frame.paragraphs[0]
+            label_paragraph.font.name = "Aptos Display"
+            label_paragraph.font.size = Pt(9)
+            label_paragraph.font.bold = True
+            label_paragraph.alignment = PP_ALIGN.CENTER
+            label_paragraph.font.color.rgb = RGBColor(0, 0, 0)
+        
+        self._place_layout(slide, 'video_grid', images_to_use, decorate=add_frame_label)
 
     def _add_mobile_expandable_engaged_slide(self, prs, folder_structure, annotation_option='with_annos'):
         """Add Mobile Expandable engaged slide(s) with same 3-position layout as consolidated teaser slide."""
@@ -2217,72 +2221,20 @@ class PresentationGenerator:
     
     def _arrange_mobile_engaged_images_with_custom_positions(self, slide, engaged_images, annotation_option='with_annos'):
         """Arrange mobile engaged images using same 3-position layout as teaser slide."""
-        # Define positioning specifications for mobile engaged images
-        # Same positions as teaser slide: 300x250, 300x600, 320x50 positions
-        positioning_specs = [
-            {  # Position 1 (300x250 position)
-                'width_cm': 8.22,
-                'height_cm': 16,
-                'horizontal_cm': 2.6,
-                'vertical_cm': 2.17
-            },
-            {  # Position 2 (300x600 position)
-                'width_cm': 8.22,
-                'height_cm': 16,
-                'horizontal_cm': 12.11,
-                'vertical_cm': 2.17
-            },
-            {  # Position 3 (320x50 position)
-                'width_cm': 8.22,
-                'height_cm': 16,
-                'horizontal_cm': 21.56,
-                'vertical_cm': 2.17
-            }
-        ]
-        
-        # Place images sequentially in the 3 positions
-        for i, img_path in enumerate(engaged_images):
-            if i >= len(positioning_specs):
-                break  # Maximum 3 images per slide
-                
-            spec = positioning_specs[i]
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['horizontal_cm'] / 2.54
-            y_inches = spec['vertical_cm'] / 2.54
-            
-            # Add image with exact positioning
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x_inches),
-                    Inches(y_inches),
-                    Inches(width_inches),
-                    Inches(height_inches)
-                )
-                
-                # Mobile images don't get borders
-                
-                # Add filename annotation if requested
-                if annotation_option == 'with_annos':
-                    # Add filename text below the image
-                    filename = os.path.basename(img_path)
-                    text_y = y_inches + height_inches + 0.1  # 0.1 inches below image
-                    filename_box = slide.shapes.add_textbox(
-                        Inches(x_inches), Inches(text_y), Inches(width_inches), Inches(0.3)
-                    )
-                    filename_box.text_frame.text = filename
-                    p = filename_box.text_frame.paragraphs[0]
-                    p.font.size = Pt(8)
-                    p.font.color.rgb = RGBColor(0, 0, 0)
-                    p.alignment = PP_ALIGN.CENTER
-                
-                self.logger.info(f"Added mobile engaged image {os.path.basename(img_path)} at position {i+1} ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding mobile engaged image {img_path}: {str(e)}")
+        def add_filename_label(i, img_path, frame):
+            # Add filename text 0.1 inches below the image
+            filename_box = slide.shapes.add_textbox(
+                Inches(frame.x), Inches(frame.y + frame.height + 0.1), Inches(frame.width), Inches(0.3)
+            )
+            filename_box.text_frame.text = os.path.basename(img_path)
+            p = filename_box.text_frame.paragraphs[0]
+            p.font.size = Pt(8)
+            p.font.color.rgb = RGBColor(0, 0, 0)
+            p.alignment = PP_ALIGN.CENTER
+        
+        # Maximum 3 images per slide, placed sequentially in the 300x250, 300x600 and 320x50 positions
+        self._place_layout(slide, 'mobile_engaged', engaged_images,
+                           decorate=add_filename_label if annotation_option == 'with_annos' else None)
 
     def _add_desktop_inframe_970x250_with_additional_slides(self, prs, folder_name, image_paths, annotation_option='with_annos'):
         """Add Desktop In-frame 970x250 slides with additional slides for remaining images using same layout."""
@@ -2386,13 +2338,93 @@ class PresentationGenerator:
         title_paragraph.font.color.rgb = RGBColor(0, 0, 0)
         
         # Use Desktop In-frame 970x250 specific positioning
-        self._arrange_desktop_inframe_970x250_images(slide, image_list, annotation_option, folder_name)
+        self._place_layout(slide, 'desktop_inframe_970x250', sorted(image_list, key=self._sort_images_exact_priority))
         
         # Add VDX TV logo to slide
         self._add_vdx_logo(slide)
         
         self.logger.info(f"Auto Tab: Created Desktop In-frame 970x250 slide {slide_number} with {len(image_list)} images")
 
+    def _new_titled_slide(self, prs, kind, title_text, build_header):
+        """Add a blank slide with a title header, cloned from the slide skeleton when one is active for prs."""
+        self._flush_finished_slides(prs)
+        if self.slide_skeleton is not None and self.slide_skeleton.prs is prs:
+            return self.slide_skeleton.add_slide(kind, title_text, build_header)
+        
+        slide = prs.slides.add_slide(prs.slide_layouts[5])  # Blank layout
+        self._remove_placeholders(slide)
+        build_header(slide, title_text)
+        return slide
+    
+    def _flush_finished_slides(self, prs):
+        """Hand the slides built so far to the streaming writer; call only when none of them will change again."""
+        if self.deck_writer is not None and self.deck_writer.prs is prs:
+            self.deck_writer.flush()
+    
+    def _add_manual_slide_header(self, slide, title_text):
+        """Add the gray title bar and title text used by Manual tab slides."""
+        # Add gray rectangle background
+        rectangle = slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE,
+            Inches(0),
+            Inches(0),
+            Inches(13.33),
+            Inches(1.79 / 2.54)
+        )
+        rectangle.fill.solid()
+        rectangle.fill.fore_color.rgb = RGBColor(242, 242, 242)
+        rectangle.line.fill.background()
+        rectangle.shadow.inherit = False  # Remove shadow
+        
+        # Add title text
+        title_text_box = slide.shapes.add_textbox(
+            Inches(0.51 / 2.54),
+            Inches(0.38 / 2.54),
+            Inches(12 / 2.54),
+            Inches(1 / 2.54)
+        )
+        title_text_frame = title_text_box.text_frame
+        title_text_frame.text = title_text
+        title_paragraph = title_text_frame.paragraphs[0]
+        title_paragraph.font.name = "Aptos Display"
+        title_paragraph.font.size = Pt(18)
+        title_paragraph.font.bold = True
+        title_paragraph.alignment = PP_ALIGN.LEFT
+        title_paragraph.font.color.rgb = RGBColor(0, 0, 0)
+    
+    def _add_video_frames_slide_header(self, slide, title_text):
+        """Add the gray title bar and title text used by Video Frames slides."""
+        # Add gray rectangle background for title, full slide width
+        rectangle = slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE,
+            Inches(0),
+            Inches(0),
+            slide.part.package.presentation_part.presentation.slide_width,
+            Inches(1.79 / 2.54)  # 1.79cm converted to inches
+        )
+        rectangle.fill.solid()
+        rectangle.fill.fore_color.rgb = RGBColor(242, 242, 242)  # #F2F2F2
+        rectangle.line.color.rgb = RGBColor(242, 242, 242)
+        rectangle.shadow.inherit = False  # Remove shadow
+        
+        # Add title text box
+        title_left = Inches(0.51 / 2.54)  # 0.51cm converted to inches
+        title_top = Inches(0.38 / 2.54)   # 0.38cm converted to inches
+        title_width = Inches(12 / 2.54)   # 12cm converted to inches
+        title_height = Inches(1 / 2.54)   # 1cm converted to inches
+        
+        title_box = slide.shapes.add_textbox(title_left, title_top, title_width, title_height)
+        title_frame = title_box.text_frame
+        title_frame.text = title_text
+        
+        # Style the title
+        title_paragraph = title_frame.paragraphs[0]
+        title_paragraph.font.name = "Aptos Display"
+        title_paragraph.font.size = Pt(18)
+        title_paragraph.font.bold = True
+        title_paragraph.alignment = PP_ALIGN.LEFT
+        title_paragraph.font.color.rgb = RGBColor(0, 0, 0)
+    
     def _add_vdx_logo(self, slide, folder_name=None):
         """Add VDX TV logo to the slide - position varies by slide type."""
         try:
@@ -2412,14 +2444,11 @@ class PresentationGenerator:
             logo_x = 31.42 / 2.54  # 31.42cm to inches
             logo_y = 0.63 / 2.54   # 0.63cm to inches
             
-            # Add logo to slide
-            logo_shape = slide.shapes.add_picture(
-                logo_path,
-                Inches(logo_x),
-                Inches(logo_y),
-                Inches(logo_width),
-                Inches(logo_height)
-            )
+            # Add logo to slide; the skeleton reuses one registered image part instead of re-reading the file
+            if self.slide_skeleton is not None and self.slide_skeleton.owns(slide):
+                self.slide_skeleton.add_logo(slide, logo_path, Inches(logo_x), Inches(logo_y), Inches(logo_width), Inches(logo_height))
+            else:
+                slide.shapes.add_picture(logo_path, Inches(logo_x), Inches(logo_y), Inches(logo_width), Inches(logo_height))
             
             self.logger.info(f"Added VDX TV logo to slide at position ({logo_x:.2f}, {logo_y:.2f})")
             
@@ -2869,96 +2898,29 @@ class PresentationGenerator:
     
     def _arrange_teaser_images_with_custom_positions(self, slide, teaser_images, annotation_option='with_annos'):
         """Arrange teaser images with specific dimensions and positions."""
-        # Define custom positioning for different ad sizes
-        positioning_specs = {
-            '970x250': {
-                'width_cm': 17.84,
-                'height_cm': 4.6,
-                'horizontal_cm': 0.7,
-                'vertical_cm': 2.13
-            },
-            '728x90': {
-                'width_cm': 16.55,
-                'height_cm': 2.05,
-                'horizontal_cm': 0.7,
-                'vertical_cm': 7.95
-            },
-            '300x250': {
-                'width_cm': 7.35,
-                'height_cm': 6.13,
-                'horizontal_cm': 0.7,
-                'vertical_cm': 11.27
-            },
-            '300x600': {
-                'width_cm': 7.57,
-                'height_cm': 15.13,
-                'horizontal_cm': 20.64,
-                'vertical_cm': 2.17
-            },
-            '160x600': {
-                'width_cm': 4.04,
-                'height_cm': 15.13,
-                'horizontal_cm': 28.99,
-                'vertical_cm': 2.14
-            }
-        }
-        
-        for img_path in teaser_images:
-            # Extract size from file path or folder name
-            size_key = self._extract_size_from_path(img_path)
+        def add_size_label(i, img_path, frame):
+            # Add dimension label 0.1 inch below the image, centered horizontally (approximate)
+            label_textbox = slide.shapes.add_textbox(
+                Inches(frame.x + (frame.width / 2) - 0.5),
+                Inches(frame.y + frame.height + 0.1),
+                Inches(1),  # Width of text box
+                Inches(0.3)  # Height of text box
+            )
             
-            if size_key in positioning_specs:
-                spec = positioning_specs[size_key]
-                
-                # Convert cm to inches
-                width_inches = spec['width_cm'] / 2.54
-                height_inches = spec['height_cm'] / 2.54
-                x_inches = spec['horizontal_cm'] / 2.54
-                y_inches = spec['vertical_cm'] / 2.54
-                
-                # Add image with exact positioning
-                try:
-                    picture_shape = slide.shapes.add_picture(
-                        img_path,
-                        Inches(x_inches),
-                        Inches(y_inches),
-                        Inches(width_inches),
-                        Inches(height_inches)
-                    )
-                    
-                    # Add border (desktop images get borders)
-                    picture_shape.line.color.rgb = RGBColor(0, 0, 0)  # Black color
-                    picture_shape.line.width = Pt(0.5)  # 0.5pt width
-                    
-                    # Add dimension label underneath the image
-                    label_y = y_inches + height_inches + 0.1  # 0.1 inch spacing below image
-                    label_x = x_inches + (width_inches / 2) - 0.5  # Center horizontally (approximate)
-                    
-                    # Create text box for dimension label
-                    label_textbox = slide.shapes.add_textbox(
-                        Inches(label_x),
-                        Inches(label_y),
-                        Inches(1),  # Width of text box
-                        Inches(0.3)  # Height of text box
-                    )
-                    
-                    # Set the label text
-                    label_textbox.text_frame.text = size_key
-                    
-                    # Format the label text
-                    label_paragraph = label_textbox.text_frame.paragraphs[0]
-                    label_paragraph.font.name = "Aptos Display"
-                    label_paragraph.font.size = Pt(10)
-                    label_paragraph.font.bold = True
-                    label_paragraph.alignment = PP_ALIGN.CENTER
-                    label_paragraph.font.color.rgb = RGBColor(0, 0, 0)  # Black text
-                    
-                    self.logger.info(f"Added teaser image {os.path.basename(img_path)} with size {size_key} at position ({x_inches:.2f}, {y_inches:.2f}) and label at ({label_x:.2f}, {label_y:.2f})")
-                        
-                except Exception as e:
-                    self.logger.error(f"Error adding teaser image {img_path}: {str(e)}")
-            else:
-                self.logger.warning(f"No positioning spec found for size {size_key} in image {img_path}")
+            # Set the label text
+            label_textbox.text_frame.text = self._extract_size_from_path(img_path)
+            
+            # Format the label text
+            label_paragraph = label_textbox.text_frame.paragraphs[0]
+            label_paragraph.font.name = "Aptos Display"
+            label_paragraph.font.size = Pt(10)
+            label_paragraph.font.bold = True
+            label_paragraph.alignment = PP_ALIGN.CENTER
+            label_paragraph.font.color.rgb = RGBColor(0, 0, 0)  # Black text
+        
+        # Each ad size has its own frame; sizes come from the file path or folder name
+        self._place_layout(slide, 'desktop_teasers', teaser_images,
+                           size_key=self._extract_size_from_path, decorate=add_size_label)
     
     def _extract_size_from_path(self, img_path):
         """Extract size key from image path or folder name."""
@@ -2983,394 +2945,32 @@ class PresentationGenerator:
     
     def _arrange_mobile_teaser_images_with_custom_positions(self, slide, mobile_teaser_images, annotation_option='with_annos'):
         """Arrange mobile teaser images with custom positioning for different sizes."""
-        # Define positioning specifications for mobile teaser images
-        # All images have same height (16cm) and width (8.22cm), only x positions differ
-        positioning_specs = {
-            '300x250': {
-                'width_cm': 8.22,
-                'height_cm': 16,
-                'horizontal_cm': 2.6,
-                'vertical_cm': 2.17
-            },
-            '300x600': {
-                'width_cm': 8.22,
-                'height_cm': 16,
-                'horizontal_cm': 12.11,
-                'vertical_cm': 2.17
-            },
-            '320x50': {
-                'width_cm': 8.22,
-                'height_cm': 16,
-                'horizontal_cm': 21.56,
-                'vertical_cm': 2.17
-            }
-        }
+        def mobile_size_key(img_path):
+            # 320x50 might not be in the folder name
+            return '320x50' if '320x50' in img_path else self._extract_size_from_path(img_path)
         
-        for img_path in mobile_teaser_images:
-            # Extract size from file path or folder name
-            size_key = self._extract_size_from_path(img_path)
-            
-            # Check for 320x50 size which might not be in folder name
-            if '320x50' in img_path or '320x50' in os.path.basename(img_path):
-                size_key = '320x50'
-            
-            if size_key in positioning_specs:
-                spec = positioning_specs[size_key]
-                
-                # Convert cm to inches
-                width_inches = spec['width_cm'] / 2.54
-                height_inches = spec['height_cm'] / 2.54
-                x_inches = spec['horizontal_cm'] / 2.54
-                y_inches = spec['vertical_cm'] / 2.54
-                
-                # Add image with exact positioning
-                try:
-                    picture_shape = slide.shapes.add_picture(
-                        img_path,
-                        Inches(x_inches),
-                        Inches(y_inches),
-                        Inches(width_inches),
-                        Inches(height_inches)
-                    )
-                    
-                    # Mobile images don't get borders
-                    # No border for mobile images
-                    
-                    self.logger.info(f"Added mobile teaser image {os.path.basename(img_path)} with size {size_key} at position ({x_inches:.2f}, {y_inches:.2f})")
-                        
-                except Exception as e:
-                    self.logger.error(f"Error adding mobile teaser image {img_path}: {str(e)}")
-            else:
-                self.logger.warning(f"No positioning spec found for size {size_key} in mobile teaser image {img_path}")
+        # All frames share the same size (8.22x16cm); only x positions differ
+        self._place_layout(slide, 'mobile_teasers', mobile_teaser_images, size_key=mobile_size_key)
     
     def _arrange_images_on_slide(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
         """Arrange images on a slide based on the number of images."""
         if not image_paths:
             return
         
-        # Special handling for Desktop In-frame images
-        if 'vdxdesktopinframe' in folder_name.lower():
-            if '160x600' in folder_name:
-                self._arrange_desktop_inframe_160x600_images(slide, image_paths, annotation_option, folder_name)
-                return
-            elif '300x250' in folder_name:
-                self._arrange_desktop_inframe_300x250_images(slide, image_paths, annotation_option, folder_name)
-                return
-            elif '300x600' in folder_name:
-                self._arrange_desktop_inframe_300x600_images(slide, image_paths, annotation_option, folder_name)
-                return
-            elif '970x250' in folder_name:
-                self._arrange_desktop_inframe_970x250_images(slide, image_paths, annotation_option, folder_name)
-                return
-            elif '728x90' in folder_name:
-                self._arrange_desktop_inframe_728x90_images(slide, image_paths, annotation_option, folder_name)
-                return
-        
-        # Special handling for Mobile In-frame images
-        if 'vdxmobileinframe' in folder_name.lower():
-            if '300x250' in folder_name:
-                self._arrange_mobile_inframe_300x250_images(slide, image_paths, annotation_option, folder_name)
-                return
-            elif '300x600' in folder_name:
-                self._arrange_mobile_inframe_300x600_images(slide, image_paths, annotation_option, folder_name)
-                return
-        
-        # Special handling for Mobile Instream images (same positioning as Mobile In-frame 300x600)
-        if 'vdxmobileinstream' in folder_name.lower():
-            self._arrange_mobile_instream_images(slide, image_paths, annotation_option, folder_name)
+        # Desktop In-frame, Mobile In-frame and Mobile Instream have fixed positions
+        layout = match_layout(AUTO_LAYOUTS, folder_name)
+        if layout:
+            # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
+            self._place_layout(slide, layout.name, sorted(image_paths, key=self._sort_images_exact_priority))
             return
         
-        # Calculate available space (excluding title area)
-        available_width = Inches(12.33)
-        available_height = Inches(5.5)
-        start_x = Inches(0.5)
-        start_y = Inches(1.79 / 2.54 + 0.2)  # Below title with margin
-        
-        num_images = len(image_paths)
-        
-        # Calculate grid dimensions
-        cols = 3 if num_images > 6 else 2
-        rows = (num_images + cols - 1) // cols
-        
-        # Calculate image dimensions with proper spacing
-        spacing = 0.25  # 0.25 inch spacing between images
-        img_width = (available_width.inches - spacing * (cols - 1)) / cols
-        img_height = (available_height.inches - spacing * (rows - 1)) / rows
-        
-
-        
-        # Place images in grid
-        for i, img_path in enumerate(image_paths):
-            row = i // cols
-            col = i % cols
-            
-            # Calculate position using simple arithmetic
-            x = start_x.inches + col * (img_width + spacing)
-            y = start_y.inches + row * (img_height + spacing + (0.4 if annotation_option == 'no_annos' else 0))
-            
-            # Pass raw numbers to avoid Inches arithmetic issues
-            self._add_image_to_slide(slide, img_path, x, y, img_width, img_height, annotation_option, folder_name)
+        # Everything else is fitted into a grid below the title
+        for img_path, cell in zip(image_paths, grid_frames(len(image_paths), annotation_option)):
+            self._add_image_to_slide(slide, img_path, cell.x, cell.y, cell.width, cell.height, annotation_option, folder_name)
     
-    def _arrange_desktop_inframe_160x600_images(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
-        """Arrange Desktop In-frame 160x600 images with specific positioning."""
-        # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
-        sorted_images = sorted(image_paths, key=self._sort_images_exact_priority)
-        
-        # Define specific positioning for Desktop In-frame 160x600
-        positioning_specs = {
-            'teaser': {
-                'height_cm': 15.98,
-                'width_cm': 4.26,
-                'x_cm': 9.93,
-                'y_cm': 2.3
-            },
-            'mainunit': {
-                'height_cm': 15.98,
-                'width_cm': 4.26,
-                'x_cm': 16.23,
-                'y_cm': 2.3
-            }
-        }
-        
-        teaser_position = positioning_specs['teaser']
-        mainunit_position = positioning_specs['mainunit']
-        
-        for i, img_path in enumerate(sorted_images):
-            # Determine image type and position
-            if os.path.basename(img_path).lower() == 'teaser.png':
-                spec = teaser_position
-                image_type = 'teaser'
-            elif os.path.basename(img_path).lower() == 'mainunit.png':
-                spec = mainunit_position
-                image_type = 'mainunit'
-            else:
-                # For additional images, use positioning based on index
-                if i == 0:
-                    spec = teaser_position
-                    image_type = 'additional_1'
-                else:
-                    spec = mainunit_position
-                    image_type = 'additional_2'
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            # Add image with exact positioning
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x_inches),
-                    Inches(y_inches),
-                    Inches(width_inches),
-                    Inches(height_inches)
-                )
-                
-                # Add border (desktop images get borders)
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)  # Black color
-                picture_shape.line.width = Pt(0.5)  # 0.5pt width
-                
-                self.logger.info(f"Added Desktop In-frame 160x600 {image_type} image {os.path.basename(img_path)} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding Desktop In-frame 160x600 image {img_path}: {str(e)}")
-    
-    def _arrange_desktop_inframe_300x250_images(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
-        """Arrange Desktop In-frame 300x250 images with specific positioning."""
-        # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
-        sorted_images = sorted(image_paths, key=self._sort_images_exact_priority)
-        
-        # Define specific positioning for Desktop In-frame 300x250
-        positioning_specs = {
-            'teaser': {
-                'height_cm': 8.53,
-                'width_cm': 10.23,
-                'x_cm': 5.35,
-                'y_cm': 4.59
-            },
-            'mainunit': {
-                'height_cm': 8.53,
-                'width_cm': 10.23,
-                'x_cm': 17.86,
-                'y_cm': 4.59
-            }
-        }
-        
-        teaser_position = positioning_specs['teaser']
-        mainunit_position = positioning_specs['mainunit']
-        
-        for i, img_path in enumerate(sorted_images):
-            # Determine image type and position
-            if os.path.basename(img_path).lower() == 'teaser.png':
-                spec = teaser_position
-                image_type = 'teaser'
-            elif os.path.basename(img_path).lower() == 'mainunit.png':
-                spec = mainunit_position
-                image_type = 'mainunit'
-            else:
-                # For additional images, use positioning based on index
-                if i == 0:
-                    spec = teaser_position
-                    image_type = 'additional_1'
-                else:
-                    spec = mainunit_position
-                    image_type = 'additional_2'
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            # Add image with exact positioning
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x_inches),
-                    Inches(y_inches),
-                    Inches(width_inches),
-                    Inches(height_inches)
-                )
-                
-                # Add border (desktop images get borders)
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)  # Black color
-                picture_shape.line.width = Pt(0.5)  # 0.5pt width
-                
-                self.logger.info(f"Added Desktop In-frame 300x250 {image_type} image {os.path.basename(img_path)} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding Desktop In-frame 300x250 image {img_path}: {str(e)}")
-    
-    def _arrange_desktop_inframe_300x600_images(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
-        """Arrange Desktop In-frame 300x600 images with specific positioning."""
-        # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
-        sorted_images = sorted(image_paths, key=self._sort_images_exact_priority)
-        
-        # Define specific positioning for Desktop In-frame 300x600
-        positioning_specs = {
-            'teaser': {
-                'height_cm': 15.33,
-                'width_cm': 7.66,
-                'x_cm': 7.63,
-                'y_cm': 2.3
-            },
-            'mainunit': {
-                'height_cm': 15.33,
-                'width_cm': 7.66,
-                'x_cm': 19.69,
-                'y_cm': 2.3
-            }
-        }
-        
-        for i, img_path in enumerate(sorted_images):
-            # Determine image type and position
-            if os.path.basename(img_path).lower() == 'teaser.png':
-                spec = positioning_specs['teaser']
-                image_type = 'teaser'
-            elif os.path.basename(img_path).lower() == 'mainunit.png':
-                spec = positioning_specs['mainunit']
-                image_type = 'mainunit'
-            else:
-                # For additional images, use positioning based on index
-                if i == 0:
-                    spec = positioning_specs['teaser']
-                    image_type = 'additional_1'
-                else:
-                    spec = positioning_specs['mainunit']
-                    image_type = 'additional_2'
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            # Add image with exact positioning
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x_inches),
-                    Inches(y_inches),
-                    Inches(width_inches),
-                    Inches(height_inches)
-                )
-                
-                # Add border (desktop images get borders)
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                self.logger.info(f"Added Desktop In-frame 300x600 {image_type} image {os.path.basename(img_path)} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding Desktop In-frame 300x600 image {img_path}: {str(e)}")
-    
-    def _arrange_desktop_inframe_970x250_images(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
-        """Arrange Desktop In-frame 970x250 images with specific positioning."""
-        # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
-        sorted_images = sorted(image_paths, key=self._sort_images_exact_priority)
-        
-        # Define specific positioning for Desktop In-frame 970x250
-        positioning_specs = {
-            'teaser': {
-                'height_cm': 5.7,
-                'width_cm': 22.1,
-                'x_cm': 1,
-                'y_cm': 2.41
-            },
-            'mainunit': {
-                'height_cm': 5.7,
-                'width_cm': 22.1,
-                'x_cm': 1,
-                'y_cm': 10.94
-            }
-        }
-        
-        for i, img_path in enumerate(sorted_images):
-            # Determine image type and position using exact filename matching
-            filename = os.path.basename(img_path).lower()
-            if filename == 'teaser.png':
-                spec = positioning_specs['teaser']
-                image_type = 'teaser'
-            elif filename == 'mainunit.png':
-                spec = positioning_specs['mainunit']
-                image_type = 'mainunit'
-            else:
-                # For additional images, use positioning based on index
-                if i == 0:
-                    spec = positioning_specs['teaser']
-                    image_type = 'additional_1'
-                else:
-                    spec = positioning_specs['mainunit']
-                    image_type = 'additional_2'
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            # Add image with exact positioning
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x_inches),
-                    Inches(y_inches),
-                    Inches(width_inches),
-                    Inches(height_inches)
-                )
-                
-                # Add border (desktop images get borders)
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                self.logger.info(f"Added Desktop In-frame 970x250 {image_type} image {os.path.basename(img_path)} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding Desktop In-frame 970x250 image {img_path}: {str(e)}")
-        
-        # Annotations disabled for Desktop In-frame 970x250 per user request
+    def _place_layout(self, slide, layout_name, image_paths, **kwargs):
+        """Place images in one of the compiled layouts from layout_specs."""
+        return place_images(slide, LAYOUTS[layout_name], image_paths, self.logger, self.image_processor, **kwargs)
     
     def _add_desktop_inframe_970x250_annotations(self, slide):
         """Add specific text boxes for Desktop In-frame 970x250 slide with annotations."""
@@ -3452,253 +3052,6 @@ class PresentationGenerator:
             except Exception as e:
                 self.logger.error(f"Error adding annotation text box: {str(e)}")
     
-    def _arrange_desktop_inframe_728x90_images(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
-        """Arrange Desktop In-frame 728x90 images with specific positioning."""
-        # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
-        sorted_images = sorted(image_paths, key=self._sort_images_exact_priority)
-        
-        # Define specific positioning for Desktop In-frame 728x90
-        positioning_specs = {
-            'teaser': {
-                'height_cm': 2.68,
-                'width_cm': 21.67,
-                'x_cm': 1,
-                'y_cm': 3.28
-            },
-            'mainunit': {
-                'height_cm': 2.68,
-                'width_cm': 21.67,
-                'x_cm': 1,
-                'y_cm': 8.66
-            }
-        }
-        
-        for i, img_path in enumerate(sorted_images):
-            # Determine image type and position using exact filename matching
-            filename = os.path.basename(img_path).lower()
-            if filename == 'teaser.png':
-                spec = positioning_specs['teaser']
-                image_type = 'teaser'
-            elif filename == 'mainunit.png':
-                spec = positioning_specs['mainunit']
-                image_type = 'mainunit'
-            else:
-                # For additional images, use positioning based on index
-                if i == 0:
-                    spec = positioning_specs['teaser']
-                    image_type = 'additional_1'
-                else:
-                    spec = positioning_specs['mainunit']
-                    image_type = 'additional_2'
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            # Add image with exact positioning
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x_inches),
-                    Inches(y_inches),
-                    Inches(width_inches),
-                    Inches(height_inches)
-                )
-                
-                # Add border (desktop images get borders)
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                self.logger.info(f"Added Desktop In-frame 728x90 {image_type} image {os.path.basename(img_path)} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding Desktop In-frame 728x90 image {img_path}: {str(e)}")
-    
-    def _arrange_mobile_inframe_300x250_images(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
-        """Arrange Mobile In-frame 300x250 images with specific positioning."""
-        # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
-        sorted_images = sorted(image_paths, key=self._sort_images_exact_priority)
-        
-        # Define specific positioning for Mobile In-frame 300x250
-        positioning_specs = {
-            'teaser': {
-                'height_cm': 16.02,
-                'width_cm': 8.23,
-                'x_cm': 5.02,
-                'y_cm': 2
-            },
-            'mainunit': {
-                'height_cm': 16.02,
-                'width_cm': 8.23,
-                'x_cm': 18.7,
-                'y_cm': 2
-            }
-        }
-        
-        for i, img_path in enumerate(sorted_images):
-            # Determine image type and position
-            if os.path.basename(img_path).lower() == 'teaser.png':
-                spec = positioning_specs['teaser']
-                image_type = 'teaser'
-            elif os.path.basename(img_path).lower() == 'mainunit.png':
-                spec = positioning_specs['mainunit']
-                image_type = 'mainunit'
-            else:
-                # For additional images, use positioning based on index
-                if i == 0:
-                    spec = positioning_specs['teaser']
-                    image_type = 'additional_1'
-                else:
-                    spec = positioning_specs['mainunit']
-                    image_type = 'additional_2'
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            # Add image with exact positioning
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x_inches),
-                    Inches(y_inches),
-                    Inches(width_inches),
-                    Inches(height_inches)
-                )
-                
-                # Mobile images don't get borders
-                # No border for mobile images
-                
-                self.logger.info(f"Added Mobile In-frame 300x250 {image_type} image {os.path.basename(img_path)} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding Mobile In-frame 300x250 image {img_path}: {str(e)}")
-    
-    def _arrange_mobile_inframe_300x600_images(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
-        """Arrange Mobile In-frame 300x600 images with specific positioning."""
-        # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
-        sorted_images = sorted(image_paths, key=self._sort_images_exact_priority)
-        
-        # Define specific positioning for Mobile In-frame 300x600
-        positioning_specs = {
-            'teaser': {
-                'height_cm': 16.02,
-                'width_cm': 8.23,
-                'x_cm': 5.02,
-                'y_cm': 2
-            },
-            'mainunit': {
-                'height_cm': 16.02,
-                'width_cm': 8.23,
-                'x_cm': 18.7,
-                'y_cm': 2
-            }
-        }
-        
-        for i, img_path in enumerate(sorted_images):
-            # Determine image type and position
-            if os.path.basename(img_path).lower() == 'teaser.png':
-                spec = positioning_specs['teaser']
-                image_type = 'teaser'
-            elif os.path.basename(img_path).lower() == 'mainunit.png':
-                spec = positioning_specs['mainunit']
-                image_type = 'mainunit'
-            else:
-                # For additional images, use positioning based on index
-                if i == 0:
-                    spec = positioning_specs['teaser']
-                    image_type = 'additional_1'
-                else:
-                    spec = positioning_specs['mainunit']
-                    image_type = 'additional_2'
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            # Add image with exact positioning
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path,
-                    Inches(x_inches),
-                    Inches(y_inches),
-                    Inches(width_inches),
-                    Inches(height_inches)
-                )
-                
-                # Mobile images don't get borders
-                # No border for mobile images
-                
-                self.logger.info(f"Added Mobile In-frame 300x600 {image_type} image {os.path.basename(img_path)} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding Mobile In-frame 300x600 image {img_path}: {str(e)}")
-    
-    def _arrange_mobile_instream_images(self, slide, image_paths, annotation_option='with_annos', folder_name=''):
-        """Arrange Mobile Instream images with cropping and specific dimensions for Auto tab."""
-        # Use exact filename priority for regular slides: teaser.png first, then mainunit.png, then sequential order
-        sorted_images = sorted(image_paths, key=self._sort_images_exact_priority)
-        
-        # Calculate slide dimensions for centering
-        slide_width_cm = 33.867  # Standard slide width in cm
-        slide_height_cm = 19.05  # Standard slide height in cm
-        
-        # Image specifications: height 11.28cm, width 12.76cm
-        img_height_cm = 11.28
-        img_width_cm = 12.76
-        
-        # Calculate spacing for centering two images
-        total_images_width = 2 * img_width_cm
-        horizontal_spacing = 2.0  # cm between images
-        total_width_with_spacing = total_images_width + horizontal_spacing
-        start_x_cm = (slide_width_cm - total_width_with_spacing) / 2
-        
-        # Vertical centering with proper spacing from gray rectangle (4cm from top)
-        y_position_cm = 4.0  # Below gray rectangle with proper spacing
-        
-        positioning_specs = {
-            'first': {'height_cm': img_height_cm, 'width_cm': img_width_cm, 'x_cm': start_x_cm, 'y_cm': y_position_cm},
-            'second': {'height_cm': img_height_cm, 'width_cm': img_width_cm, 'x_cm': start_x_cm + img_width_cm + horizontal_spacing, 'y_cm': y_position_cm}
-        }
-        
-        for i, img_path in enumerate(sorted_images[:2]):  # Only take first 2 images
-            position_key = 'first' if i == 0 else 'second'
-            spec = positioning_specs[position_key]
-            
-            # Crop image from bottom to 774px height
-            cropped_img_path = self.image_processor._crop_image_from_bottom(img_path, 774)
-            
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    cropped_img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Mobile images don't get borders
-                
-                # Determine image type for logging
-                if os.path.basename(img_path).lower() == 'teaser.png':
-                    image_type = 'teaser'
-                elif os.path.basename(img_path).lower() == 'mainunit.png':
-                    image_type = 'mainunit'
-                else:
-                    image_type = f'image_{i+1}'
-                
-                self.logger.info(f"Added Mobile Instream {image_type} image {os.path.basename(img_path)} at position ({x_inches:.2f}, {y_inches:.2f}) with cropped height 774px")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding Mobile Instream image {img_path}: {str(e)}")
-    
     def _add_image_to_slide(self, slide, image_path, x, y, max_width, max_height, annotation_option='with_annos', folder_name=''):
         """Add an image to the slide with proper sizing."""
         # Convert all input values to inches (numbers) first
@@ -3710,8 +3063,7 @@ class PresentationGenerator:
         try:
             
             # Get image dimensions
-            with Image.open(image_path) as img:
-                img_width, img_height = img.size
+            img_width, img_height = self.image_index.size(image_path)
             
             # Calculate aspect ratio
             aspect_ratio = img_width / img_height
@@ -3806,8 +3158,7 @@ class PresentationGenerator:
         for i, img_path in enumerate(disclaimer_files):
             try:
                 # Get image dimensions to calculate width based on aspect ratio
-                with Image.open(img_path) as img:
-                    img_width, img_height = img.size
+                img_width, img_height = self.image_index.size(img_path)
                 
                 # Calculate aspect ratio
                 aspect_ratio = img_width / img_height
@@ -3847,9 +3198,7 @@ class PresentationGenerator:
     def _get_aspect_ratio(self, img_path):
         """Get aspect ratio of an image."""
         try:
-            with Image.open(img_path) as img:
-                img_width, img_height = img.size
-                return img_width / img_height
+            return self.image_index.aspect_ratio(img_path)
         except:
             return 1.0  # Default aspect ratio if image can't be opened
     
@@ -3922,46 +3271,11 @@ class PresentationGenerator:
                 slide_images = filtered_images[i:i + images_per_slide]
                 slide_number = (i // images_per_slide) + 1
                 
-                # Create slide
-                slide_layout = prs.slide_layouts[5]  # Blank layout
-                slide = prs.slides.add_slide(slide_layout)
-                
-                # Remove placeholder shapes
-                self._remove_placeholders(slide)
-                
-                # Add title background and text
+                # Create slide with title background and text
                 title_text = self._format_folder_name(folder_name)
                 if slide_number > 1:
                     title_text += " (Contd.)"
-                
-                # Add gray rectangle background
-                rectangle = slide.shapes.add_shape(
-                    MSO_SHAPE.RECTANGLE,
-                    Inches(0),
-                    Inches(0),
-                    Inches(13.33),
-                    Inches(1.79 / 2.54)
-                )
-                rectangle.fill.solid()
-                rectangle.fill.fore_color.rgb = RGBColor(242, 242, 242)
-                rectangle.line.fill.background()
-                rectangle.shadow.inherit = False  # Remove shadow
-                
-                # Add title text
-                title_text_box = slide.shapes.add_textbox(
-                    Inches(0.51 / 2.54),
-                    Inches(0.38 / 2.54),
-                    Inches(12 / 2.54),
-                    Inches(1 / 2.54)
-                )
-                title_text_frame = title_text_box.text_frame
-                title_text_frame.text = title_text.upper()
-                title_paragraph = title_text_frame.paragraphs[0]
-                title_paragraph.font.name = "Aptos Display"
-                title_paragraph.font.size = Pt(18)
-                title_paragraph.font.bold = True
-                title_paragraph.alignment = PP_ALIGN.LEFT
-                title_paragraph.font.color.rgb = RGBColor(0, 0, 0)
+                slide = self._new_titled_slide(prs, 'manual', title_text.upper(), self._add_manual_slide_header)
                 
                 # Add images with format-specific positioning
                 is_first_slide = (slide_number == 1)
@@ -4190,17 +3504,12 @@ class PresentationGenerator:
         # Use the same positioning logic as Auto tab but with sequential image assignment
         elif 'vdxdesktopinframe' in folder_name.lower():
             self.logger.info("Taking vdxdesktopinframe path")
+            layout = match_layout(MANUAL_LAYOUTS, folder_name)
             if '970x250' in folder_name:
                 self.logger.info("Calling _arrange_desktop_inframe_970x250_images_manual")
                 self._arrange_desktop_inframe_970x250_images_manual(slide, image_paths, annotation_option, folder_name, is_first_slide)
-            elif '300x250' in folder_name:
-                self._arrange_desktop_inframe_300x250_images_manual(slide, image_paths, annotation_option, folder_name)
-            elif '300x600' in folder_name:
-                self._arrange_desktop_inframe_300x600_images_manual(slide, image_paths, annotation_option, folder_name)
-            elif '160x600' in folder_name:
-                self._arrange_desktop_inframe_160x600_images_manual(slide, image_paths, annotation_option, folder_name)
-            elif '728x90' in folder_name:
-                self._arrange_desktop_inframe_728x90_images_manual(slide, image_paths, annotation_option, folder_name)
+            elif layout:
+                self._place_layout(slide, layout.name, image_paths)
             else:
                 self._arrange_images_on_slide(slide, image_paths, annotation_option, folder_name)
         elif 'mobile' in folder_name.lower():
@@ -4215,42 +3524,11 @@ class PresentationGenerator:
     
     def _arrange_desktop_inframe_970x250_images_manual(self, slide, image_paths, annotation_option, folder_name, is_first_slide=True):
         """Arrange Desktop In-frame 970x250 images sequentially for Manual tab."""
-        # Different dimensions for "With Annos" first slide
+        # Smaller frames on the "With Annos" first slide leave room for the annotations
         if annotation_option == 'with_annos' and is_first_slide:
-            positioning_specs = {
-                'first': {'height_cm': 6.12, 'width_cm': 23.7, 'x_cm': 1, 'y_cm': 2.41},
-                'second': {'height_cm': 6.12, 'width_cm': 23.7, 'x_cm': 1, 'y_cm': 10.94}
-            }
+            self._place_layout(slide, 'desktop_inframe_970x250_manual_annotated', image_paths)
         else:
-            # Standard dimensions for all other cases
-            positioning_specs = {
-                'first': {'height_cm': 7.12, 'width_cm': 27.59, 'x_cm': 1, 'y_cm': 2.41},
-                'second': {'height_cm': 7.12, 'width_cm': 27.59, 'x_cm': 1, 'y_cm': 10.94}
-            }
-        
-        for i, img_path in enumerate(image_paths[:2]):  # Max 2 images per slide
-            position_key = 'first' if i == 0 else 'second'
-            spec = positioning_specs[position_key]
-            
-            # Convert cm to inches
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Add border
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                self.logger.info(f"Manual: Added Desktop In-frame 970x250 image {i+1} at position ({x_inches:.2f}, {y_inches:.2f}) with dims {spec['width_cm']}x{spec['height_cm']}cm")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Desktop In-frame 970x250 image {img_path}: {str(e)}")
+            self._place_layout(slide, 'desktop_inframe_970x250_manual', image_paths)
         
         # Add teaser state text box only for "With Annos" first slide
         self.logger.info(f"Desktop In-frame 970x250 annotation check: annotation_option={annotation_option}, is_first_slide={is_first_slide}")
@@ -4612,362 +3890,22 @@ class PresentationGenerator:
         
         self.logger.info("Added Global text box for Desktop In-frame 970x250 slide")
     
-    def _arrange_desktop_inframe_300x250_images_manual(self, slide, image_paths, annotation_option, folder_name):
-        """Arrange Desktop In-frame 300x250 images sequentially for Manual tab with up to 6 images per slide."""
-        # Calculate positioning for 6 images in 2 rows of 3 columns
-        # Gray rectangle height is 1.79cm, so start Y position is below it with breathing space
-        start_y_cm = 1.79 + 0.5  # 0.5cm breathing space below gray rectangle
-        
-        # Available slide dimensions (standard 16:9 slide is 33.87cm x 19.05cm)
-        available_width_cm = 33.87 - 1.0  # 0.5cm margin on each side
-        available_height_cm = 19.05 - start_y_cm - 0.5  # 0.5cm bottom margin
-        
-        # Calculate dimensions for 6 images in 3x2 grid
-        columns = 3
-        rows = 2
-        spacing_cm = 0.5  # Space between images
-        
-        # Fixed dimensions per requirements
-        image_width_cm = 9.48  # Fixed width 9.48cm
-        image_height_cm = 7.9  # Fixed height 7.9cm
-        
-        # Calculate starting position to center the grid
-        total_width_needed = columns * image_width_cm + (columns - 1) * spacing_cm
-        slide_width_cm = 33.87  # Standard 16:9 slide width
-        start_x_cm = (slide_width_cm - total_width_needed) / 2  # Center horizontally
-        
-        # Process up to 6 images per slide
-        for i, img_path in enumerate(image_paths[:6]):
-            row = i // columns
-            col = i % columns
-            
-            x_cm = start_x_cm + col * (image_width_cm + spacing_cm)
-            y_cm = start_y_cm + row * (image_height_cm + spacing_cm)
-            
-            width_inches = image_width_cm / 2.54
-            height_inches = image_height_cm / 2.54
-            x_inches = x_cm / 2.54
-            y_inches = y_cm / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Add black border
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                self.logger.info(f"Manual Desktop In-frame 300x250: Added image {i+1} at position ({x_cm:.2f}, {y_cm:.2f})cm, size ({image_width_cm:.2f}x{image_height_cm:.2f})cm")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Desktop In-frame 300x250 image {img_path}: {str(e)}")
-    
-    def _arrange_desktop_inframe_300x600_images_manual(self, slide, image_paths, annotation_option, folder_name):
-        """Arrange Desktop In-frame 300x600 images sequentially for Manual tab with up to 4 images per slide."""
-        # Calculate positioning for 4 images in 1 row of 4 columns
-        # Gray rectangle height is 1.79cm, so start Y position is below it with breathing space
-        start_y_cm = 1.79 + 0.5  # 0.5cm breathing space below gray rectangle
-        
-        # Available slide dimensions (standard 16:9 slide is 33.87cm x 19.05cm)
-        available_width_cm = 33.87 - 1.0  # 0.5cm margin on each side
-        available_height_cm = 19.05 - start_y_cm - 0.5  # 0.5cm bottom margin
-        
-        # Calculate dimensions for 4 images in 1x4 grid
-        columns = 4
-        rows = 1
-        spacing_cm = 0.5  # Space between images
-        
-        # Calculate image dimensions
-        image_width_cm = (available_width_cm - (columns - 1) * spacing_cm) / columns
-        image_height_cm = max(15.33, available_height_cm)  # Minimum 15.33cm height
-        
-        # Starting positions
-        start_x_cm = 0.5  # Left margin
-        
-        # Process up to 4 images per slide
-        for i, img_path in enumerate(image_paths[:4]):
-            col = i % columns
-            
-            x_cm = start_x_cm + col * (image_width_cm + spacing_cm)
-            y_cm = start_y_cm
-            
-            width_inches = image_width_cm / 2.54
-            height_inches = image_height_cm / 2.54
-            x_inches = x_cm / 2.54
-            y_inches = y_cm / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Add black border
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                self.logger.info(f"Manual Desktop In-frame 300x600: Added image {i+1} at position ({x_cm:.2f}, {y_cm:.2f})cm, size ({image_width_cm:.2f}x{image_height_cm:.2f})cm")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Desktop In-frame 300x600 image {img_path}: {str(e)}")
-    
-    def _arrange_desktop_inframe_160x600_images_manual(self, slide, image_paths, annotation_option, folder_name):
-        """Arrange Desktop In-frame 160x600 images sequentially for Manual tab with up to 7 images per slide."""
-        # X positions for up to 7 images as specified by user
-        x_positions_cm = [0.83, 5.58, 10.33, 15.01, 19.68, 24.36, 29.04]
-        
-        # Fixed dimensions and Y position for all images
-        height_cm = 15.98
-        width_cm = 4.26
-        y_cm = 2.3
-        
-        # Process up to 7 images per slide
-        for i, img_path in enumerate(image_paths[:7]):
-            x_cm = x_positions_cm[i]
-            
-            width_inches = width_cm / 2.54
-            height_inches = height_cm / 2.54
-            x_inches = x_cm / 2.54
-            y_inches = y_cm / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Add black border
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                self.logger.info(f"Manual Desktop In-frame 160x600: Added image {i+1} at position ({x_cm}, {y_cm})cm")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Desktop In-frame 160x600 image {img_path}: {str(e)}")
-    
-    def _arrange_desktop_inframe_728x90_images_manual(self, slide, image_paths, annotation_option, folder_name):
-        """Arrange Desktop In-frame 728x90 images sequentially for Manual tab with up to 5 images stacked vertically."""
-        # Calculate positioning for 5 images stacked vertically
-        # Gray rectangle height is 1.79cm, so start Y position is below it with breathing space
-        start_y_cm = 1.79 + 0.5  # 0.5cm breathing space below gray rectangle
-        
-        # Available slide dimensions (standard 16:9 slide is 33.87cm x 19.05cm)
-        available_width_cm = 33.87 - 1.0  # 0.5cm margin on each side
-        available_height_cm = 19.05 - start_y_cm - 0.5  # 0.5cm bottom margin
-        
-        # Calculate dimensions for 5 images stacked vertically
-        rows = 5
-        columns = 1
-        spacing_cm = 0.3  # Space between images (smaller for vertical stack)
-        
-        # Calculate image dimensions with constraints
-        calculated_height = (available_height_cm - (rows - 1) * spacing_cm) / rows
-        image_height_cm = max(2.68, min(3.0, calculated_height))  # Minimum 2.68cm, maximum 3cm height
-        image_width_cm = min(24.21, available_width_cm)  # Maximum 24.21cm width
-        
-        # Starting positions
-        start_x_cm = 0.5  # Left margin
-        
-        # Process up to 5 images per slide
-        for i, img_path in enumerate(image_paths[:5]):
-            row = i
-            
-            x_cm = start_x_cm
-            y_cm = start_y_cm + row * (image_height_cm + spacing_cm)
-            
-            width_inches = image_width_cm / 2.54
-            height_inches = image_height_cm / 2.54
-            x_inches = x_cm / 2.54
-            y_inches = y_cm / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Add black border
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)
-                picture_shape.line.width = Pt(0.5)
-                
-                self.logger.info(f"Manual Desktop In-frame 728x90: Added image {i+1} at position ({x_cm:.2f}, {y_cm:.2f})cm, size ({image_width_cm:.2f}x{image_height_cm:.2f})cm")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Desktop In-frame 728x90 image {img_path}: {str(e)}")
-    
     def _arrange_mobile_images_manual(self, slide, image_paths, annotation_option, folder_name, is_first_slide=True):
         """Arrange mobile images sequentially for Manual tab with up to 4 images - 1x1 grid layout."""
-        # Calculate positioning for mobile images
-        # Gray rectangle height is 1.79cm, so start Y position is below it with breathing space
-        start_y_cm = 1.79 + 0.5  # 0.5cm breathing space below gray rectangle
-        
-        # Fixed dimensions per requirements
-        image_width_cm = 8.06  # Maximum width 8.06cm
-        image_height_cm = 15.67  # Fixed height 15.67cm
-        spacing_cm = 0.5  # Space between images
-        
-        # Calculate starting X position based on number of images
-        num_images = min(len(image_paths), 4)  # Process up to 4 images
-        slide_width_cm = 33.87  # Standard 16:9 slide width
-        
-        if num_images == 1:
-            # Single image - center horizontally
-            start_x_cm = (slide_width_cm - image_width_cm) / 2
-        else:
-            # Multiple images - center the group horizontally
-            total_width_needed = num_images * image_width_cm + (num_images - 1) * spacing_cm
-            start_x_cm = (slide_width_cm - total_width_needed) / 2
-        
-        # Process up to 4 images per slide
-        for i, img_path in enumerate(image_paths[:4]):
-            if num_images == 1:
-                x_cm = start_x_cm  # Single image centered
-            else:
-                x_cm = start_x_cm + i * (image_width_cm + spacing_cm)  # Multiple images spaced
-            
-            y_cm = start_y_cm
-            
-            width_inches = image_width_cm / 2.54
-            height_inches = image_height_cm / 2.54
-            x_inches = x_cm / 2.54
-            y_inches = y_cm / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Mobile images have no borders (following existing mobile image rules)
-                # No border for mobile images
-                
-                self.logger.info(f"Manual mobile: Added image {i+1} at position ({x_cm:.2f}, {y_cm:.2f})cm, size ({image_width_cm:.2f}x{image_height_cm:.2f})cm")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual mobile image {img_path}: {str(e)}")
+        # Up to 4 images centred as a group; mobile images have no borders
+        if image_paths:
+            self._place_layout(slide, f'mobile_manual_{min(len(image_paths), 4)}', image_paths)
         
         # Add descriptive text boxes for Mobile In-frame 300x250 first slide with "With Annos" option
         if is_first_slide and annotation_option == 'with_annos' and 'vdxmobileinframe' in folder_name.lower() and '300x250' in folder_name:
             self._add_mobile_inframe_300x250_textbox(slide)
             self._add_mobile_inframe_300x250_animation_textbox(slide)
     
-    def _arrange_mobile_inframe_300x250_images_manual(self, slide, image_paths, annotation_option, folder_name):
-        """Arrange Mobile In-frame 300x250 images sequentially for Manual tab."""
-        positioning_specs = {
-            'first': {'height_cm': 16.02, 'width_cm': 8.23, 'x_cm': 5.02, 'y_cm': 2},
-            'second': {'height_cm': 16.02, 'width_cm': 8.23, 'x_cm': 18.7, 'y_cm': 2}
-        }
-        
-        for i, img_path in enumerate(image_paths[:2]):
-            position_key = 'first' if i == 0 else 'second'
-            spec = positioning_specs[position_key]
-            
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Mobile images don't get borders
-                
-                self.logger.info(f"Manual Mobile In-frame 300x250: Added image {i+1} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Mobile In-frame 300x250 image {img_path}: {str(e)}")
-    
-    def _arrange_mobile_inframe_300x600_images_manual(self, slide, image_paths, annotation_option, folder_name):
-        """Arrange Mobile In-frame 300x600 images sequentially for Manual tab."""
-        positioning_specs = {
-            'first': {'height_cm': 16.02, 'width_cm': 8.23, 'x_cm': 5.02, 'y_cm': 2},
-            'second': {'height_cm': 16.02, 'width_cm': 8.23, 'x_cm': 18.7, 'y_cm': 2}
-        }
-        
-        for i, img_path in enumerate(image_paths[:2]):
-            position_key = 'first' if i == 0 else 'second'
-            spec = positioning_specs[position_key]
-            
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Mobile images don't get borders
-                
-                self.logger.info(f"Manual Mobile In-frame 300x600: Added image {i+1} at position ({x_inches:.2f}, {y_inches:.2f})")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Mobile In-frame 300x600 image {img_path}: {str(e)}")
-    
     def _arrange_mobile_instream_images_manual(self, slide, image_paths, annotation_option, folder_name, is_first_slide=True):
         """Arrange Mobile Instream images sequentially for Manual tab with cropping and specific dimensions."""
-        # Fixed dimensions: height 11.28cm, width 12.76cm
-        # Two images with specific positioning
-        
-        # Image specifications
-        img_height_cm = 11.28
-        img_width_cm = 12.76
-        
-        if is_first_slide:
-            # Special positioning for first slide: x=6.13cm, y=4cm with 0.5cm gap
-            start_x_cm = 6.13
-            y_position_cm = 4.0
-            horizontal_spacing = 0.5  # 0.5cm gap between images
-        else:
-            # Calculate spacing for centering two images for continuation slides
-            slide_width_cm = 33.867  # Standard slide width in cm
-            total_images_width = 2 * img_width_cm
-            horizontal_spacing = 2.0  # cm between images
-            total_width_with_spacing = total_images_width + horizontal_spacing
-            start_x_cm = (slide_width_cm - total_width_with_spacing) / 2
-            y_position_cm = 4.0  # Below gray rectangle with proper spacing
-        
-        positioning_specs = {
-            'first': {'height_cm': img_height_cm, 'width_cm': img_width_cm, 'x_cm': start_x_cm, 'y_cm': y_position_cm},
-            'second': {'height_cm': img_height_cm, 'width_cm': img_width_cm, 'x_cm': start_x_cm + img_width_cm + horizontal_spacing, 'y_cm': y_position_cm}
-        }
-        
-        for i, img_path in enumerate(image_paths[:2]):
-            position_key = 'first' if i == 0 else 'second'
-            spec = positioning_specs[position_key]
-            
-            # Crop image from bottom to 774px height
-            cropped_img_path = self.image_processor._crop_image_from_bottom(img_path, 774)
-            
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    cropped_img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Mobile images don't get borders
-                
-                self.logger.info(f"Manual Mobile Instream: Added image {i+1} at position ({x_inches:.2f}, {y_inches:.2f}) with cropped height 774px")
-                    
-                # Clean up temporary cropped file if it was created
-                if cropped_img_path != img_path:
-                    try:
-                        os.unlink(cropped_img_path)
-                    except:
-                        pass  # Ignore cleanup errors
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Mobile Instream image {img_path}: {str(e)}")
-                # Clean up temporary file on error
-                if cropped_img_path != img_path:
-                    try:
-                        os.unlink(cropped_img_path)
-                    except:
-                        pass
+        # Images are cropped from the bottom to 774px; the first slide sits at x=6.13cm with a 0.5cm gap,
+        # continuation slides centre the pair with a 2cm gap
+        self._place_layout(slide, 'mobile_instream_manual_first' if is_first_slide else 'mobile_instream_manual', image_paths)
         
         # Add descriptive text box only for first slide and "With Annos" option
         if is_first_slide and annotation_option == 'with_annos':
@@ -5253,14 +4191,12 @@ class PresentationGenerator:
                     
                     # Check image dimensions - skip if smaller than 1900x1092
                     try:
-                        from PIL import Image
-                        with Image.open(img_path) as img:
-                            width, height = img.size
-                            if width >= 1900 and height >= 1092:
-                                filtered_images.append(img_path)
-                                self.logger.info(f"Desktop Expandable: Including image {os.path.basename(img_path)} ({width}x{height})")
-                            else:
-                                self.logger.info(f"Desktop Expandable: Skipping image {os.path.basename(img_path)} ({width}x{height}) - too small (requires ≥1900x1092)")
+                        width, height = self.image_index.size(img_path)
+                        if width >= 1900 and height >= 1092:
+                            filtered_images.append(img_path)
+                            self.logger.info(f"Desktop Expandable: Including image {os.path.basename(img_path)} ({width}x{height})")
+                        else:
+                            self.logger.info(f"Desktop Expandable: Skipping image {os.path.basename(img_path)} ({width}x{height}) - too small (requires ≥1900x1092)")
                     except Exception as e:
                         self.logger.warning(f"Desktop Expandable: Could not read dimensions for {os.path.basename(img_path)}: {str(e)}")
                         # Skip images that can't be read
@@ -5334,36 +4270,8 @@ class PresentationGenerator:
     
     def _arrange_desktop_expandable_images_manual(self, slide, image_paths, annotation_option):
         """Arrange Desktop Expandable images with specific positioning for Manual tab."""
-        
-        # User requirements: height 8.64cm, width 16.02cm, y = 4.69cm
-        # Two images per slide with proper positioning
-        positioning_specs = {
-            'first': {'height_cm': 8.64, 'width_cm': 16.02, 'x_cm': 1, 'y_cm': 4.69},
-            'second': {'height_cm': 8.64, 'width_cm': 16.02, 'x_cm': 17.45, 'y_cm': 4.69}
-        }
-        
-        for i, img_path in enumerate(image_paths[:2]):
-            position_key = 'first' if i == 0 else 'second'
-            spec = positioning_specs[position_key]
-            
-            width_inches = spec['width_cm'] / 2.54
-            height_inches = spec['height_cm'] / 2.54
-            x_inches = spec['x_cm'] / 2.54
-            y_inches = spec['y_cm'] / 2.54
-            
-            try:
-                picture_shape = slide.shapes.add_picture(
-                    img_path, Inches(x_inches), Inches(y_inches), Inches(width_inches), Inches(height_inches)
-                )
-                
-                # Desktop Expandable images get black borders
-                picture_shape.line.color.rgb = RGBColor(0, 0, 0)  # Black color
-                picture_shape.line.width = Pt(0.5)  # 0.5pt width
-                
-                self.logger.info(f"Manual Desktop Expandable: Added image {i+1} at position ({x_inches:.2f}, {y_inches:.2f})in, size ({width_inches:.2f}x{height_inches:.2f})in")
-                    
-            except Exception as e:
-                self.logger.error(f"Error adding manual Desktop Expandable image {img_path}: {str(e)}")
+        # Two bordered images per slide: height 8.64cm, width 16.02cm, y = 4.69cm
+        self._place_layout(slide, 'desktop_expandable_manual', image_paths)
     
     def _add_full_isi_slide_manual(self, prs, annotation_option):
         """Add blank FULL ISI slide as the last slide for Manual tab."""
@@ -0,0 +1,179 @@
+"""
+Content-addressed cache of generated decks with in-flight job coalescing.
+Identical uploads reuse the finished PPTX or attach to the job already producing it.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from typing import Optional, Dict, Any, Callable
+
+from .atomic_file import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Maps generation inputs to finished results; entries are JSON files validated against the output on disk."""
+
+    def __init__(self, cache_dir: str, output_dir: str):
+        self.cache_dir = cache_dir
+        self.output_dir = output_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        logger.info(f"ResultCache initialized - entries in {cache_dir}")
+
+    @staticmethod
+    def make_key(content_hash: str, annotation_option: str = 'with_annos', implement_video_frames: bool = False,
+                 video_position_params: Optional[Dict[str, Any]] = None, filename: Optional[str] = None) -> str:
+        """Build the cache key for one set of generation inputs.
+
+        The upload's filename is part of the inputs: single images are laid out by
+        their name, and every deck is named after its upload.
+        """
+        from utils.presentation_generator import GENERATOR_VERSION
+        from utils.media_pipeline import media_settings
+
+        inputs = {
+            'content_hash': content_hash,
+            'filename': filename,
+            'annotation_option': annotation_option,
+            'implement_video_frames': bool(implement_video_frames),
+            'video_position_params': video_position_params or None,
+            'generator_version': GENERATOR_VERSION,
+            'media': media_settings()
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key if its PPTX is still the one that was generated."""
+        entry = self._read_json(self._entry_path(key))
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(entry['output_path'])
+        except (OSError, KeyError):
+            stat = None
+
+        # Outputs are named after the upload, so a later deck with the same name replaces ours
+        if stat is None or stat.st_size != entry.get('output_size') or stat.st_mtime_ns != entry.get('output_mtime_ns'):
+            logger.info(f"Result cache entry {key[:12]} is stale, discarding")
+            self._remove(self._entry_path(key))
+            return None
+
+        logger.info(f"Result cache hit {key[:12]} -> {os.path.basename(entry['output_path'])}")
+        return entry['result']
+
+    def store(self, key: str, result: Dict[str, Any]) -> bool:
+        """Record a successful result against key."""
+        output_filename = result.get('output_filename') or result.get('ppt_file')
+        if not output_filename:
+            return False
+
+        output_path = os.path.join(self.output_dir, os.path.basename(output_filename))
+        try:
+            stat = os.stat(output_path)
+            self._write_json(self._entry_path(key), {
+                'result': result,
+                'output_path': output_path,
+                'output_size': stat.st_size,
+                'output_mtime_ns': stat.st_mtime_ns
+            })
+            logger.info(f"Cached result {key[:12]} -> {output_filename}")
+            return True
+        except Exception as e:
+            logger.error(f"Error caching result {key[:12]}: {str(e)}")
+            return False
+
+    def claim(self, key: str, job_id: str, is_active: Callable[[str], bool]) -> Optional[str]:
+        """Register job_id as the producer of key.
+
+        Returns None when the claim succeeds, or the ID of a job that is already
+        producing the same result. Markers left by jobs that are no longer active
+        are taken over.
+        """
+        path = self._inflight_path(key)
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                existing = self._read_marker(path)
+                if existing and existing != job_id and is_active(existing):
+                    logger.info(f"Coalescing onto in-flight job {existing} for {key[:12]}")
+                    return existing
+                logger.info(f"Taking over stale in-flight marker for {key[:12]}")
+                self._remove(path)
+                continue
+            with os.fdopen(fd, 'w') as f:
+                f.write(job_id)
+            return None
+
+        logger.warning(f"Could not claim in-flight marker for {key[:12]}, running without coalescing")
+        return None
+
+    def release(self, key: str, job_id: str):
+        """Drop the in-flight marker for key if job_id still owns it."""
+        path = self._inflight_path(key)
+        if self._read_marker(path) == job_id:
+            self._remove(path)
+
+    def run_and_store(self, key: str, job_id: str, func: Callable[..., Dict[str, Any]], *args, **kwargs) -> Dict[str, Any]:
+        """Job wrapper: run func, cache a successful result and release the in-flight marker."""
+        try:
+            result = func(*args, **kwargs)
+            if result and result.get('success'):
+                self.store(key, result)
+            return result
+        finally:
+            self.release(key, job_id)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _inflight_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.inflight")
+
+    @staticmethod
+    def _read_marker(path: str) -> Optional[str]:
+        try:
+            with open(path, 'r') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read_json(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading cache entry {path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]):
+        with atomic_write(path) as f:
+            json.dump(data, f, default=str)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+# Global instance
+result_cache = None
+
+def initialize_result_cache(cache_dir: Optional[str] = None, output_dir: Optional[str] = None):
+    """Initialize the generation result cache."""
+    global result_cache
+    output_dir = output_dir or os.path.join(os.getcwd(), 'outputs')
+    cache_dir = cache_dir or os.path.join(output_dir, '.cache', 'results')
+    result_cache = ResultCache(cache_dir, output_dir)
+    return result_cache
@@ -18,17 +18,33 @@ class SlideCreator:
     
     def _create_slide_with_title(self, prs, title_text):
         """Create a new slide with gray title background."""
+        writer = getattr(self.base_generator, 'deck_writer', None)
+        if writer is not None and writer.prs is prs:
+            writer.flush()
+        skeleton = getattr(self.base_generator, 'slide_skeleton', None)
+        if skeleton is not None and skeleton.prs is prs:
+            return skeleton.add_slide('full_isi', title_text, self._add_title_header)
+        
         slide_layout = prs.slide_layouts[5]  # Blank layout
         slide = prs.slides.add_slide(slide_layout)
         
         # Remove all placeholder shapes to prevent "Title 1" text
         self.base_generator._remove_placeholders(slide)
-        
+        self._add_title_header(slide, title_text)
+        return slide
+    
+    def _add_vdx_logo(self, slide):
+        """Add the VDX TV logo through the generator, whose slide skeleton reuses one logo image part per deck."""
+        add_logo = getattr(self.base_generator, '_add_vdx_logo', None) or self.image_processor._add_vdx_logo
+        add_logo(slide)
+    
+    def _add_title_header(self, slide, title_text):
+        """Add the gray title background and title text box."""
         # Add gray rectangle background for title (1.79cm height)
         title_bg = slide.shapes.add_shape(
             MSO_SHAPE.RECTANGLE,
             Inches(0), Inches(0), 
-            prs.slide_width, Inches(1.79 / 2.54)  # Convert cm to inches
+            slide.part.package.presentation_part.presentation.slide_width, Inches(1.79 / 2.54)  # Convert cm to inches
         )
         title_bg.fill.solid()
         title_bg.fill.fore_color.rgb = RGBColor(242, 242, 242)  # #F2F2F2 color
@@ -57,8 +73,6 @@ class SlideCreator:
         paragraph.font.bold = True
         paragraph.alignment = PP_ALIGN.LEFT
         paragraph.font.color.rgb = RGBColor(0, 0, 0)  # Black text
-        
-        return slide
     
     def _add_disclaimer_images(self, slide, disclaimer_files):
         """Add disclaimer images to a slide with fixed height of 14cm."""
@@ -109,16 +123,13 @@ class SlideCreator:
         """Check if any disclaimer images have height > 1000px and need splitting."""
         if not disclaimer_files:
             return False
-            
-        from PIL import Image
         
         for img_path in disclaimer_files:
             try:
-                with Image.open(img_path) as img:
-                    width, height = img.size
-                    if height > 1000:
-                        self.logger.info(f"Image {img_path} has height {height}px > 1000px, will need splitting")
-                        return True
+                width, height = self.image_processor.image_index.size(img_path)
+                if height > 1000:
+                    self.logger.info(f"Image {img_path} has height {height}px > 1000px, will need splitting")
+                    return True
             except Exception as e:
                 self.logger.error(f"Error checking image dimensions for {img_path}: {str(e)}")
                 continue
@@ -127,77 +138,111 @@ class SlideCreator:
     
     def _create_split_full_isi_slides(self, prs, disclaimer_files):
         """Create multiple FULL ISI slides for tall disclaimer images."""
-        from PIL import Image
-        import tempfile
         import os
         
         slides_created = 0
+        max_height_per_part = 1000
+        
+        # Crop every tall image up front so part encoding overlaps on the image thread pool
+        split_parts = {}
+        for img_path in disclaimer_files:
+            try:
+                if self.image_processor.image_index.get(img_path).height > max_height_per_part:
+                    split_parts[img_path] = self._split_image_into_parts(img_path, max_height_per_part)
+            except Exception as e:
+                self.logger.error(f"Error preparing split parts for {img_path}: {str(e)}")
         
         for img_path in disclaimer_files:
             try:
-                with Image.open(img_path) as img:
-                    width, height = img.size
+                width, height = self.image_processor.image_index.size(img_path)
+                
+                if img_path not in split_parts:
+                    # Regular height image - add to single slide
+                    slide = self._create_slide_with_title(prs, "FULL ISI")
+                    self._add_disclaimer_images(slide, [img_path])
+                    self._add_vdx_logo(slide)
+                    slides_created += 1
+                    self.logger.info(f"Added regular height image {img_path} to FULL ISI slide")
+                else:
+                    # Tall image - split into parts based on 1000px height
+                    part_futures = split_parts[img_path]
+                    parts_needed = len(part_futures)
                     
-                    if height <= 1000:
-                        # Regular height image - add to single slide
-                        slide = self._create_slide_with_title(prs, "FULL ISI")
-                        self._add_disclaimer_images(slide, [img_path])
-                        self.image_processor._add_vdx_logo(slide)
-                        slides_created += 1
-                        self.logger.info(f"Added regular height image {img_path} to FULL ISI slide")
-                    else:
-                        # Tall image - split into parts based on 1000px height
-                        max_height_per_part = 1000
-                        parts_needed = (height + max_height_per_part - 1) // max_height_per_part  # Ceiling division
+                    self.logger.info(f"Splitting image {img_path} ({width}x{height}) into {parts_needed} parts of max {max_height_per_part}px each")
+                    
+                    temp_files = []
+                    
+                    for part_num, part_future in enumerate(part_futures):
+                        # Calculate crop coordinates
+                        top = part_num * max_height_per_part
+                        bottom = min(top + max_height_per_part, height)
+                        actual_part_height = bottom - top
                         
-                        self.logger.info(f"Splitting image {img_path} ({width}x{height}) into {parts_needed} parts of max {max_height_per_part}px each")
+                        self.logger.info(f"Part {part_num + 1}: cropping from y={top} to y={bottom} (height={actual_part_height}px)")
                         
-                        temp_files = []
+                        # Wait for the cropped part's temporary file
+                        temp_path = part_future.result()
+                        temp_files.append(temp_path)
                         
-                        for part_num in range(parts_needed):
-                            # Calculate crop coordinates
-                            top = part_num * max_height_per_part
-                            bottom = min(top + max_height_per_part, height)
-                            actual_part_height = bottom - top
-                            
-                            self.logger.info(f"Part {part_num + 1}: cropping from y={top} to y={bottom} (height={actual_part_height}px)")
-                            
-                            # Crop the image part
-                            cropped_img = img.crop((0, top, width, bottom))
-                            
-                            # Save to temporary file
-                            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                            cropped_img.save(temp_file.name, format='PNG')
-                            temp_file.close()
-                            temp_files.append(temp_file.name)
-                            
-                            # Create slide for this part
-                            slide_title = "FULL ISI" if part_num == 0 else f"FULL ISI (CONTD.)"
-                            slide = self._create_slide_with_title(prs, slide_title)
-                            self._add_disclaimer_images(slide, [temp_file.name])
-                            self.image_processor._add_vdx_logo(slide)
-                            slides_created += 1
-                            
-                            self.logger.info(f"Created FULL ISI slide part {part_num + 1}/{parts_needed} for {os.path.basename(img_path)} with {actual_part_height}px height")
+                        # Create slide for this part
+                        slide_title = "FULL ISI" if part_num == 0 else f"FULL ISI (CONTD.)"
+                        slide = self._create_slide_with_title(prs, slide_title)
+                        self._add_disclaimer_images(slide, [temp_path])
+                        self._add_vdx_logo(slide)
+                        slides_created += 1
                         
-                        # Clean up temporary files
-                        for temp_file in temp_files:
-                            try:
-                                os.unlink(temp_file)
-                            except:
-                                pass
+                        self.logger.info(f"Created FULL ISI slide part {part_num + 1}/{parts_needed} for {os.path.basename(img_path)} with {actual_part_height}px height")
+                    
+                    # Clean up temporary files
+                    for temp_file in temp_files:
+                        try:
+                            os.unlink(temp_file)
+                        except:
+                            pass
                                 
             except Exception as e:
                 self.logger.error(f"Error processing disclaimer image {img_path}: {str(e)}")
                 # Fallback - create regular slide
                 slide = self._create_slide_with_title(prs, "FULL ISI")
                 self._add_disclaimer_images(slide, [img_path])
-                self.image_processor._add_vdx_logo(slide)
+                self._add_vdx_logo(slide)
                 slides_created += 1
         
         self.logger.info(f"Created {slides_created} FULL ISI slides (including split parts)")
         return slides_created
     
+    def _split_image_into_parts(self, img_path, max_height_per_part):
+        """Decode a tall image once and encode its horizontal bands on the image thread pool."""
+        from PIL import Image
+        from .media_cache import get_media_cache
+        from .media_encoding import PNG_COMPRESS_LEVEL, encode_png
+        
+        processor = self.image_processor
+        info = processor.image_index.get(img_path)
+        cache = get_media_cache()
+        tops = list(range(0, info.height, max_height_per_part))
+        keys = [cache.make_key(info.content_hash, 'band', {'top': top, 'height': max_height_per_part,
+                                                           'png_level': PNG_COMPRESS_LEVEL})
+                for top in tops] if cache else [None] * len(tops)
+        
+        # Bands already in the media cache skip the decode entirely; the processor tracks the band tasks so a
+        # failed slide does not leave their temp files behind
+        cached = [cache.get(key) if key else None for key in keys]
+        if all(cached):
+            return [processor.submit_temp_task(processor.write_temp_png, data) for data in cached]
+        
+        def encode_band(band, key):
+            data = encode_png(band)
+            if key:
+                cache.put(key, data)
+            return processor.write_temp_png(data)
+        
+        with Image.open(img_path) as img:
+            img.load()
+            bands = [img.crop((0, top, info.width, min(top + max_height_per_part, info.height))) for top in tops]
+        
+        return [processor.submit_temp_task(encode_band, band, key) for band, key in zip(bands, keys)]
+    
     def _create_full_isi_slide(self, prs, disclaimer_files):
         """Create FULL ISI slide with disclaimer images, splitting tall images if needed."""
         # Check if any images need to be split due to height > 1000px
@@ -216,7 +261,7 @@ class SlideCreator:
                 self._add_disclaimer_images(slide, disclaimer_files)
             
             # Add VDX TV logo
-            self.image_processor._add_vdx_logo(slide)
+            self._add_vdx_logo(slide)
             
             return slide
     
@@ -225,7 +270,7 @@ class SlideCreator:
         slide = self._create_slide_with_title(prs, "FULL ISI")
         
         # Add VDX TV logo
-        self.image_processor._add_vdx_logo(slide)
+        self._add_vdx_logo(slide)
         
         self.logger.info("Manual tab: Created blank FULL ISI slide as last slide")
         return slide
@@ -287,6 +332,6 @@ class SlideCreator:
             arrangement_method(slide, teaser_images)
         
         # Add VDX TV logo
-        self.image_processor._add_vdx_logo(slide)
+        self._add_vdx_logo(slide)
         
         return slide
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Prebuilt slide headers and logo for one presentation.
+The first slide of each kind is drawn through python-pptx; later slides get XML copies of its shapes.
+"""
+
+import copy
+import logging
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+
+class SlideSkeleton:
+    """Clones header shapes and the VDX logo into new slides of one presentation.
+
+    Each header kind (gray bar plus title text box) is built once by a callback
+    and captured; later slides of that kind receive deep copies of the captured
+    elements with fresh shape ids and the title text swapped. The logo image part
+    is registered with the package once and only related to each later slide,
+    so the PNG is not re-read and re-hashed per slide.
+    """
+
+    def __init__(self, prs, logger=None):
+        self.prs = prs
+        self.logger = logger or logging.getLogger(__name__)
+        self._headers = {}
+        self._logo = None
+
+    def owns(self, slide):
+        """True when slide belongs to this skeleton's presentation."""
+        return slide.part.package is self.prs.part.package
+
+    def add_slide(self, kind, title_text, build_header, layout_index=5):
+        """Add a slide with no placeholders whose header comes from the skeleton for kind.
+
+        build_header(slide, title_text) draws the header the first time a kind is
+        seen. The title must be the last shape it adds, as a single run.
+        """
+        # Slides.add_slide minus the layout placeholder cloning, since they would be removed again
+        rId, slide = self.prs.part.add_slide(self.prs.slide_layouts[layout_index])
+        self.prs.slides._sldIdLst.add_sldId(rId)
+        sp_tree = slide.shapes._spTree
+
+        template = self._headers.get(kind)
+        if template is None:
+            build_header(slide, title_text)
+            self._headers[kind] = [copy.deepcopy(element) for element in sp_tree.iter_shape_elms()]
+            return slide
+
+        for element in template:
+            self._append_clone(slide, element)
+        slide.shapes[-1].text_frame.paragraphs[0].runs[0].text = title_text
+        return slide
+
+    def add_logo(self, slide, logo_path, left, top, width, height):
+        """Add the logo picture, reusing the image part registered by the first call."""
+        if self._logo is None:
+            picture = slide.shapes.add_picture(logo_path, left, top, width, height)
+            image_part = slide.part.related_part(picture._element.blip_rId)
+            self._logo = (image_part, copy.deepcopy(picture._element))
+            return
+
+        image_part, template = self._logo
+        clone = self._append_clone(slide, template)
+        clone.blipFill.blip.rEmbed = slide.part.relate_to(image_part, RT.IMAGE)
+
+    @staticmethod
+    def _append_clone(slide, element):
+        shapes = slide.shapes
+        clone = copy.deepcopy(element)
+        shape_id = shapes._next_shape_id
+        c_nv_pr = clone.xpath('./*[1]/p:cNvPr')[0]
+        # python-pptx names new shapes "<kind> <id - 1>"; keep that convention for the copy
+        kind = c_nv_pr.get('name').rsplit(' ', 1)[0]
+        c_nv_pr.set('id', str(shape_id))
+        c_nv_pr.set('name', f"{kind} {shape_id - 1}")
+        shapes._spTree.insert_element_before(clone, 'p:extLst')
+        return clone
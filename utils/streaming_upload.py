@@ -0,0 +1,116 @@
+"""
+Streaming upload helpers that write request bodies to disk in fixed-size chunks.
+Each write updates a SHA-256 digest and byte count so uploads are hashed as they land.
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+from typing import Optional, Dict, Any, BinaryIO
+from flask import Request, current_app
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class HashingFile:
+    """Temp file in the destination directory that hashes everything written to it.
+
+    ``commit`` renames the file into place, so a finished upload is never copied
+    a second time. An uncommitted file is removed when it is closed.
+    """
+
+    def __init__(self, directory: str, prefix: str = '.upload-'):
+        os.makedirs(directory, exist_ok=True)
+        fd, self.temp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix='.part')
+        self._file = os.fdopen(fd, 'w+b')
+        self._hash = hashlib.sha256()
+        self.size = 0
+        self.committed_path = None
+
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        self.size += len(data)
+        return self._file.write(data)
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    def commit(self, dest_path: str) -> Dict[str, Any]:
+        """Move the written data to dest_path and return its size and hash."""
+        self._file.close()
+        # mkstemp creates 0600 files; give uploads the usual permissions
+        os.chmod(self.temp_path, 0o644)
+        os.replace(self.temp_path, dest_path)
+        self.committed_path = dest_path
+        logger.info(f"Committed upload {dest_path} ({self.size} bytes, sha256 {self.sha256[:12]})")
+        return {'local_path': dest_path, 'size': self.size, 'sha256': self.sha256}
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+        if self.committed_path is None and os.path.exists(self.temp_path):
+            try:
+                os.remove(self.temp_path)
+            except OSError as e:
+                logger.warning(f"Could not remove partial upload {self.temp_path}: {str(e)}")
+
+    def __getattr__(self, name):
+        # read/seek/readline etc. go straight to the underlying file
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_stream(stream: BinaryIO, dest_path: str, chunk_size: int = CHUNK_SIZE,
+                 max_size: Optional[int] = None) -> Dict[str, Any]:
+    """Copy a stream to dest_path chunk by chunk, hashing on the fly.
+
+    Raises ValueError, leaving nothing at dest_path, once more than max_size bytes arrive.
+    """
+    with HashingFile(os.path.dirname(dest_path)) as target:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            target.write(chunk)
+            if max_size is not None and target.size > max_size:
+                raise ValueError(f"Upload exceeds {max_size} bytes")
+        return target.commit(dest_path)
+
+
+def hash_file(path: str, chunk_size: int = CHUNK_SIZE) -> str:
+    """SHA-256 of a file on disk, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StreamingUploadRequest(Request):
+    """Request class that spools multipart file parts straight into the upload folder."""
+
+    def _get_file_stream(self, total_content_length: Optional[int], content_type: Optional[str],
+                         filename: Optional[str] = None, content_length: Optional[int] = None):
+        upload_dir = current_app.config.get('UPLOAD_FOLDER')
+        if not upload_dir:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        return HashingFile(upload_dir)
+
+
+def save_file_storage(file, dest_path: str) -> Dict[str, Any]:
+    """Persist a parsed upload, renaming the spooled file when possible instead of copying."""
+    if isinstance(file.stream, HashingFile):
+        return file.stream.commit(dest_path)
+
+    # Fallback for streams not created by StreamingUploadRequest
+    file.stream.seek(0)
+    return write_stream(file.stream, dest_path)
@@ -0,0 +1,112 @@
+"""
+Low-resolution slide thumbnails for the result page.
+Rendered in the background once per deck and cached by the deck's content hash, so previews never need the PPTX or a PDF.
+"""
+
+import io
+import os
+import logging
+import threading
+from typing import List, Optional
+
+from .media_cache import MediaCache
+from .pdf_cache import deck_hash
+
+logger = logging.getLogger(__name__)
+
+_thumbnail_cache = None
+_thumbnail_cache_lock = threading.Lock()
+
+THUMBNAIL_QUALITY = 80
+
+
+def get_thumbnail_cache() -> Optional[MediaCache]:
+    """Return the process-wide thumbnail cache, or None when THUMBNAIL_CACHE_MAX_MB is 0."""
+    global _thumbnail_cache
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is None:
+            try:
+                max_mb = int(os.environ.get('THUMBNAIL_CACHE_MAX_MB', 256))
+            except ValueError:
+                max_mb = 256
+            if max_mb <= 0:
+                return None
+            cache_dir = os.environ.get('THUMBNAIL_CACHE_DIR') or os.path.join(os.getcwd(), 'outputs', '.cache', 'thumbnails')
+            _thumbnail_cache = MediaCache(cache_dir, max_mb * 1024 * 1024)
+        return _thumbnail_cache
+
+
+def thumbnail_width() -> int:
+    """Thumbnail width in pixels, from THUMBNAIL_WIDTH."""
+    try:
+        width = int(os.environ.get('THUMBNAIL_WIDTH', 320))
+    except ValueError:
+        width = 320
+    return max(width, 16)
+
+
+def thumbnail_key(content_hash: str, slide_number: int) -> str:
+    """Cache key for one slide's thumbnail; changes whenever the rasterizer or the thumbnail size does."""
+    from .pdf_converter import PDF_RENDERER_VERSION
+
+    params = {'slide': slide_number, 'width': thumbnail_width(), 'renderer': PDF_RENDERER_VERSION}
+    return MediaCache.make_key(content_hash, 'thumbnail', params)
+
+
+def cached_thumbnail_path(pptx_path: str, slide_number: int) -> Optional[str]:
+    """Path of the cached thumbnail for a slide (numbered from 1), or None on a miss."""
+    cache = get_thumbnail_cache()
+    if cache is None:
+        return None
+    return cache.get_path(thumbnail_key(deck_hash(pptx_path), slide_number))
+
+
+def missing_thumbnails(pptx_path: str) -> List[int]:
+    """Numbers of the slides of a deck that have no cached thumbnail yet."""
+    from .pdf_converter import read_slide_geometry
+
+    cache = get_thumbnail_cache()
+    if cache is None:
+        return []
+    content_hash = deck_hash(pptx_path)
+    slide_count = read_slide_geometry(pptx_path)[2]
+    return [n for n in range(1, slide_count + 1) if cache.get_path(thumbnail_key(content_hash, n)) is None]
+
+
+def render_deck_thumbnails(pptx_path: str) -> int:
+    """Pool task: rasterize every slide of a deck not yet in the thumbnail cache; returns the number rendered."""
+    from PIL import Image
+    from pptx import Presentation
+    from .pdf_converter import PDF_RENDER_DPI, DecodedImageCache, BackgroundLayerCache, convert_slide_to_image
+
+    cache = get_thumbnail_cache()
+    if cache is None:
+        return 0
+
+    missing = missing_thumbnails(pptx_path)
+    if not missing:
+        return 0
+
+    prs = Presentation(pptx_path)
+    slides = list(prs.slides)
+    image_cache = DecodedImageCache()
+    background_cache = BackgroundLayerCache(slides)
+    content_hash = deck_hash(pptx_path)
+    size = (thumbnail_width(), max(1, round(thumbnail_width() * prs.slide_height / prs.slide_width)))
+
+    rendered = 0
+    for slide_number in missing:
+        # Drawn as for the PDF and scaled down, so text without an explicit size keeps the PDF's proportions
+        img = convert_slide_to_image(slides[slide_number - 1], prs.slide_width, prs.slide_height, PDF_RENDER_DPI,
+                                     image_cache, background_cache)
+        if img is None:
+            logger.warning(f"Could not render thumbnail for slide {slide_number} of {os.path.basename(pptx_path)}")
+            continue
+        img = img.resize(size, Image.LANCZOS, reducing_gap=3.0)
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=THUMBNAIL_QUALITY, optimize=True)
+        cache.put(thumbnail_key(content_hash, slide_number), buffer.getvalue())
+        rendered += 1
+
+    logger.info(f"Rendered {rendered} thumbnails for {os.path.basename(pptx_path)}")
+    return rendered
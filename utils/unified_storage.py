@@ -1,17 +1,24 @@
 import os
+import re
+import time
+import shutil
 import logging
 import tempfile
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from werkzeug.utils import secure_filename
 
 logger = logging.getLogger(__name__)
 
+UPLOAD_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{8,64}$')
+STALE_CHUNK_SECONDS = 24 * 60 * 60
+
 class UnifiedStorage:
     """Simplified storage system that only uses local file storage for VPS deployment."""
     
     def __init__(self):
         self.local_upload_dir = os.path.join(os.getcwd(), 'uploads')
         self.local_output_dir = os.path.join(os.getcwd(), 'outputs')
+        self.local_chunk_dir = os.path.join(self.local_upload_dir, '.chunks')
         
         # Ensure local directories exist
         os.makedirs(self.local_upload_dir, exist_ok=True)
@@ -48,18 +55,144 @@ class UnifiedStorage:
             logger.error(f"Error saving file locally: {str(e)}")
             return None
     
-    async def download_file(self, file_identifier: str) -> Optional[bytes]:
-        """Download file from local filesystem."""
+    def save_stream(self, stream, filename: str) -> Optional[Dict[str, Any]]:
+        """Stream an upload to the local filesystem in chunks, hashing it as it is written."""
+        filename = secure_filename(filename)
+        
+        try:
+            from utils.streaming_upload import write_stream
+            local_path = os.path.join(self.local_upload_dir, filename)
+            written = write_stream(stream, local_path)
+            
+            logger.info(f"File streamed locally: {local_path} ({written['size']} bytes)")
+            return {
+                'url': f'/local-file/{filename}',
+                'local_path': local_path,
+                'filename': filename,
+                'size': written['size'],
+                'sha256': written['sha256'],
+                'storage_type': 'local'
+            }
+        except Exception as e:
+            logger.error(f"Error streaming file locally: {str(e)}")
+            return None
+    
+    def _chunk_session_dir(self, upload_id: str) -> str:
+        if not UPLOAD_ID_PATTERN.match(upload_id or ''):
+            raise ValueError(f"Invalid upload ID: {upload_id}")
+        return os.path.join(self.local_chunk_dir, upload_id)
+    
+    def save_chunk(self, upload_id: str, index: int, stream, max_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Store one numbered chunk of a resumable upload.
+        
+        Raises ValueError when the chunk would take the upload's stored chunks past max_size bytes.
+        """
+        try:
+            from utils.streaming_upload import write_stream
+            session_dir = self._chunk_session_dir(upload_id)
+            if not os.path.isdir(session_dir):
+                self._purge_stale_chunks()
+                os.makedirs(session_dir, exist_ok=True)
+            
+            # Bound the whole upload as it arrives, not only when the chunks are assembled
+            remaining = None
+            if max_size:
+                remaining = max_size - self._stored_chunk_bytes(session_dir, exclude=index)
+                if remaining < 0:
+                    raise ValueError(f"Upload exceeds {max_size} bytes")
+            
+            # Chunks are committed by rename, so a retried chunk simply replaces the old one
+            written = write_stream(stream, os.path.join(session_dir, f"{index}.part"), max_size=remaining)
+            
+            logger.info(f"Stored chunk {index} of upload {upload_id} ({written['size']} bytes)")
+            return {'upload_id': upload_id, 'chunk': index, 'size': written['size'], 'sha256': written['sha256']}
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error storing chunk {index} of upload {upload_id}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _stored_chunk_bytes(session_dir: str, exclude: Optional[int] = None) -> int:
+        """Bytes held by the committed chunks of an upload, except chunk number exclude."""
+        total = 0
+        for name in os.listdir(session_dir):
+            if name.endswith('.part') and name[:-5].isdigit() and int(name[:-5]) != exclude:
+                try:
+                    total += os.path.getsize(os.path.join(session_dir, name))
+                except OSError:
+                    pass
+        return total
+    
+    def list_chunks(self, upload_id: str) -> List[int]:
+        """Return the chunk numbers received so far for a resumable upload."""
+        session_dir = self._chunk_session_dir(upload_id)
+        if not os.path.isdir(session_dir):
+            return []
+        return sorted(int(name[:-5]) for name in os.listdir(session_dir)
+                      if name.endswith('.part') and name[:-5].isdigit())
+    
+    def assemble_chunks(self, upload_id: str, total_chunks: int, filename: str, max_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Concatenate all chunks of an upload into the uploads directory, hashing as it goes."""
+        from utils.streaming_upload import HashingFile, CHUNK_SIZE
+        filename = secure_filename(filename)
+        session_dir = self._chunk_session_dir(upload_id)
+        local_path = os.path.join(self.local_upload_dir, filename)
+        
+        with HashingFile(self.local_upload_dir) as target:
+            for index in range(total_chunks):
+                with open(os.path.join(session_dir, f"{index}.part"), 'rb') as chunk:
+                    shutil.copyfileobj(chunk, target, CHUNK_SIZE)
+                if max_size and target.size > max_size:
+                    raise ValueError(f"Assembled upload exceeds {max_size} bytes")
+            written = target.commit(local_path)
+        
+        shutil.rmtree(session_dir, ignore_errors=True)
+        logger.info(f"Assembled {total_chunks} chunks of upload {upload_id} into {local_path}")
+        return {
+            'url': f'/local-file/{filename}',
+            'local_path': local_path,
+            'filename': filename,
+            'size': written['size'],
+            'sha256': written['sha256'],
+            'storage_type': 'local'
+        }
+    
+    def _purge_stale_chunks(self):
+        """Remove chunk sessions that were abandoned long ago."""
+        if not os.path.isdir(self.local_chunk_dir):
+            return
+        cutoff = time.time() - STALE_CHUNK_SECONDS
+        for name in os.listdir(self.local_chunk_dir):
+            path = os.path.join(self.local_chunk_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+                    logger.info(f"Removed stale upload chunks: {name}")
+            except OSError:
+                pass
+    
+    def _resolve_upload_path(self, file_identifier: str) -> str:
+        """Map a storage identifier to its path on the local filesystem."""
         # Check if it's a local file path or filename
         if file_identifier.startswith('/local-file/'):
             filename = file_identifier.replace('/local-file/', '')
-            local_path = os.path.join(self.local_upload_dir, filename)
+            return os.path.join(self.local_upload_dir, filename)
         elif file_identifier.startswith('/'):
             # Absolute path
-            local_path = file_identifier
+            return file_identifier
         else:
             # Assume it's a filename in uploads directory
-            local_path = os.path.join(self.local_upload_dir, file_identifier)
+            return os.path.join(self.local_upload_dir, file_identifier)
+    
+    def get_upload_file_path(self, file_identifier: str) -> Optional[str]:
+        """Get the path to a stored upload so it can be read in place."""
+        local_path = self._resolve_upload_path(file_identifier)
+        return local_path if os.path.isfile(local_path) else None
+    
+    async def download_file(self, file_identifier: str) -> Optional[bytes]:
+        """Download file from local filesystem."""
+        local_path = self._resolve_upload_path(file_identifier)
         
         try:
             if os.path.exists(local_path):
@@ -0,0 +1,164 @@
+"""
+Process pool for CPU-bound deck generation and PDF conversion.
+Keeps PresentationGenerator and Pillow work out of the web worker processes.
+"""
+
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# Thumbnail renders in flight, by deck content hash, so a deck is never rendered twice at once
+_thumbnail_jobs = {}
+
+
+def get_pool_size() -> int:
+    """Number of generation processes per web worker, from GENERATION_WORKERS.
+
+    Every web worker owns a pool, so the default shares the CPUs between the
+    WEB_CONCURRENCY web workers instead of giving each of them all of them.
+    """
+    try:
+        size = int(os.environ.get('GENERATION_WORKERS', 0))
+    except ValueError:
+        logger.warning(f"Invalid GENERATION_WORKERS value: {os.environ.get('GENERATION_WORKERS')}")
+        size = 0
+    if size > 0:
+        return size
+    try:
+        web_workers = max(1, int(os.environ.get('WEB_CONCURRENCY', 1)))
+    except ValueError:
+        web_workers = 1
+    return max(1, (os.cpu_count() or 1) // web_workers)
+
+
+def _init_worker():
+    """Configure logging in a freshly spawned generation process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger.info(f"Generation worker {os.getpid()} started")
+
+
+def get_generation_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            size = get_pool_size()
+            # Spawn rather than fork: the web process runs job threads, and forking with locks held is unsafe
+            _pool = ProcessPoolExecutor(
+                max_workers=size,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker
+            )
+            logger.info(f"Generation pool started with {size} worker processes")
+        return _pool
+
+
+def _reset_pool(broken_pool: ProcessPoolExecutor):
+    """Drop a pool whose worker died so the next task starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is broken_pool:
+            _pool = None
+    broken_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_in_pool(func: Callable, *args, **kwargs):
+    """Run a module-level function in the generation pool and wait for its result."""
+    pool = get_generation_pool()
+    try:
+        return pool.submit(func, *args, **kwargs).result()
+    except BrokenProcessPool:
+        logger.error(f"Generation worker crashed while running {func.__name__}, restarting pool")
+        _reset_pool(pool)
+        raise
+
+
+def shutdown_pool():
+    """Stop the generation pool, waiting for running tasks."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def generate_presentation(temp_dir: str, annotation_option: str = 'with_annos', implement_video_frames: bool = False,
+                          video_position_params: Optional[Dict[str, Any]] = None, original_filename: Optional[str] = None):
+    """Pool task: build a deck from an extracted folder and return (PPTX path, DeckStats)."""
+    from utils.presentation_generator import PresentationGenerator
+
+    generator = PresentationGenerator()
+    return generator.generate_from_folder(
+        temp_dir,
+        annotation_option=annotation_option,
+        implement_video_frames=implement_video_frames,
+        video_position_params=video_position_params,
+        original_filename=original_filename
+    )
+
+
+def convert_pptx_to_pdf(input_path: str, output_dir: str) -> Optional[str]:
+    """Render a PPTX to PDF with slide rasterization fanned out over the generation pool; returns the PDF path."""
+    from utils.pdf_converter import convert_pptx_to_pdf_serverless
+
+    pool = get_generation_pool()
+    try:
+        return convert_pptx_to_pdf_serverless(input_path, output_dir, executor=pool, workers=get_pool_size())
+    except BrokenProcessPool:
+        logger.error("Generation worker crashed while rendering PDF pages, restarting pool")
+        _reset_pool(pool)
+        raise
+
+
+def stream_pptx_to_pdf(input_path: str) -> Iterator[bytes]:
+    """Yield a PPTX's rasterized PDF piece by piece as the generation pool renders its pages."""
+    from utils.pdf_converter import stream_pptx_to_pdf as stream_pages
+
+    pool = get_generation_pool()
+    try:
+        yield from stream_pages(input_path, executor=pool, workers=get_pool_size())
+    except BrokenProcessPool:
+        logger.error("Generation worker crashed while streaming PDF pages, restarting pool")
+        _reset_pool(pool)
+        raise
+
+
+def render_thumbnails(pptx_path: str) -> Future:
+    """Start rendering a deck's thumbnails on the generation pool, or return the render of the same deck already running."""
+    from utils.pdf_cache import deck_hash
+    from utils.thumbnails import render_deck_thumbnails
+
+    content_hash = deck_hash(pptx_path)
+    pool = get_generation_pool()
+    with _pool_lock:
+        future = _thumbnail_jobs.get(content_hash)
+        if future is None:
+            future = pool.submit(render_deck_thumbnails, pptx_path)
+            _thumbnail_jobs[content_hash] = future
+        else:
+            return future
+
+    def finished(done: Future):
+        with _pool_lock:
+            _thumbnail_jobs.pop(content_hash, None)
+        error = done.exception() if not done.cancelled() else None
+        if isinstance(error, BrokenProcessPool):
+            logger.error("Generation worker crashed while rendering thumbnails, restarting pool")
+            _reset_pool(pool)
+        elif error is not None:
+            logger.error(f"Error rendering thumbnails for {pptx_path}: {str(error)}")
+
+    future.add_done_callback(finished)
+    return future